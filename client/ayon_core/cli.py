@@ -113,13 +113,21 @@ def extractenvironments(output_json_path, project, asset, task, app, envgroup):
               multiple=True)
 @click.option("-g", "--gui", is_flag=True,
               help="Show Publish UI", default=False)
-def publish(path, targets, gui):
+@click.option("--profile", default=None,
+              help="Export publish timeline to Chrome trace JSON file")
+@click.option("--workers", type=int, default=1,
+              help=(
+                  "Number of workers processing thread safe plugins"
+                  " concurrently. Plugins are processed sequentially"
+                  " by default."
+              ))
+def publish(path, targets, gui, profile, workers):
     """Start CLI publishing.
 
     Publish collects json from path provided as an argument.
 S
     """
-    Commands.publish(path, targets, gui)
+    Commands.publish(path, targets, gui, profile, workers)
 
 
 @main_cli.command(context_settings={"ignore_unknown_options": True})
@@ -41,7 +41,13 @@ class Commands:
         return click_func
 
     @staticmethod
-    def publish(path: str, targets: list=None, gui:bool=False) -> None:
+    def publish(
+        path: str,
+        targets: list=None,
+        gui:bool=False,
+        profile_path: str=None,
+        workers: int=1,
+    ) -> None:
         """Start headless publishing.
 
         Publish use json from passed path argument.
@@ -50,6 +56,12 @@ class Commands:
             path (str): Path to JSON.
             targets (list of str): List of pyblish targets.
             gui (bool): Show publish UI.
+            profile_path (str): Path to JSON file where publish timeline
+                is exported in Chrome trace format. Profiling is disabled
+                if not set.
+            workers (int): Number of workers processing thread safe
+                plugins concurrently. Plugins are processed sequentially
+                if lower than 2.
 
         Raises:
             RuntimeError: When there is no path to process.
@@ -130,15 +142,43 @@ class Commands:
             with qt_app_context():
                 show_publish()
         else:
+            from ayon_core.pipeline.publish import (
+                concurrent_publish_iter,
+                start_publish_profiling,
+                stop_publish_profiling,
+            )
+
+            profiler = None
+            if profile_path:
+                profiler = start_publish_profiling()
+
             # Error exit as soon as any error occurs.
             error_format = ("Failed {plugin.__name__}: "
                             "{error} -- {error.traceback}")
 
-            for result in pyblish.util.publish_iter():
-                if result["error"]:
-                    log.error(error_format.format(**result))
-                    # uninstall()
-                    sys.exit(1)
+            try:
+                for result in concurrent_publish_iter(
+                    max_workers=max(1, workers)
+                ):
+                    if profiler is not None:
+                        profiler.add_result(
+                            result, result.get("subprocesses")
+                        )
+
+                    if result["error"]:
+                        log.error(error_format.format(**result))
+                        # uninstall()
+                        sys.exit(1)
+
+            finally:
+                if profiler is not None:
+                    stop_publish_profiling()
+                    profiler.export_chrome_trace(profile_path)
+                    log.info(
+                        "Publish timeline exported to: {}".format(
+                            profile_path
+                        )
+                    )
 
         log.info("Publish finished.")
 
@@ -74,6 +74,8 @@ from .execute import (
     get_linux_launcher_args,
     execute,
     run_subprocess,
+    pop_subprocess_stats,
+    collect_subprocess_stats,
     run_detached_process,
     run_ayon_launcher_process,
     run_openpype_process,
@@ -111,6 +113,8 @@ from .profiles_filtering import (
 )
 
 from .transcoding import (
+    MediaInfoCache,
+    get_media_info_cache,
     get_transcode_temp_directory,
     should_convert_for_ffmpeg,
     convert_for_ffmpeg,
@@ -133,6 +137,9 @@ from .path_tools import (
     format_file_size,
     collect_frames,
     create_hard_link,
+    copy_file,
+    get_copy_file_stats,
+    reset_copy_file_stats,
     version_up,
     get_version_from_path,
     get_last_version_from_path,
@@ -173,6 +180,8 @@ __all__ = [
     "get_linux_launcher_args",
     "execute",
     "run_subprocess",
+    "pop_subprocess_stats",
+    "collect_subprocess_stats",
     "run_detached_process",
     "run_ayon_launcher_process",
     "run_openpype_process",
@@ -211,6 +220,8 @@ __all__ = [
     "import_module_from_dirpath",
     "is_func_signature_supported",
 
+    "MediaInfoCache",
+    "get_media_info_cache",
     "get_transcode_temp_directory",
     "should_convert_for_ffmpeg",
     "convert_for_ffmpeg",
@@ -233,6 +244,9 @@ __all__ = [
     "format_file_size",
     "collect_frames",
     "create_hard_link",
+    "copy_file",
+    "get_copy_file_stats",
+    "reset_copy_file_stats",
     "version_up",
     "get_version_from_path",
     "get_last_version_from_path",
@@ -296,6 +296,16 @@ class EventCallback(object):
 
     order = property(get_order, set_order)
 
+    @property
+    def topic(self):
+        """Topic to which callback is registered.
+
+        Returns:
+            str: Callback topic.
+        """
+
+        return self._topic
+
     def topic_matches(self, topic):
         """Check if event topic matches callback's topic.
 
@@ -501,9 +511,17 @@ class EventSystem(object):
     """
 
     default_order = 100
+    # Maximum number of topics with cached matching callbacks
+    topic_cache_limit = 1000
 
     def __init__(self):
         self._registered_callbacks = []
+        # Callbacks registered to topics without wildcard by topic
+        self._callbacks_by_topic = collections.defaultdict(list)
+        # Callbacks registered to topics with wildcard
+        self._wildcard_callbacks = []
+        # Callbacks matching an event topic by the topic
+        self._callbacks_by_event_topic = {}
 
     def add_callback(self, topic, callback, order=None):
         """Register callback in event system.
@@ -525,6 +543,11 @@ class EventSystem(object):
 
         callback = EventCallback(topic, callback, order)
         self._registered_callbacks.append(callback)
+        if "*" in topic:
+            self._wildcard_callbacks.append(callback)
+        else:
+            self._callbacks_by_topic[topic].append(callback)
+        self._callbacks_by_event_topic.clear()
         return callback
 
     def create_event(self, topic, data, source):
@@ -575,13 +598,77 @@ class EventSystem(object):
             event (Event): Prepared event with topic and data.
         """
 
+        # Callbacks are sorted on each event because order of callback
+        #   can be changed after registration
         callbacks = tuple(sorted(
-            self._registered_callbacks, key=lambda x: x.order
+            self._get_topic_callbacks(event.topic), key=lambda x: x.order
         ))
         for callback in callbacks:
             callback.process_event(event)
             if not callback.is_ref_valid:
-                self._registered_callbacks.remove(callback)
+                self._remove_callback(callback)
+
+    def _get_topic_callbacks(self, topic):
+        """Callbacks that should be triggered for an event topic.
+
+        Matching callbacks are cached by topic so topic of each callback
+        is not validated on every event.
+
+        Args:
+            topic (str): Event topic.
+
+        Returns:
+            list[EventCallback]: Callbacks matching the topic in order of
+                registration.
+        """
+
+        callbacks = self._callbacks_by_event_topic.get(topic)
+        if callbacks is not None:
+            return callbacks
+
+        callbacks = list(self._callbacks_by_topic.get(topic, []))
+        wildcard_callbacks = [
+            callback
+            for callback in self._wildcard_callbacks
+            if callback.topic_matches(topic)
+        ]
+        if wildcard_callbacks:
+            # Keep order of registration
+            matching = set(callbacks)
+            matching.update(wildcard_callbacks)
+            callbacks = [
+                callback
+                for callback in self._registered_callbacks
+                if callback in matching
+            ]
+
+        if len(self._callbacks_by_event_topic) >= self.topic_cache_limit:
+            self._callbacks_by_event_topic.clear()
+        self._callbacks_by_event_topic[topic] = callbacks
+        return callbacks
+
+    def _remove_callback(self, callback):
+        """Remove callback from registered callbacks.
+
+        Args:
+            callback (EventCallback): Callback to remove.
+        """
+
+        if callback not in self._registered_callbacks:
+            return
+        self._registered_callbacks.remove(callback)
+        topic = callback.topic
+        if "*" in topic:
+            self._wildcard_callbacks.remove(callback)
+        else:
+            topic_callbacks = self._callbacks_by_topic[topic]
+            topic_callbacks.remove(callback)
+            if not topic_callbacks:
+                self._callbacks_by_topic.pop(topic)
+
+        for topic_callbacks in self._callbacks_by_event_topic.values():
+            if callback in topic_callbacks:
+                topic_callbacks.remove(callback)
 
 
 class QueuedEventSystem(EventSystem):
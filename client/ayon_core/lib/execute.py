@@ -1,9 +1,15 @@
 import os
+import re
 import sys
+import time
 import subprocess
 import platform
 import json
 import tempfile
+import threading
+import contextlib
+import contextvars
+import collections
 
 from .log import Logger
 from .vendor_bin_utils import find_executable
@@ -11,6 +17,23 @@ from .vendor_bin_utils import find_executable
 # MSDN process creation flag (Windows only)
 CREATE_NO_WINDOW = 0x08000000
 
+# Default number of output lines kept in memory when output is streamed
+STREAM_OUTPUT_MAX_LINES = 10000
+# Size of chunks read from output of streamed process
+_STREAM_CHUNK_SIZE = 64 * 1024
+_LINE_SEPARATOR_REGEX = re.compile(b"(\r\n|\r|\n)")
+# Minimum interval of logged progress updates (lines ended by carriage
+#   return) in seconds
+_PROGRESS_LOG_INTERVAL = 10.0
+
+# Resource usage of finished subprocesses
+_SUBPROCESS_STATS = collections.deque(maxlen=1000)
+_SUBPROCESS_STATS_LOCK = threading.Lock()
+# Stats of subprocesses are stored to collector of current context if set
+_SUBPROCESS_STATS_COLLECTOR = contextvars.ContextVar(
+    "subprocess_stats_collector", default=None
+)
+
 
 def execute(args, silent=False, cwd=None, env=None, shell=None):
     """Execute command as process.
@@ -72,18 +95,26 @@ def execute(args, silent=False, cwd=None, env=None, shell=None):
 def run_subprocess(*args, **kwargs):
     """Convenience method for getting output errors for subprocess.
 
-    Output logged when process finish.
+    Output logged when process finish, or line by line while process is
+    running if 'stream_output' is enabled.
 
     Entered arguments and keyword arguments are passed to subprocess Popen.
 
     On windows are 'creationflags' filled with flags that should cause ignore
     creation of new window.
 
+    Wall time of each process is stored and can be received with
+    'pop_subprocess_stats', or 'collect_subprocess_stats'. When output
+    is streamed on POSIX are stored also CPU time and peak memory usage
+    of the process.
+
     Args:
         *args: Variable length argument list passed to Popen.
         **kwargs : Arbitrary keyword arguments passed to Popen. Is possible to
             pass `logging.Logger` object under "logger" to use custom logger
-            for output.
+            for output. Output is logged while process is running if
+            "stream_output" is set to True, then only last
+            "max_output_lines" lines are kept in memory.
 
     Returns:
         str: Full output of subprocess concatenated stdout and stderr.
@@ -119,28 +150,48 @@ def run_subprocess(*args, **kwargs):
     if logger is None:
         logger = Logger.get_logger("run_subprocess")
 
+    stream_output = kwargs.pop("stream_output", False)
+    max_output_lines = kwargs.pop("max_output_lines", None)
+    if not max_output_lines:
+        max_output_lines = STREAM_OUTPUT_MAX_LINES
+
     # set overrides
     kwargs["stdout"] = kwargs.get("stdout", subprocess.PIPE)
     kwargs["stderr"] = kwargs.get("stderr", subprocess.PIPE)
     kwargs["stdin"] = kwargs.get("stdin", subprocess.PIPE)
     kwargs["env"] = filtered_env
 
+    start_time = time.time()
     proc = subprocess.Popen(*args, **kwargs)
 
+    rusage = None
+    if stream_output:
+        _stdout, _stderr, rusage = _stream_process_output(
+            proc, logger, max_output_lines
+        )
+    else:
+        _stdout, _stderr = proc.communicate()
+        if _stdout:
+            _stdout = _stdout.decode("utf-8", errors="backslashreplace")
+            logger.debug(_stdout)
+
+        if _stderr:
+            _stderr = _stderr.decode("utf-8", errors="backslashreplace")
+            logger.info(_stderr)
+
+    _store_subprocess_stats(
+        args, proc.returncode, time.time() - start_time, rusage
+    )
+
     full_output = ""
-    _stdout, _stderr = proc.communicate()
     if _stdout:
-        _stdout = _stdout.decode("utf-8", errors="backslashreplace")
         full_output += _stdout
-        logger.debug(_stdout)
 
     if _stderr:
-        _stderr = _stderr.decode("utf-8", errors="backslashreplace")
         # Add additional line break if output already contains stdout
         if full_output:
             full_output += "\n"
         full_output += _stderr
-        logger.info(_stderr)
 
     if proc.returncode != 0:
         exc_msg = "Executing arguments was not successful: \"{}\"".format(args)
@@ -155,6 +206,193 @@ def run_subprocess(*args, **kwargs):
     return full_output
 
 
+def pop_subprocess_stats():
+    """Resource usage of subprocesses finished since last call.
+
+    Each item contains 'args', 'returncode', 'wall_time' in seconds,
+    'cpu_time' in seconds and 'max_rss' in bytes. CPU time and memory
+    are None if were not measured.
+
+    Returns:
+        list[dict[str, Any]]: Resource usage of finished subprocesses.
+    """
+    with _SUBPROCESS_STATS_LOCK:
+        output = list(_SUBPROCESS_STATS)
+        _SUBPROCESS_STATS.clear()
+    return output
+
+
+@contextlib.contextmanager
+def collect_subprocess_stats():
+    """Collect resource usage of subprocesses launched in current context.
+
+    Stats of subprocesses launched in the context are not available with
+    'pop_subprocess_stats'. Can be used to get stats of subprocesses
+    launched by a thread when multiple threads are launching subprocesses.
+
+    Example:
+        ```python
+        with collect_subprocess_stats() as subprocesses:
+            run_subprocess(["ffmpeg", ...])
+        print(subprocesses)
+        ```
+
+    Yields:
+        list[dict[str, Any]]: Resource usage of finished subprocesses,
+            filled when the subprocesses finish.
+    """
+    stats = []
+    token = _SUBPROCESS_STATS_COLLECTOR.set(stats)
+    try:
+        yield stats
+    finally:
+        _SUBPROCESS_STATS_COLLECTOR.reset(token)
+
+
+def _store_subprocess_stats(args, returncode, wall_time, rusage):
+    cpu_time = max_rss = None
+    if rusage is not None:
+        cpu_time = rusage.ru_utime + rusage.ru_stime
+        # Linux reports kilobytes, macOS bytes
+        max_rss = rusage.ru_maxrss
+        if sys.platform != "darwin":
+            max_rss *= 1024
+
+    if len(args) == 1:
+        args = args[0]
+    if not isinstance(args, str):
+        args = subprocess.list2cmdline([str(arg) for arg in args])
+
+    item = {
+        "args": args,
+        "returncode": returncode,
+        "wall_time": wall_time,
+        "cpu_time": cpu_time,
+        "max_rss": max_rss,
+        "end_time": time.time(),
+    }
+    collector = _SUBPROCESS_STATS_COLLECTOR.get()
+    if collector is not None:
+        collector.append(item)
+        return
+
+    with _SUBPROCESS_STATS_LOCK:
+        _SUBPROCESS_STATS.append(item)
+
+
+def _read_output_stream(stream, log_func, lines):
+    """Log lines of output stream as they arrive.
+
+    Lines ended by carriage return are progress updates of tools like
+    ffmpeg. Only last update is logged, or an update once per
+    '_PROGRESS_LOG_INTERVAL' seconds while the tool is running.
+    """
+    def _log_line(part):
+        line = part.decode("utf-8", errors="backslashreplace")
+        lines.append(line)
+        log_func(line)
+
+    remainder = b""
+    progress = None
+    last_progress_time = time.time()
+    while True:
+        chunk = stream.read1(_STREAM_CHUNK_SIZE)
+        if not chunk:
+            break
+        data = remainder + chunk
+        # Carriage return can be followed by new line in next chunk
+        tail = b""
+        if data.endswith(b"\r"):
+            data, tail = data[:-1], b"\r"
+        parts = _LINE_SEPARATOR_REGEX.split(data)
+        remainder = parts.pop(-1) + tail
+        # Don't keep unlimited data without line separator
+        if len(remainder) > _STREAM_CHUNK_SIZE:
+            parts.extend((remainder, b"\n"))
+            remainder = b""
+
+        for part, separator in zip(parts[0::2], parts[1::2]):
+            if separator != b"\r":
+                # Line replaces pending progress update
+                progress = None
+                _log_line(part)
+                continue
+
+            progress = part
+            current_time = time.time()
+            if current_time - last_progress_time >= _PROGRESS_LOG_INTERVAL:
+                last_progress_time = current_time
+                progress = None
+                _log_line(part)
+
+    remainder = remainder.rstrip(b"\r")
+    if remainder:
+        _log_line(remainder)
+    elif progress:
+        _log_line(progress)
+    stream.close()
+
+
+def _stream_process_output(proc, logger, max_output_lines):
+    """Log output of process while running and wait for it to finish.
+
+    Returns:
+        tuple[Optional[str], Optional[str], Optional[Any]]: Last lines of
+            stdout, stderr and resource usage of process if available.
+    """
+    if proc.stdin is not None:
+        proc.stdin.close()
+
+    threads = []
+    lines_by_stream = {}
+    for name, stream, log_func in (
+        ("stdout", proc.stdout, logger.debug),
+        ("stderr", proc.stderr, logger.info),
+    ):
+        if stream is None:
+            continue
+        lines = collections.deque(maxlen=max_output_lines)
+        lines_by_stream[name] = lines
+        # Run in context of caller so logged records can be attributed
+        #   to the caller
+        thread = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(_read_output_stream, stream, log_func, lines),
+            daemon=True
+        )
+        thread.start()
+        threads.append(thread)
+
+    for thread in threads:
+        thread.join()
+
+    rusage = None
+    if hasattr(os, "wait4"):
+        try:
+            _, status, rusage = os.wait4(proc.pid, 0)
+            proc.returncode = _waitstatus_to_exitcode(status)
+        except ChildProcessError:
+            rusage = None
+    proc.wait()
+
+    outputs = []
+    for name in ("stdout", "stderr"):
+        lines = lines_by_stream.get(name)
+        output = None
+        if lines:
+            output = "\n".join(lines)
+        outputs.append(output)
+    return outputs[0], outputs[1], rusage
+
+
+def _waitstatus_to_exitcode(status):
+    if hasattr(os, "waitstatus_to_exitcode"):
+        return os.waitstatus_to_exitcode(status)
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
 def clean_envs_for_ayon_process(env=None):
     """Modify environments that may affect ayon-launcher process.
 
@@ -2,15 +2,52 @@ import os
 import logging
 import sys
 import errno
+import shutil
+import hashlib
+import threading
+import contextvars
+import collections
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import six
 
-from ayon_core.lib import create_hard_link
+from ayon_core.lib import create_hard_link, copy_file
+
+# Size of chunks read when content hash is calculated during copy
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _create_hash_object(hash_algorithm):
+    """Create hash object for algorithm name.
+
+    Algorithms from 'hashlib' are always available, 'xxhash' algorithms
+    (e.g. 'xxh3_64') are available only if 'xxhash' module is installed.
+
+    Args:
+        hash_algorithm (str): Name of hash algorithm.
+
+    Returns:
+        Any: Hash object with 'update' and 'hexdigest' methods.
 
-# this is needed until speedcopy for linux is fixed
-if sys.platform == "win32":
-    from speedcopy import copyfile
-else:
-    from shutil import copyfile
+    Raises:
+        ValueError: Algorithm is not available.
+    """
+    if hash_algorithm.startswith("xxh"):
+        try:
+            import xxhash
+        except ImportError:
+            raise ValueError(
+                "Hash algorithm \"{}\" requires 'xxhash' module.".format(
+                    hash_algorithm
+                )
+            )
+        hash_cls = getattr(xxhash, hash_algorithm, None)
+        if hash_cls is None:
+            raise ValueError(
+                "Unknown hash algorithm \"{}\"".format(hash_algorithm)
+            )
+        return hash_cls()
+    return hashlib.new(hash_algorithm)
 
 
 class DuplicateDestinationError(ValueError):
@@ -35,6 +72,11 @@ class FileTransaction(object):
     Step 3 is done during `finalize()`. If not called the .bak files will
     remain on disk.
 
+    Step 2 can run transfers in parallel when 'max_workers' is higher than 1.
+    Concurrency to a destination root can be limited further with
+    'root_max_workers' which is useful e.g. when one root is a slow network
+    storage which does not scale with number of concurrent writes.
+
     These steps try to ensure that we don't overwrite half of any existing
     files e.g. if they are currently in use.
 
@@ -49,17 +91,69 @@ class FileTransaction(object):
 
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Args:
+        log (Optional[logging.Logger]): Logger used for messages.
+        allow_queue_replacements (Optional[bool]): Allow to replace source
+            of already queued destination.
+        max_workers (Optional[int]): Maximum number of files transferred
+            at the same time. Files are transferred one by one if not set.
+        root_max_workers (Optional[dict[str, int]]): Maximum number of
+            concurrent transfers per destination root path.
+        hash_algorithm (Optional[str]): Calculate content hash of
+            transferred files with the algorithm while files are copied.
+            Results are available in 'manifest'. Hardlinked files are not
+            copied, so a full read of the file is needed to calculate the
+            hash, unless the same source file was already hashed during
+            the transaction.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
-
-    def __init__(self, log=None, allow_queue_replacements=False):
+    # Try hardlink first and copy the file if paths are on different drives
+    # - copied file has the same permission bits as source file, same as
+    #   hardlink would have
+    MODE_HARDLINK_OR_COPY = 2
+
+    def __init__(
+        self,
+        log=None,
+        allow_queue_replacements=False,
+        max_workers=None,
+        root_max_workers=None,
+        hash_algorithm=None,
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
         self.log = log
 
+        if not max_workers or max_workers < 1:
+            max_workers = 1
+        self._max_workers = max_workers
+
+        self._root_max_workers = {}
+        for root, root_workers in (root_max_workers or {}).items():
+            if not root or not root_workers or root_workers < 1:
+                continue
+            root = os.path.normcase(os.path.normpath(root))
+            self._root_max_workers[root] = root_workers
+
+        if hash_algorithm:
+            # Validate that algorithm is available
+            _create_hash_object(hash_algorithm)
+        self._hash_algorithm = hash_algorithm or None
+
+        # Information about transferred files by destination path
+        self._manifest = {}
+        # Content hash and size by source file path, modification time
+        #   and size, so one source is read only once
+        self._source_hashes = {}
+        # Number of copied files by used copy method
+        self._copy_methods = collections.Counter()
+        # Lock used when manifest and copy methods are changed by workers
+        self._stats_lock = threading.Lock()
+
         # The transfer queue
         # todo: make this an actual FIFO queue?
         self._transfers = {}
@@ -78,7 +172,8 @@ class FileTransaction(object):
         Args:
             src (str): Source path.
             dst (str): Destination path.
-            mode (MODE_COPY, MODE_HARDLINK): Transfer mode.
+            mode (MODE_COPY, MODE_HARDLINK, MODE_HARDLINK_OR_COPY): Transfer
+                mode.
         """
 
         opts = {"mode": mode}
@@ -109,12 +204,27 @@ class FileTransaction(object):
 
         self._transfers[dst] = (src, opts)
 
-    def process(self):
+    def process(self, progress_callback=None):
+        """Backup existing files and transfer queued files.
+
+        Args:
+            progress_callback (Optional[Callable[[str, str, int, int], None]]):
+                Called after each transferred file with source path,
+                destination path, number of finished transfers and
+                total number of transfers.
+        """
         # Backup any existing files
-        for dst, (src, _) in self._transfers.items():
+        transfers = []
+        for dst, (src, opts) in self._transfers.items():
             self.log.debug("Checking file ... {} -> {}".format(src, dst))
-            path_same = self._same_paths(src, dst)
-            if path_same or not os.path.exists(dst):
+            if self._same_paths(src, dst):
+                self.log.debug(
+                    "Source and destination are same files {} -> {}".format(
+                        src, dst))
+                continue
+
+            transfers.append((src, dst, opts))
+            if not os.path.exists(dst):
                 continue
 
             # Backup original file
@@ -125,26 +235,199 @@ class FileTransaction(object):
                 "Backup existing file: {} -> {}".format(dst, backup))
             os.rename(dst, backup)
 
+        # Create destination folders upfront so workers don't race on them
+        dirnames = set()
+        for _, dst, _ in transfers:
+            dirname = os.path.dirname(dst)
+            if dirname not in dirnames:
+                dirnames.add(dirname)
+                self._create_folder_for_file(dst)
+
         # Copy the files to transfer
-        for dst, (src, opts) in self._transfers.items():
-            path_same = self._same_paths(src, dst)
-            if path_same:
-                self.log.debug(
-                    "Source and destination are same files {} -> {}".format(
-                        src, dst))
-                continue
+        if self._max_workers > 1 and len(transfers) > 1:
+            self._process_parallel(transfers, progress_callback)
+            return
 
-            self._create_folder_for_file(dst)
+        total = len(transfers)
+        for src, dst, opts in transfers:
+            self._transfer_file(src, dst, opts)
+            self._transferred.append(dst)
+            self._on_file_transferred(src, dst, total, progress_callback)
+
+    def _process_parallel(self, transfers, progress_callback):
+        total = len(transfers)
+        root_semaphores = {
+            root: threading.BoundedSemaphore(root_workers)
+            for root, root_workers in self._root_max_workers.items()
+        }
+        self.log.debug(
+            "Transferring {} files using {} workers".format(
+                total, self._max_workers))
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = {}
+            for src, dst, opts in transfers:
+                semaphore = self._get_root_semaphore(dst, root_semaphores)
+                # Run in copy of context so logs and subprocess stats are
+                #   attributed to caller (e.g. publish worker)
+                future = executor.submit(
+                    contextvars.copy_context().run,
+                    self._transfer_file,
+                    src,
+                    dst,
+                    opts,
+                    semaphore,
+                )
+                futures[future] = (src, dst)
 
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
-                self.log.debug("Hardlinking file ... {} -> {}".format(
+            try:
+                for future in as_completed(futures):
+                    src, dst = futures[future]
+                    future.result()
+                    self._transferred.append(dst)
+                    self._on_file_transferred(
+                        src, dst, total, progress_callback)
+
+            except BaseException:
+                # Stop not started transfers and wait for the running ones
+                #   so all created files are known to rollback
+                for future in futures:
+                    future.cancel()
+
+                transferred = set(self._transferred)
+                for future, (_, dst) in futures.items():
+                    if (
+                        not future.cancelled()
+                        and future.exception() is None
+                        and dst not in transferred
+                    ):
+                        self._transferred.append(dst)
+                raise
+
+    def _transfer_file(self, src, dst, opts, semaphore=None):
+        if semaphore is not None:
+            with semaphore:
+                self._transfer_file(src, dst, opts)
+            return
+
+        if opts["mode"] == self.MODE_COPY:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            self._copyfile(src, dst)
+        elif opts["mode"] == self.MODE_HARDLINK:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+            self._hardlink(src, dst)
+        elif opts["mode"] == self.MODE_HARDLINK_OR_COPY:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+            try:
+                self._hardlink(src, dst)
+                return
+            except OSError as exc:
+                # re-raise exception if different than
+                # EXDEV - cross drive path
+                # EINVAL - wrong format, must be NTFS
+                if exc.errno not in (errno.EXDEV, errno.EINVAL):
+                    raise
+            self.log.debug(
+                "Hardlink failed, copying file ... {} -> {}".format(
                     src, dst))
-                create_hard_link(src, dst)
-
-            self._transferred.append(dst)
+            self._copyfile(src, dst)
+            shutil.copymode(src, dst)
+
+    def _copyfile(self, src, dst):
+        # NOTE Copy methods without reading file content in python can't be
+        #   used when content hash has to be calculated
+        if self._hash_algorithm is None:
+            method = copy_file(src, dst)
+            with self._stats_lock:
+                self._copy_methods[method] += 1
+            return
+
+        # Calculate hash from the same chunks which are written
+        src_key = self._get_source_hash_key(src)
+        hash_obj = _create_hash_object(self._hash_algorithm)
+        size = 0
+        with open(src, "rb") as src_stream, open(dst, "wb") as dst_stream:
+            while True:
+                chunk = src_stream.read(HASH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                hash_obj.update(chunk)
+                dst_stream.write(chunk)
+                size += len(chunk)
+        file_hash = hash_obj.hexdigest()
+        with self._stats_lock:
+            self._copy_methods["hash_copy"] += 1
+            if src_key is not None:
+                self._source_hashes[src_key] = (file_hash, size)
+        self._add_manifest_item(dst, file_hash, size)
+
+    def _hardlink(self, src, dst):
+        create_hard_link(src, dst)
+        if self._hash_algorithm is None:
+            return
+
+        # Hardlink has the same content as source, reuse hash of source
+        #   if it was already calculated by previous transfer
+        src_key = self._get_source_hash_key(src)
+        with self._stats_lock:
+            cached = self._source_hashes.get(src_key)
+        if cached is not None:
+            file_hash, size = cached
+            self._add_manifest_item(dst, file_hash, size)
+            return
+
+        hash_obj = _create_hash_object(self._hash_algorithm)
+        size = 0
+        with open(dst, "rb") as stream:
+            while True:
+                chunk = stream.read(HASH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                hash_obj.update(chunk)
+                size += len(chunk)
+        file_hash = hash_obj.hexdigest()
+        with self._stats_lock:
+            if src_key is not None:
+                self._source_hashes[src_key] = (file_hash, size)
+        self._add_manifest_item(dst, file_hash, size)
+
+    def _get_source_hash_key(self, src):
+        try:
+            stat = os.stat(src)
+        except OSError:
+            return None
+        return (
+            os.path.normcase(os.path.abspath(src)),
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+
+    def _add_manifest_item(self, dst, file_hash, size):
+        with self._stats_lock:
+            self._manifest[dst] = {
+                "size": size,
+                "hash": file_hash,
+                "hash_type": self._hash_algorithm,
+            }
+
+    def _on_file_transferred(self, src, dst, total, progress_callback):
+        done = len(self._transferred)
+        self.log.debug(
+            "Transferred file {}/{}: {}".format(done, total, dst))
+        if progress_callback is not None:
+            progress_callback(src, dst, done, total)
+
+    def _get_root_semaphore(self, dst, root_semaphores):
+        if not root_semaphores:
+            return None
+
+        dst = os.path.normcase(dst)
+        for root, semaphore in root_semaphores.items():
+            if dst.startswith(root.rstrip(os.sep) + os.sep):
+                return semaphore
+        return None
 
     def finalize(self):
         # Delete any backed up files
@@ -195,6 +478,46 @@ class FileTransaction(object):
         """Return the backup file paths"""
         return list(self._backup_to_original.keys())
 
+    @property
+    def manifest(self):
+        """Information about transferred files.
+
+        Information is available only if 'hash_algorithm' was set.
+
+        Returns:
+            dict[str, dict[str, Any]]: Size, hash and hash type of
+                transferred files by destination path.
+        """
+        return {
+            dst: dict(file_info)
+            for dst, file_info in self._manifest.items()
+        }
+
+    @property
+    def copy_methods(self):
+        """Number of copied files by used copy method.
+
+        Returns:
+            dict[str, int]: Copy method name with number of copied files.
+        """
+        return dict(self._copy_methods)
+
+    def get_transferred_file_info(self, dst):
+        """Information about transferred file.
+
+        Args:
+            dst (str): Destination path.
+
+        Returns:
+            Union[dict[str, Any], None]: Size, hash and hash type of
+                transferred file or None if not available.
+        """
+        dst = os.path.normpath(os.path.abspath(dst))
+        file_info = self._manifest.get(dst)
+        if file_info is not None:
+            file_info = dict(file_info)
+        return file_info
+
     def _create_folder_for_file(self, path):
         dirname = os.path.dirname(path)
         try:
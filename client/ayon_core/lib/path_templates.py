@@ -1,6 +1,8 @@
 import os
 import re
 import numbers
+import string
+import functools
 
 import six
 
@@ -8,6 +10,8 @@ KEY_PATTERN = re.compile(r"(\{.*?[^{0]*\})")
 KEY_PADDING_PATTERN = re.compile(r"([^:]+)\S+[><]\S+")
 SUB_DICT_PATTERN = re.compile(r"([^\[\]]+)")
 OPTIONAL_PATTERN = re.compile(r"(<.*?[^{0]*>)[^0-9]*?")
+# Maximum number of parsed template strings kept in memory
+TEMPLATE_PARTS_CACHE_SIZE = 2048
 
 
 class TemplateUnsolved(Exception):
@@ -49,37 +53,7 @@ class StringTemplate(object):
             ))
 
         self._template = template
-        parts = []
-        last_end_idx = 0
-        for item in KEY_PATTERN.finditer(template):
-            start, end = item.span()
-            if start > last_end_idx:
-                parts.append(template[last_end_idx:start])
-            parts.append(FormattingPart(template[start:end]))
-            last_end_idx = end
-
-        if last_end_idx < len(template):
-            parts.append(template[last_end_idx:len(template)])
-
-        new_parts = []
-        for part in parts:
-            if not isinstance(part, six.string_types):
-                new_parts.append(part)
-                continue
-
-            substr = ""
-            for char in part:
-                if char not in ("<", ">"):
-                    substr += char
-                else:
-                    if substr:
-                        new_parts.append(substr)
-                    new_parts.append(char)
-                    substr = ""
-            if substr:
-                new_parts.append(substr)
-
-        self._parts = self.find_optional_parts(new_parts)
+        self._parts = _parse_template_parts(self.__class__, template)
 
     def __str__(self):
         return self.template
@@ -142,6 +116,61 @@ class StringTemplate(object):
         result.validate()
         return result
 
+    def format_sequence(self, data, key, values):
+        """Format template for each value of single key.
+
+        Template is formatted only once, with placeholder in place of 'key'.
+            Only parts filled by 'key' are formatted for each value which
+            makes it cheap to fill long sequences of e.g. frames. Template
+            is fully formatted for values of invalid type, so the result
+            contains the invalid type.
+
+        Args:
+            data (dict): Containing keys to be filled into template.
+            key (str): Top level key in data which value changes.
+            values (Iterable[Any]): Values used for the key.
+
+        Returns:
+            list[TemplateResult]: Filled or partially filled template for
+                each value.
+        """
+        placeholder = SequenceValuePlaceholder()
+        placeholder_data = dict(data)
+        placeholder_data[key] = placeholder
+        result = self.format(placeholder_data)
+        output = []
+        for value in values:
+            if FormattingPart.validate_value_type(value):
+                output.append(self._create_sequence_result(
+                    result, key, placeholder, value
+                ))
+                continue
+            value_data = dict(data)
+            value_data[key] = value
+            output.append(self.format(value_data))
+        return output
+
+    def format_sequence_strict(self, *args, **kwargs):
+        results = self.format_sequence(*args, **kwargs)
+        for result in results:
+            result.validate()
+        return results
+
+    def _create_sequence_result(self, result, key, placeholder, value):
+        used_values = result.used_values
+        if key in used_values:
+            used_values = dict(used_values)
+            used_values[key] = placeholder.fill(used_values[key], value)
+
+        return TemplateResult(
+            placeholder.fill(result, value),
+            result.template,
+            result.solved,
+            used_values,
+            result.missing_keys,
+            result.invalid_types
+        )
+
     @classmethod
     def format_template(cls, template, data):
         objected_template = cls(template)
@@ -200,6 +229,77 @@ class StringTemplate(object):
                 new_parts.extend(tmp_parts[idx])
         return new_parts
 
+    @staticmethod
+    def get_cache_info():
+        """Information about cache of parsed templates.
+
+        Returns:
+            dict[str, int]: Cache hits, misses, current and maximum size.
+        """
+        cache_info = _parse_template_parts.cache_info()
+        return {
+            "hits": cache_info.hits,
+            "misses": cache_info.misses,
+            "size": cache_info.currsize,
+            "max_size": cache_info.maxsize,
+        }
+
+    @staticmethod
+    def clear_cache():
+        """Clear cache of parsed templates."""
+        _parse_template_parts.cache_clear()
+
+
+@functools.lru_cache(maxsize=TEMPLATE_PARTS_CACHE_SIZE)
+def _parse_template_parts(template_cls, template):
+    """Split template string to parts.
+
+    Parsed parts are cached as templates are usually created from the same
+        strings over and over (anatomy, workfile or burnin templates).
+        Parts are immutable for formatting, so they can be shared between
+        'StringTemplate' objects. Cache is keyed by class too, because
+        subclasses may override 'find_optional_parts'.
+
+    Args:
+        template_cls (type[StringTemplate]): Template class.
+        template (str): Template string.
+
+    Returns:
+        list[Union[str, FormattingPart, OptionalPart]]: Template parts.
+    """
+    parts = []
+    last_end_idx = 0
+    for item in KEY_PATTERN.finditer(template):
+        start, end = item.span()
+        if start > last_end_idx:
+            parts.append(template[last_end_idx:start])
+        parts.append(FormattingPart(template[start:end]))
+        last_end_idx = end
+
+    if last_end_idx < len(template):
+        parts.append(template[last_end_idx:len(template)])
+
+    new_parts = []
+    for part in parts:
+        if not isinstance(part, six.string_types):
+            new_parts.append(part)
+            continue
+
+        substr = ""
+        for char in part:
+            if char not in ("<", ">"):
+                substr += char
+            else:
+                if substr:
+                    new_parts.append(substr)
+                new_parts.append(char)
+                substr = ""
+        if substr:
+            new_parts.append(substr)
+
+    return template_cls.find_optional_parts(new_parts)
+
+
 class TemplateResult(str):
     """Result of template format with most of information in.
 
@@ -429,6 +529,63 @@ class FormatObject(object):
         return self.__str__()
 
 
+class SequenceValuePlaceholder(FormatObject):
+    """Placeholder used to format template once for multiple values.
+
+    Formatting of the placeholder returns marker, with index of used format
+    spec, that is replaced with formatted value in 'fill'.
+    """
+    marker_regex = re.compile("\x00([0-9]+)\x00")
+
+    def __init__(self):
+        super(SequenceValuePlaceholder, self).__init__()
+        self._format_specs = []
+        self._parts_by_text = {}
+
+    def __format__(self, format_spec):
+        self._format_specs.append(format_spec)
+        return "\x00{}\x00".format(len(self._format_specs) - 1)
+
+    # Placeholder must stay the same object if formatting data are copied
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def _get_parts(self, text):
+        parts = self._parts_by_text.get(text)
+        if parts is None:
+            parts = self.marker_regex.split(text)
+            for idx in range(1, len(parts), 2):
+                parts[idx] = int(parts[idx])
+            self._parts_by_text[text] = parts
+        return parts
+
+    def fill(self, text, value):
+        """Replace markers in text with formatted value.
+
+        Args:
+            text (str): Text formatted with the placeholder.
+            value (Any): Value to fill.
+
+        Returns:
+            str: Text with markers replaced with formatted value.
+        """
+        parts = self._get_parts(text)
+        if len(parts) == 1:
+            return str(text)
+
+        formatted = [
+            format(value, format_spec)
+            for format_spec in self._format_specs
+        ]
+        return "".join(
+            formatted[part] if idx % 2 else part
+            for idx, part in enumerate(parts)
+        )
+
+
 class FormattingPart:
     """String with formatting template.
 
@@ -440,6 +597,29 @@ class FormattingPart:
     def __init__(self, template):
         self._template = template
 
+        # Key path and format spec are resolved only once per part
+        key = template[1:-1]
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+        self._key = key
+        self._existence_check = existence_check
+        self._key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
+
+        # Value can be formatted directly with format spec if the key does
+        #   not use conversion or nested replacement fields
+        format_spec = None
+        try:
+            parsed = list(string.Formatter().parse(template))
+        except ValueError:
+            parsed = []
+        if len(parsed) == 1:
+            literal, _, spec, conversion = parsed[0]
+            if not literal and conversion is None and "{" not in spec:
+                format_spec = spec
+        self._format_spec = format_spec
+
     @property
     def template(self):
         return self._template
@@ -468,17 +648,14 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
         # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        existence_check = self._existence_check
+        key_subdict = self._key_subdict
 
         value = data
         missing_key = False
@@ -520,17 +697,20 @@ class FormattingPart:
             return result
 
         if self.validate_value_type(value):
-            fill_data = {}
-            first_value = True
-            for used_key in reversed(used_keys):
-                if first_value:
-                    first_value = False
-                    fill_data[used_key] = value
-                else:
-                    _fill_data = {used_key: fill_data}
-                    fill_data = _fill_data
-
-            formatted_value = self.template.format(**fill_data)
+            if self._format_spec is not None:
+                formatted_value = format(value, self._format_spec)
+            else:
+                fill_data = {}
+                first_value = True
+                for used_key in reversed(used_keys):
+                    if first_value:
+                        first_value = False
+                        fill_data[used_key] = value
+                    else:
+                        _fill_data = {used_key: fill_data}
+                        fill_data = _fill_data
+
+                formatted_value = self.template.format(**fill_data)
             result.add_realy_used_value(key, formatted_value)
             result.add_used_value(existence_check, formatted_value)
             result.add_output(formatted_value)
@@ -1,12 +1,38 @@
 import os
 import re
+import sys
+import errno
+import shutil
 import logging
 import platform
+import threading
+import collections
 
 import clique
 
 log = logging.getLogger(__name__)
 
+# Linux ioctl request to share content of files (reflink) '_IOW(0x94, 9, int)'
+_FICLONE = 0x40049409
+# Maximum number of bytes copied by one kernel copy call
+_KERNEL_COPY_CHUNK_SIZE = 2 ** 30
+# Error numbers meaning that copy method is not supported for the files
+_COPY_NOT_SUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTTY,
+    errno.EBADF,
+    errno.ENOTSOCK,
+    errno.EOPNOTSUPP,
+    getattr(errno, "ENOTSUP", errno.EOPNOTSUPP),
+}
+# Copy methods which are not supported between devices
+#   - '{(src device, dst device): {method name, ...}}'
+_UNSUPPORTED_COPY_METHODS = collections.defaultdict(set)
+_COPY_FILE_STATS = collections.Counter()
+_COPY_FILE_STATS_LOCK = threading.Lock()
+
 
 def format_file_size(file_size, suffix=None):
     """Returns formatted string with size in appropriate unit.
@@ -65,6 +91,134 @@ def create_hard_link(src_path, dst_path):
     )
 
 
+def copy_file(src_path, dst_path):
+    """Copy content of file using the fastest available method.
+
+    On Linux is tried reflink (copy-on-write clone) first, then in-kernel
+    copy using 'copy_file_range' (allows server side copy e.g. on NFS 4.2)
+    and 'sendfile'. Regular copy is used if none of them is supported
+    for the source and destination filesystems. Windows uses 'speedcopy'.
+
+    Metadata of source file (permissions, times) are not copied.
+
+    Args:
+        src_path (str): Source file path.
+        dst_path (str): Destination file path.
+
+    Returns:
+        str: Name of used copy method.
+    """
+    if sys.platform.startswith("linux"):
+        method = _copy_file_linux(src_path, dst_path)
+
+    elif sys.platform == "win32":
+        from speedcopy import copyfile
+
+        copyfile(src_path, dst_path)
+        method = "speedcopy"
+
+    else:
+        shutil.copyfile(src_path, dst_path)
+        method = "copyfile"
+
+    with _COPY_FILE_STATS_LOCK:
+        _COPY_FILE_STATS[method] += 1
+    return method
+
+
+def get_copy_file_stats():
+    """Statistics of methods used by 'copy_file' in this process.
+
+    Returns:
+        dict[str, int]: Number of copied files by copy method name.
+    """
+    with _COPY_FILE_STATS_LOCK:
+        return dict(_COPY_FILE_STATS)
+
+
+def reset_copy_file_stats():
+    """Reset statistics of methods used by 'copy_file'."""
+    with _COPY_FILE_STATS_LOCK:
+        _COPY_FILE_STATS.clear()
+
+
+def _copy_file_linux(src_path, dst_path):
+    with open(src_path, "rb") as src_stream:
+        src_fd = src_stream.fileno()
+        src_stat = os.fstat(src_fd)
+        with open(dst_path, "wb") as dst_stream:
+            dst_fd = dst_stream.fileno()
+            unsupported = _UNSUPPORTED_COPY_METHODS[
+                (src_stat.st_dev, os.fstat(dst_fd).st_dev)
+            ]
+            for method, func in (
+                ("reflink", _reflink_fd),
+                ("copy_file_range", _copy_file_range_fd),
+                ("sendfile", _sendfile_fd),
+            ):
+                if method in unsupported:
+                    continue
+                if func(src_fd, dst_fd, src_stat.st_size):
+                    return method
+                log.debug((
+                    "Copy method '{}' is not supported for '{}' -> '{}'"
+                ).format(method, src_path, dst_path))
+                unsupported.add(method)
+
+            shutil.copyfileobj(src_stream, dst_stream)
+    return "copyfile"
+
+
+def _reflink_fd(src_fd, dst_fd, size):
+    import fcntl
+
+    try:
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+    except OSError as exc:
+        if exc.errno in _COPY_NOT_SUPPORTED_ERRNOS:
+            return False
+        raise
+    return True
+
+
+def _copy_file_range_fd(src_fd, dst_fd, size):
+    if not hasattr(os, "copy_file_range"):
+        return False
+    return _kernel_copy(os.copy_file_range, src_fd, dst_fd, size)
+
+
+def _sendfile_fd(src_fd, dst_fd, size):
+    if not hasattr(os, "sendfile"):
+        return False
+
+    def _sendfile(src, dst, count, offset_src):
+        return os.sendfile(dst, src, offset_src, count)
+
+    return _kernel_copy(_sendfile, src_fd, dst_fd, size)
+
+
+def _kernel_copy(func, src_fd, dst_fd, size):
+    offset = 0
+    while True:
+        try:
+            copied = func(
+                src_fd, dst_fd, _KERNEL_COPY_CHUNK_SIZE, offset_src=offset
+            )
+        except OSError as exc:
+            # Fallback to other method only if nothing was copied yet
+            if offset == 0 and exc.errno in _COPY_NOT_SUPPORTED_ERRNOS:
+                return False
+            raise
+
+        if copied == 0:
+            # Some filesystems silently don't copy anything
+            if offset == 0 and size > 0:
+                return False
+            break
+        offset += copied
+    return True
+
+
 def collect_frames(files):
     """Returns dict of source path and its frame, if from sequence
 
@@ -1,14 +1,22 @@
 import os
 import re
+import copy
+import time
 import logging
 import json
+import hashlib
+import threading
+import contextvars
 import collections
 import tempfile
 import subprocess
 import platform
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import xml.etree.ElementTree
 
+import clique
+
 from .execute import run_subprocess
 from .vendor_bin_utils import (
     get_ffmpeg_tool_args,
@@ -66,6 +74,377 @@ VIDEO_EXTENSIONS = {
 }
 
 
+# Names of directories and files created by 'MediaInfoCache' (sha1 hashes)
+_MEDIA_INFO_CACHE_NAME_REGEX = re.compile(
+    r"^[0-9a-f]{40}(\.json)?$"
+)
+
+
+class MediaInfoCache:
+    """Cache of outputs of tools reading information about media files.
+
+    Outputs are cached by file path, its modification time and size and
+    arguments of the tool, so a changed file never uses stale output. Cache
+    can be persisted on disk between processes when 'cache_dir' is set.
+
+    Outputs persisted on disk which were not used for 'disk_max_age'
+    seconds are removed, least recently used outputs are removed when
+    size of the cache exceeds 'disk_max_size' bytes. Cache directory is
+    pruned in background at most once per 'disk_prune_interval' seconds.
+
+    Args:
+        max_items (Optional[int]): Maximum number of outputs kept in memory.
+            Least recently used outputs are removed first.
+        cache_dir (Optional[str]): Directory where outputs are persisted.
+        disk_max_age (Optional[float]): Maximum age of unused outputs on
+            disk in seconds.
+        disk_max_size (Optional[int]): Maximum size of outputs on disk
+            in bytes.
+    """
+    default_max_items = 1024
+    default_disk_max_age = 30 * 24 * 60 * 60
+    default_disk_max_size = 512 * 1024 * 1024
+    disk_prune_interval = 60 * 60
+
+    def __init__(
+        self,
+        max_items=None,
+        cache_dir=None,
+        disk_max_age=None,
+        disk_max_size=None,
+    ):
+        if not max_items:
+            max_items = self.default_max_items
+        if not disk_max_age:
+            disk_max_age = self.default_disk_max_age
+        if not disk_max_size:
+            disk_max_size = self.default_disk_max_size
+        self._max_items = max_items
+        self._cache_dir = cache_dir or None
+        self._disk_max_age = disk_max_age
+        self._disk_max_size = disk_max_size
+        self._prune_started = False
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_output(self, filepath, args, func, parse_func=None):
+        """Get cached tool output or call function to get it.
+
+        Parsed output is kept in memory when 'parse_func' is passed, so
+        output is not parsed again on each call. Copy of parsed output is
+        returned, it can be modified.
+
+        Args:
+            filepath (str): Path to media file.
+            args (Iterable[str]): Arguments of the tool.
+            func (Callable[[], str]): Function that runs the tool and
+                returns its output.
+            parse_func (Optional[Callable[[str], Any]]): Function that
+                parses the output. Should be module level function, as
+                it is part of the cache key.
+
+        Returns:
+            Any: Tool output, or parsed output if 'parse_func' is passed.
+        """
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            output = func()
+            if parse_func is not None:
+                output = parse_func(output)
+            return output
+
+        path = os.path.normpath(os.path.abspath(filepath))
+        args = tuple(args)
+        key = (path, stat.st_mtime_ns, stat.st_size, args)
+        item_key = key + (parse_func, )
+        with self._lock:
+            value = self._items.get(item_key)
+            if value is not None:
+                self._items.move_to_end(item_key)
+                self._hits += 1
+                return self._copy_value(value, parse_func)
+
+        output = self._read_from_disk(key)
+        if output is None:
+            output = func()
+            with self._lock:
+                self._misses += 1
+            # Don't cache empty output of failed tool
+            if not output:
+                if parse_func is not None:
+                    output = parse_func(output)
+                return output
+            self._write_to_disk(key, output)
+        else:
+            with self._lock:
+                self._hits += 1
+
+        value = output
+        if parse_func is not None:
+            value = parse_func(output)
+
+        with self._lock:
+            self._items[item_key] = value
+            while len(self._items) > self._max_items:
+                self._items.popitem(last=False)
+        return self._copy_value(value, parse_func)
+
+    def invalidate(self, filepath=None):
+        """Remove cached outputs.
+
+        Args:
+            filepath (Optional[str]): Remove only outputs of the file.
+                All outputs are removed if not passed.
+        """
+        if filepath is None:
+            with self._lock:
+                self._items.clear()
+            if self._cache_dir and os.path.isdir(self._cache_dir):
+                # Cache directory can contain other files
+                for name in os.listdir(self._cache_dir):
+                    if _MEDIA_INFO_CACHE_NAME_REGEX.match(name):
+                        self._remove_cache_entries(
+                            os.path.join(self._cache_dir, name)
+                        )
+            return
+
+        path = os.path.normpath(os.path.abspath(filepath))
+        with self._lock:
+            for key in tuple(self._items.keys()):
+                if key[0] == path:
+                    self._items.pop(key)
+
+        path_dir = self._get_path_cache_dir(path)
+        if path_dir:
+            self._remove_cache_entries(path_dir)
+
+    def prune_disk_cache(self):
+        """Remove outputs persisted on disk over age and size limits.
+
+        Outputs which were not used for maximum age are removed, then
+        least recently used outputs are removed until size of cache is
+        under maximum size.
+        """
+        if not self._cache_dir or not os.path.isdir(self._cache_dir):
+            return
+
+        now = time.time()
+        entries = []
+        path_dirs = []
+        for dir_name in os.listdir(self._cache_dir):
+            if not _MEDIA_INFO_CACHE_NAME_REGEX.match(dir_name):
+                continue
+            path_dir = os.path.join(self._cache_dir, dir_name)
+            if not os.path.isdir(path_dir):
+                continue
+            path_dirs.append(path_dir)
+            for name in os.listdir(path_dir):
+                if not _MEDIA_INFO_CACHE_NAME_REGEX.match(name):
+                    continue
+                filepath = os.path.join(path_dir, name)
+                try:
+                    stat = os.stat(filepath)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, filepath))
+
+        entries.sort()
+        total_size = sum(entry[1] for entry in entries)
+        for mtime, size, filepath in entries:
+            if (
+                now - mtime <= self._disk_max_age
+                and total_size <= self._disk_max_size
+            ):
+                break
+            try:
+                os.remove(filepath)
+            except OSError:
+                continue
+            total_size -= size
+
+        # Remove directories which are empty now
+        for path_dir in path_dirs:
+            try:
+                os.rmdir(path_dir)
+            except OSError:
+                pass
+
+    def get_stats(self):
+        """Cache statistics.
+
+        Returns:
+            dict[str, int]: Cache hits, misses and number of cached items.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._items),
+                "max_size": self._max_items,
+            }
+
+    def _remove_cache_entries(self, path_dir):
+        """Remove files of cached outputs of a media file.
+
+        Only files created by the cache are removed, directory is removed
+        only if is empty afterwards.
+
+        Args:
+            path_dir (str): Cache directory of media file.
+        """
+        if not os.path.isdir(path_dir):
+            return
+
+        for name in os.listdir(path_dir):
+            if not _MEDIA_INFO_CACHE_NAME_REGEX.match(name):
+                continue
+            try:
+                os.remove(os.path.join(path_dir, name))
+            except OSError:
+                pass
+
+        try:
+            os.rmdir(path_dir)
+        except OSError:
+            pass
+
+    def _get_path_cache_dir(self, path):
+        if not self._cache_dir:
+            return None
+        path_hash = hashlib.sha1(path.encode("utf-8")).hexdigest()
+        return os.path.join(self._cache_dir, path_hash)
+
+    @staticmethod
+    def _copy_value(value, parse_func):
+        # Parsed output is mutable, raw output is a string
+        if parse_func is None:
+            return value
+        return copy.deepcopy(value)
+
+    def _start_disk_prune(self):
+        """Prune disk cache in background if was not pruned recently.
+
+        Time of last prune is stored as modification time of a file in
+        cache directory, so it's shared between processes.
+        """
+        with self._lock:
+            if self._prune_started:
+                return
+            self._prune_started = True
+
+        marker_path = os.path.join(self._cache_dir, ".last_prune")
+        try:
+            if (
+                os.path.exists(marker_path)
+                and time.time() - os.path.getmtime(marker_path)
+                < self.disk_prune_interval
+            ):
+                return
+            with open(marker_path, "w"):
+                pass
+        except OSError:
+            return
+
+        thread = threading.Thread(
+            target=self._prune_disk_cache_thread, daemon=True
+        )
+        thread.start()
+
+    def _prune_disk_cache_thread(self):
+        try:
+            self.prune_disk_cache()
+        except Exception:
+            logging.getLogger(__name__).debug(
+                "Failed to prune media info cache \"{}\"".format(
+                    self._cache_dir
+                ),
+                exc_info=True
+            )
+
+    def _get_cache_filepath(self, key):
+        path, _, _, args = key
+        args_hash = hashlib.sha1(
+            json.dumps(args).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(
+            self._get_path_cache_dir(path), "{}.json".format(args_hash)
+        )
+
+    def _read_from_disk(self, key):
+        if not self._cache_dir:
+            return None
+
+        filepath = self._get_cache_filepath(key)
+        try:
+            with open(filepath, "r") as stream:
+                data = json.load(stream)
+        except (OSError, ValueError):
+            return None
+
+        _, mtime_ns, size, _ = key
+        if data.get("mtime_ns") != mtime_ns or data.get("size") != size:
+            # Remove stale output of previous file version
+            try:
+                os.remove(filepath)
+            except OSError:
+                pass
+            return None
+
+        # Modification time is used to remove least recently used outputs
+        try:
+            os.utime(filepath)
+        except OSError:
+            pass
+        return data.get("output")
+
+    def _write_to_disk(self, key, output):
+        if not self._cache_dir:
+            return
+
+        self._start_disk_prune()
+        _, mtime_ns, size, _ = key
+        filepath = self._get_cache_filepath(key)
+        tmp_filepath = "{}.{}.tmp".format(filepath, threading.get_ident())
+        try:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            with open(tmp_filepath, "w") as stream:
+                json.dump(
+                    {"mtime_ns": mtime_ns, "size": size, "output": output},
+                    stream
+                )
+            os.replace(tmp_filepath, filepath)
+        except OSError:
+            logging.getLogger(__name__).debug(
+                "Failed to store media info cache to \"{}\"".format(
+                    filepath
+                ),
+                exc_info=True
+            )
+
+
+_MEDIA_INFO_CACHE = None
+
+
+def get_media_info_cache():
+    """Media info cache used by 'get_oiio_info_for_input' and ffprobe.
+
+    Cache is persisted on disk if 'AYON_MEDIA_INFO_CACHE_DIR' environment
+    variable is set.
+
+    Returns:
+        MediaInfoCache: Process wide media info cache.
+    """
+    global _MEDIA_INFO_CACHE
+    if _MEDIA_INFO_CACHE is None:
+        _MEDIA_INFO_CACHE = MediaInfoCache(
+            cache_dir=os.getenv("AYON_MEDIA_INFO_CACHE_DIR")
+        )
+    return _MEDIA_INFO_CACHE
+
+
 def get_transcode_temp_directory():
     """Creates temporary folder for transcoding.
 
@@ -93,7 +472,31 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
 
     args.extend(["-i:infoformat=xml", filepath])
 
-    output = run_subprocess(args, logger=logger)
+    output = get_media_info_cache().get_output(
+        filepath,
+        args,
+        lambda: run_subprocess(args, logger=logger),
+        _parse_oiio_info_output,
+    )
+    if not output:
+        raise ValueError(
+            "Failed to read input file \"{}\".".format(filepath)
+        )
+
+    if subimages:
+        return output
+    return output[0]
+
+
+def _parse_oiio_info_output(output):
+    """Parse output of oiiotool info.
+
+    Args:
+        output (str): Output of oiiotool with info in xml format.
+
+    Returns:
+        list[dict[str, Any]]: Information about each subimage.
+    """
     output = output.replace("\r\n", "\n")
 
     xml_started = False
@@ -112,21 +515,10 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
                 lines = []
                 xml_started = False
 
-    if not subimages_lines:
-        raise ValueError(
-            "Failed to read input file \"{}\".\nOutput:\n{}".format(
-                filepath, output
-            )
-        )
-
-    output = []
-    for subimage_lines in subimages_lines:
-        xml_text = "\n".join(subimage_lines)
-        output.append(parse_oiio_xml_output(xml_text, logger=logger))
-
-    if subimages:
-        return output
-    return output[0]
+    return [
+        parse_oiio_xml_output("\n".join(subimage_lines))
+        for subimage_lines in subimages_lines
+    ]
 
 
 class RationalToInt:
@@ -659,7 +1051,9 @@ def convert_for_ffmpeg(
 def convert_input_paths_for_ffmpeg(
     input_paths,
     output_dir,
-    logger=None
+    logger=None,
+    max_workers=None,
+    use_frame_ranges=False,
 ):
     """Convert source file to format supported in ffmpeg.
 
@@ -672,16 +1066,25 @@ def convert_input_paths_for_ffmpeg(
     - This way it can handle gaps and can keep input filenames without handling
         frame template
 
+    Conversions run in parallel, each conversion is a separate 'oiiotool'
+    process. Contiguous frame ranges can be converted by single 'oiiotool'
+    process using '--frames' when 'use_frame_ranges' is enabled.
+
     Args:
         input_paths (str): Paths that should be converted. It is expected that
             contains single file or image sequence of same type.
         output_dir (str): Path to directory where output will be rendered.
             Must not be same as input's directory.
         logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Maximum number of conversions running
+            at the same time. Number of CPUs is used if not passed.
+        use_frame_ranges (Optional[bool]): Convert contiguous frame ranges
+            with single 'oiiotool' process.
 
     Raises:
         ValueError: If input filepath has extension not supported by function.
             Currently is supported only ".exr" extension.
+        RuntimeError: Conversion of any of input paths failed.
     """
     if logger is None:
         logger = logging.getLogger(__name__)
@@ -706,66 +1109,167 @@ def convert_input_paths_for_ffmpeg(
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
 
-    for input_path in input_paths:
-        # Prepare subprocess arguments
-        oiio_cmd = get_oiio_tool_args(
-            "oiiotool",
-            # Don't add any additional attributes
-            "--nosoftwareattrib",
-        )
-        # Add input compression if available
-        if compression:
-            oiio_cmd.extend(["--compression", compression])
-
-        oiio_cmd.extend([
-            input_arg, input_path,
-            # Tell oiiotool which channels should be put to top stack
-            #   (and output)
-            "--ch", channels_arg,
-            # Use first subimage
-            "--subimage", "0"
-        ])
-
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
+    # Arguments are the same for all inputs, so they're prepared only once
+    oiio_cmd_prefix = get_oiio_tool_args(
+        "oiiotool",
+        # Don't add any additional attributes
+        "--nosoftwareattrib",
+    )
+    # Add input compression if available
+    if compression:
+        oiio_cmd_prefix.extend(["--compression", compression])
 
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing prohibited symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
+    oiio_cmd_suffix = [
+        # Tell oiiotool which channels should be put to top stack
+        #   (and output)
+        "--ch", channels_arg,
+        # Use first subimage
+        "--subimage", "0"
+    ]
+    oiio_cmd_suffix.extend(_get_ffmpeg_erase_attribs_args(input_info, logger))
+
+    # Prepare conversions as tuple of input paths they cover and
+    #   arguments to convert them
+    conversions = []
+    remainders = input_paths
+    if use_frame_ranges:
+        src_collections, remainders = clique.assemble(
+            input_paths,
+            patterns=[clique.PATTERNS["frames"]],
+            minimum_items=2
+        )
+        for collection in src_collections:
+            for sub_collection in collection.separate():
+                frames = sorted(sub_collection.indexes)
+                filename_pattern = sub_collection.format(
+                    "{head}{padding}{tail}"
                 )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
+                conversions.append((
+                    list(sub_collection),
+                    ["--frames", "{}-{}".format(frames[0], frames[-1])],
+                    filename_pattern,
+                    os.path.join(
+                        output_dir, os.path.basename(filename_pattern)
+                    ),
+                ))
+
+    for input_path in remainders:
+        conversions.append((
+            [input_path],
+            [],
+            input_path,
+            os.path.join(output_dir, os.path.basename(input_path)),
+        ))
 
+    def _convert(frames_args, input_path, output_path):
+        oiio_cmd = list(oiio_cmd_prefix)
+        oiio_cmd.extend(frames_args)
+        oiio_cmd.extend([input_arg, input_path])
+        oiio_cmd.extend(oiio_cmd_suffix)
         # Add last argument - path to output
-        base_filename = os.path.basename(input_path)
-        output_path = os.path.join(output_dir, base_filename)
-        oiio_cmd.extend([
-            "-o", output_path
-        ])
+        oiio_cmd.extend(["-o", output_path])
 
         logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
         run_subprocess(oiio_cmd, logger=logger)
 
+    if not max_workers:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(conversions))
+
+    errors_by_path = {}
+    if max_workers < 2:
+        for converted_paths, frames_args, src_path, dst_path in conversions:
+            try:
+                _convert(frames_args, src_path, dst_path)
+            except Exception as exc:
+                for path in converted_paths:
+                    errors_by_path[path] = exc
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for item in conversions:
+                converted_paths, frames_args, src_path, dst_path = item
+                # Run in copy of context so logs and subprocess stats are
+                #   attributed to caller (e.g. publish worker)
+                future = executor.submit(
+                    contextvars.copy_context().run,
+                    _convert,
+                    frames_args,
+                    src_path,
+                    dst_path,
+                )
+                futures[future] = converted_paths
+
+            for future in as_completed(futures):
+                exc = future.exception()
+                if exc is not None:
+                    for path in futures[future]:
+                        errors_by_path[path] = exc
+
+    if errors_by_path:
+        failed_paths = [
+            path
+            for path in input_paths
+            if path in errors_by_path
+        ]
+        error_messages = []
+        for exc in errors_by_path.values():
+            error_message = str(exc)
+            if error_message not in error_messages:
+                error_messages.append(error_message)
+        raise RuntimeError((
+            "Conversion of {} of {} files failed.\nFailed files:\n{}"
+            "\nErrors:\n{}"
+        ).format(
+            len(failed_paths),
+            len(input_paths),
+            "\n".join(failed_paths),
+            "\n".join(error_messages),
+        ))
+
+
+def _get_ffmpeg_erase_attribs_args(input_info, logger):
+    """Arguments for oiiotool to remove attributes not supported by ffmpeg.
+
+    Args:
+        input_info (dict[str, Any]): Information about input from oiiotool.
+        logger (logging.Logger): Logger used for logging.
+
+    Returns:
+        list[str]: Arguments for oiiotool.
+    """
+    erase_args = []
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
+
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containing prohibited symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
+
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
+
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            erase_args.extend(["--eraseattrib", attr_name])
+    return erase_args
+
 
 # FFMPEG functions
 def get_ffprobe_data(path_to_file, logger=None):
@@ -794,34 +1298,37 @@ def get_ffprobe_data(path_to_file, logger=None):
         path_to_file
     ]
 
-    logger.debug("FFprobe command: {}".format(
-        subprocess.list2cmdline(args)
-    ))
-    kwargs = {
-        "stdout": subprocess.PIPE,
-        "stderr": subprocess.PIPE,
-    }
-    if platform.system().lower() == "windows":
-        kwargs["creationflags"] = (
-            subprocess.CREATE_NEW_PROCESS_GROUP
-            | getattr(subprocess, "DETACHED_PROCESS", 0)
-            | getattr(subprocess, "CREATE_NO_WINDOW", 0)
-        )
+    def _run_ffprobe():
+        logger.debug("FFprobe command: {}".format(
+            subprocess.list2cmdline(args)
+        ))
+        kwargs = {
+            "stdout": subprocess.PIPE,
+            "stderr": subprocess.PIPE,
+        }
+        if platform.system().lower() == "windows":
+            kwargs["creationflags"] = (
+                subprocess.CREATE_NEW_PROCESS_GROUP
+                | getattr(subprocess, "DETACHED_PROCESS", 0)
+                | getattr(subprocess, "CREATE_NO_WINDOW", 0)
+            )
 
-    popen = subprocess.Popen(args, **kwargs)
+        popen = subprocess.Popen(args, **kwargs)
 
-    popen_stdout, popen_stderr = popen.communicate()
-    if popen_stdout:
-        logger.debug("FFprobe stdout:\n{}".format(
-            popen_stdout.decode("utf-8")
-        ))
+        popen_stdout, popen_stderr = popen.communicate()
+        popen_stdout = popen_stdout.decode("utf-8")
+        if popen_stdout:
+            logger.debug("FFprobe stdout:\n{}".format(popen_stdout))
 
-    if popen_stderr:
-        logger.warning("FFprobe stderr:\n{}".format(
-            popen_stderr.decode("utf-8")
-        ))
+        if popen_stderr:
+            logger.warning("FFprobe stderr:\n{}".format(
+                popen_stderr.decode("utf-8")
+            ))
+        return popen_stdout
 
-    return json.loads(popen_stdout)
+    return get_media_info_cache().get_output(
+        path_to_file, args, _run_ffprobe, json.loads
+    )
 
 
 def get_ffprobe_streams(path_to_file, logger=None):
@@ -99,6 +99,15 @@ class AnatomyStringTemplate(StringTemplate):
         )
         return AnatomyTemplateResult(result, rootless_path)
 
+    def _create_sequence_result(self, result, key, placeholder, value):
+        tmp = super(AnatomyStringTemplate, self)._create_sequence_result(
+            result, key, placeholder, value
+        )
+        rootless_path = result.rootless
+        if rootless_path is not None:
+            rootless_path = placeholder.fill(rootless_path, value)
+        return AnatomyTemplateResult(tmp, rootless_path)
+
 
 def _merge_dict(main_dict, enhance_dict):
     """Merges dictionaries by keys.
@@ -298,6 +307,33 @@ class TemplateItem:
             output[key] = value
         return TemplatesResultDict(output, strict=strict)
 
+    def format_sequence(self, data, key, values, strict=True):
+        """Format templates for each value of single key.
+
+        Args:
+            data (dict[str, Any]): Formatting data for templates.
+            key (str): Top level key in data which value changes.
+            values (Iterable[Any]): Values used for the key.
+            strict (Optional[bool]): Validate results on access.
+
+        Returns:
+            list[TemplatesResultDict]: Formatting results for each value.
+        """
+        values = list(values)
+        outputs = [{} for _ in values]
+        for template_key, value in self._template_data.items():
+            if isinstance(value, AnatomyStringTemplate):
+                results = value.format_sequence(data, key, values)
+            else:
+                results = [value] * len(values)
+
+            for output, result in zip(outputs, results):
+                output[template_key] = result
+        return [
+            TemplatesResultDict(output, strict=strict)
+            for output in outputs
+        ]
+
 
 class TemplateCategory:
     """Template category.
@@ -638,6 +674,28 @@ class AnatomyTemplates:
             output[key] = value
         return TemplatesResultDict(output, strict=strict)
 
+    def format_sequence(
+        self, category_name, template_name, data, key, values, strict=True
+    ):
+        """Format template item for each value of single key.
+
+        Args:
+            category_name (str): Category name.
+            template_name (str): Template name.
+            data (dict[str, Any]): Formatting data for templates.
+            key (str): Top level key in data which value changes.
+            values (Iterable[Any]): Values used for the key.
+            strict (Optional[bool]): Validate results on access.
+
+        Returns:
+            list[TemplatesResultDict]: Formatting results for each value.
+
+        Raises:
+            KeyError: When category or template is not available.
+        """
+        template_item = self.get_template_item(category_name, template_name)
+        return template_item.format_sequence(data, key, values, strict)
+
     def _validate_discovery(self):
         """Validate if templates are discovered and loaded for anatomy project.
 
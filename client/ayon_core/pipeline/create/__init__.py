@@ -41,6 +41,13 @@ from .context import (
     CreateContext
 )
 
+from .remote import (
+    REMOTE_FORMAT_VERSION,
+    serialize_instances_for_remote,
+    get_known_instance_hashes,
+    deserialize_instances_on_remote,
+)
+
 from .legacy_create import (
     LegacyCreator,
     legacy_create,
@@ -81,6 +88,11 @@ __all__ = (
     "CreatedInstance",
     "CreateContext",
 
+    "REMOTE_FORMAT_VERSION",
+    "serialize_instances_for_remote",
+    "get_known_instance_hashes",
+    "deserialize_instances_on_remote",
+
     "LegacyCreator",
     "legacy_create",
 )
@@ -1,10 +1,13 @@
 import os
 import sys
 import copy
+import time
 import logging
+import threading
 import traceback
 import collections
 import inspect
+from concurrent.futures import ThreadPoolExecutor
 from uuid import uuid4
 from contextlib import contextmanager
 
@@ -13,6 +16,7 @@ import pyblish.api
 import ayon_api
 
 from ayon_core.settings import get_project_settings
+from ayon_core.lib import NestedCacheItem
 from ayon_core.lib.attribute_definitions import (
     UnknownDef,
     serialize_attr_defs,
@@ -186,6 +190,8 @@ def prepare_failed_creator_operation_info(
 
 
 _EMPTY_VALUE = object()
+# Values of these types can't be modified in place
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None))
 
 
 class TrackChangesItem(object):
@@ -559,6 +565,12 @@ class AttributeValues(object):
             if value is not None:
                 self._data[attr_def.key] = value
 
+        # Keys that were changed since changes were cleared
+        self._changed_keys = set()
+        # Keys with mutable values that were accessed, the values
+        #   could be changed in place
+        self._exposed_keys = set()
+
     def __setitem__(self, key, value):
         if key not in self._attr_defs_by_key:
             raise KeyError("Key \"{}\" was not found.".format(key))
@@ -567,11 +579,16 @@ class AttributeValues(object):
         if old_value == value:
             return
         self._data[key] = value
+        self._changed_keys.add(key)
+        self._track_exposed_value(key, value)
 
     def __getitem__(self, key):
         if key not in self._attr_defs_by_key:
-            return self._data[key]
-        return self._data.get(key, self._attr_defs_by_key[key].default)
+            value = self._data[key]
+        else:
+            value = self._data.get(key, self._attr_defs_by_key[key].default)
+        self._track_exposed_value(key, value)
+        return value
 
     def __contains__(self, key):
         return key in self._attr_defs_by_key
@@ -586,11 +603,15 @@ class AttributeValues(object):
 
     def values(self):
         for key in self._attr_defs_by_key.keys():
-            yield self._data.get(key)
+            value = self._data.get(key)
+            self._track_exposed_value(key, value)
+            yield value
 
     def items(self):
         for key in self._attr_defs_by_key.keys():
-            yield key, self._data.get(key)
+            value = self._data.get(key)
+            self._track_exposed_value(key, value)
+            yield key, value
 
     def update(self, value):
         for _key, _value in dict(value):
@@ -598,6 +619,7 @@ class AttributeValues(object):
 
     def pop(self, key, default=None):
         value = self._data.pop(key, default)
+        self._changed_keys.add(key)
         # Remove attribute definition if is 'UnknownDef'
         # - gives option to get rid of unknown values
         attr_def = self._attr_defs_by_key.get(key)
@@ -607,10 +629,51 @@ class AttributeValues(object):
         return value
 
     def reset_values(self):
+        self._changed_keys |= set(self._data.keys())
         self._data = {}
 
     def mark_as_stored(self):
-        self._origin_data = copy.deepcopy(self._data)
+        self._origin_data = copy.deepcopy(self._data_to_store())
+
+    def has_tracked_changes(self):
+        """Values changed since tracked changes were cleared.
+
+        Only keys which were changed or which mutable values were accessed
+        since last call of 'clear_tracked_changes' are compared with
+        origin data.
+
+        Returns:
+            bool: Values are different from origin data.
+        """
+
+        return self._has_tracked_changes(self._origin_data)
+
+    def clear_tracked_changes(self):
+        """Clear changed keys.
+
+        Should be called only when values are same as origin data.
+        """
+
+        self._changed_keys.clear()
+
+    def _has_tracked_changes(self, origin_data):
+        for key in self._changed_keys | self._exposed_keys:
+            value = self._get_value_to_store(key)
+            if origin_data.get(key, _EMPTY_VALUE) != value:
+                return True
+        return False
+
+    def _get_value_to_store(self, key):
+        if key in self._data:
+            return self._data[key]
+        attr_def = self._attr_defs_by_key.get(key)
+        if attr_def is None:
+            return _EMPTY_VALUE
+        return attr_def.default
+
+    def _track_exposed_value(self, key, value):
+        if not isinstance(value, _IMMUTABLE_TYPES):
+            self._exposed_keys.add(key)
 
     @property
     def attr_defs(self):
@@ -633,10 +696,13 @@ class AttributeValues(object):
             Dict[str, Any]: Attribute values that should be stored.
         """
 
-        output = {}
-        for key in self._data:
-            output[key] = self[key]
+        output = self._data_to_store()
+        for key, value in output.items():
+            self._track_exposed_value(key, value)
+        return output
 
+    def _data_to_store(self):
+        output = dict(self._data)
         for key, attr_def in self._attr_defs_by_key.items():
             if key not in output:
                 output[key] = attr_def.default
@@ -708,6 +774,8 @@ class PublishAttributes:
         self._data = copy.deepcopy(origin_data)
         self._plugin_names_order = []
         self._missing_plugins = []
+        # Plugins were changed since tracked changes were cleared
+        self._plugins_changed = True
 
         self.set_publish_plugins(attr_plugins)
 
@@ -742,6 +810,7 @@ class PublishAttributes:
 
         if key in self._missing_plugins:
             self._missing_plugins.remove(key)
+            self._plugins_changed = True
             removed_item = self._data.pop(key)
             return removed_item.data_to_store()
 
@@ -758,8 +827,45 @@ class PublishAttributes:
         for name in self._plugin_names_order:
             yield name
 
+    @property
+    def missing_plugins(self):
+        """Names of plugins which have values but are not available.
+
+        Returns:
+            list[str]: Names of missing plugins.
+        """
+
+        return list(self._missing_plugins)
+
     def mark_as_stored(self):
-        self._origin_data = copy.deepcopy(self.data_to_store())
+        self._origin_data = copy.deepcopy(self._data_to_store())
+
+    def has_tracked_changes(self):
+        """Values changed since tracked changes were cleared.
+
+        Returns:
+            bool: Values are different from origin data, or plugins were
+                changed.
+        """
+
+        if self._plugins_changed:
+            return True
+
+        for key, attr_value in self._data.items():
+            origin_data = self._origin_data.get(key) or {}
+            if attr_value._has_tracked_changes(origin_data):
+                return True
+        return False
+
+    def clear_tracked_changes(self):
+        """Clear tracked changes of all plugin values.
+
+        Should be called only when values are same as origin data.
+        """
+
+        self._plugins_changed = False
+        for attr_value in self._data.values():
+            attr_value.clear_tracked_changes()
 
     def data_to_store(self):
         """Convert attribute values to "data to store"."""
@@ -769,15 +875,34 @@ class PublishAttributes:
             output[key] = attr_value.data_to_store()
         return output
 
+    def _data_to_store(self):
+        return {
+            key: attr_value._data_to_store()
+            for key, attr_value in self._data.items()
+        }
+
     @property
     def origin_data(self):
         return copy.deepcopy(self._origin_data)
 
-    def set_publish_plugins(self, attr_plugins):
-        """Set publish plugins attribute definitions."""
+    def set_publish_plugins(self, attr_plugins, attr_defs_by_plugin=None):
+        """Set publish plugins attribute definitions.
+
+        Args:
+            attr_plugins (List[pyblish.api.Plugin]): Pyblish plugins which
+                may contain attribute definitions.
+            attr_defs_by_plugin (Optional[dict[pyblish.api.Plugin,
+                Iterable[AbstractAttrDef]]]): Prepared attribute definitions
+                of plugins, 'get_attribute_defs' of plugin is used if not
+                available.
+        """
+
+        if attr_defs_by_plugin is None:
+            attr_defs_by_plugin = {}
 
         self._plugin_names_order = []
         self._missing_plugins = []
+        self._plugins_changed = True
         self.attr_plugins = attr_plugins or []
 
         origin_data = self._origin_data
@@ -788,9 +913,13 @@ class PublishAttributes:
             output = plugin.convert_attribute_values(data)
             if output is not None:
                 data = output
-            attr_defs = plugin.get_attribute_defs()
+            attr_defs = attr_defs_by_plugin.get(plugin)
+            if attr_defs is None:
+                attr_defs = plugin.get_attribute_defs()
             if not attr_defs:
                 continue
+            # Values container may add definitions to the list
+            attr_defs = list(attr_defs)
 
             key = plugin.__name__
             added_keys.add(key)
@@ -820,18 +949,42 @@ class PublishAttributes:
         }
 
     def deserialize_attributes(self, data):
-        self._plugin_names_order = data["plugin_names_order"]
-        self._missing_plugins = data["missing_plugins"]
+        attr_defs_by_plugin_name = {
+            plugin_name: deserialize_attr_defs(attr_defs_data)
+            for plugin_name, attr_defs_data in data["attr_defs"].items()
+        }
+        self.set_deserialized_attr_defs(
+            attr_defs_by_plugin_name,
+            data["plugin_names_order"],
+            data["missing_plugins"],
+        )
 
-        attr_defs = deserialize_attr_defs(data["attr_defs"])
+    def set_deserialized_attr_defs(
+        self, attr_defs_by_plugin_name, plugin_names_order, missing_plugins
+    ):
+        """Set attribute definitions received from remote process.
+
+        Args:
+            attr_defs_by_plugin_name (dict[str, list[AbstractAttrDef]]):
+                Attribute definitions by plugin name.
+            plugin_names_order (list[str]): Order of plugin names.
+            missing_plugins (list[str]): Plugin names which are not
+                available.
+        """
+
+        self._plugin_names_order = list(plugin_names_order)
+        self._missing_plugins = list(missing_plugins)
+        self._plugins_changed = True
 
         origin_data = self._origin_data
         data = self._data
         self._data = {}
 
         added_keys = set()
-        for plugin_name, attr_defs_data in attr_defs.items():
-            attr_defs = deserialize_attr_defs(attr_defs_data)
+        for plugin_name, attr_defs in attr_defs_by_plugin_name.items():
+            added_keys.add(plugin_name)
+            # Values container may add definitions to the list
+            attr_defs = list(attr_defs)
             value = data.get(plugin_name) or {}
             orig_value = copy.deepcopy(origin_data.get(plugin_name) or {})
             self._data[plugin_name] = PublishAttributeValues(
@@ -840,7 +993,8 @@ class PublishAttributes:
 
         for key, value in data.items():
             if key not in added_keys:
-                self._missing_plugins.append(key)
+                if key not in self._missing_plugins:
+                    self._missing_plugins.append(key)
                 self._data[key] = PublishAttributeValues(
                     self, [], value, value
                 )
@@ -911,6 +1065,13 @@ class CreatedInstance:
         # Data that can be used for lifetime of object
         self._transient_data = {}
 
+        # Keys that were changed since the instance was marked as
+        #   unchanged, 'None' if full comparison of data is needed
+        self._changed_keys = None
+        # Keys with mutable values that were accessed, the values
+        #   could be changed in place
+        self._exposed_keys = set()
+
         # Create a copy of passed data to avoid changing them on the fly
         data = copy.deepcopy(data or {})
 
@@ -993,7 +1154,9 @@ class CreatedInstance:
 
     # --- Dictionary like methods ---
     def __getitem__(self, key):
-        return self._data[key]
+        value = self._data[key]
+        self._track_exposed_value(key, value)
+        return value
 
     def __contains__(self, key):
         return key in self._data
@@ -1002,13 +1165,18 @@ class CreatedInstance:
         # Validate immutable keys
         if key not in self.__immutable_keys:
             self._data[key] = value
+            if self._changed_keys is not None:
+                self._changed_keys.add(key)
+            self._track_exposed_value(key, value)
 
         elif value != self._data.get(key):
             # Raise exception if key is immutable and value has changed
             raise ImmutableKeyError(key)
 
     def get(self, key, default=None):
-        return self._data.get(key, default)
+        if key not in self._data:
+            return default
+        return self[key]
 
     def pop(self, key, *args, **kwargs):
         # Raise exception if is trying to pop key which is immutable
@@ -1016,14 +1184,18 @@ class CreatedInstance:
             raise ImmutableKeyError(key)
 
         self._data.pop(key, *args, **kwargs)
+        if self._changed_keys is not None:
+            self._changed_keys.add(key)
 
     def keys(self):
         return self._data.keys()
 
     def values(self):
+        self._track_exposed_values()
         return self._data.values()
 
     def items(self):
+        self._track_exposed_values()
         return self._data.items()
     # ------
 
@@ -1108,9 +1280,63 @@ class CreatedInstance:
         return self._transient_data
 
     def changes(self):
-        """Calculate and return changes."""
+        """Calculate and return changes.
+
+        Use 'has_changes' to check if there are any changes, which is
+        faster for instances which did not change.
+
+        Returns:
+            TrackChangesItem: Changes of instance data.
+        """
+
+        changes = TrackChangesItem(self.origin_data, self._data_to_store())
+        if not changes:
+            self._mark_as_unchanged()
+        return changes
+
+    def has_changes(self):
+        """Instance has changes.
+
+        Faster alternative of 'changes' to check if there are any changes.
+        Full comparison of data is done only until instance is known to be
+        unchanged. After that only keys that were changed, or which mutable
+        values were accessed, are compared with origin data.
+
+        Returns:
+            bool: Instance data are different from origin data.
+        """
+
+        # Publish plugins were changed, or instance was not yet compared
+        if (
+            self._changed_keys is None
+            or self.publish_attributes._plugins_changed
+        ):
+            if self.origin_data != self._data_to_store():
+                return True
+            self._mark_as_unchanged()
+            return False
+
+        for key in self._changed_keys | self._exposed_keys:
+            if key in ("creator_attributes", "publish_attributes"):
+                continue
+            origin_value = self._orig_data.get(key, _EMPTY_VALUE)
+            if origin_value != self._data.get(key, _EMPTY_VALUE):
+                return True
+
+        return (
+            self.creator_attributes.has_tracked_changes()
+            or self.publish_attributes.has_tracked_changes()
+        )
+
+    def _mark_as_unchanged(self):
+        """Instance is known to be same as origin data.
+
+        Only keys changed from now on have to be compared in 'has_changes'.
+        """
 
-        return TrackChangesItem(self.origin_data, self.data_to_store())
+        self._changed_keys = set()
+        self.creator_attributes.clear_tracked_changes()
+        self.publish_attributes.clear_tracked_changes()
 
     def mark_as_stored(self):
         """Should be called when instance data are stored.
@@ -1118,6 +1344,8 @@ class CreatedInstance:
         Origin data are replaced by current data so changes are cleared.
         """
 
+        self._changed_keys = set()
+
         orig_keys = set(self._orig_data.keys())
         for key, value in self._data.items():
             orig_keys.discard(key)
@@ -1130,6 +1358,8 @@ class CreatedInstance:
 
         self.creator_attributes.mark_as_stored()
         self.publish_attributes.mark_as_stored()
+        self.creator_attributes.clear_tracked_changes()
+        self.publish_attributes.clear_tracked_changes()
 
     @property
     def creator_attributes(self):
@@ -1162,15 +1392,26 @@ class CreatedInstance:
             OrderedDict: Ordered dictionary with instance data.
         """
 
+        self._track_exposed_values()
+        output = self._data_to_store()
+        output["creator_attributes"] = self.creator_attributes.data_to_store()
+        output["publish_attributes"] = self.publish_attributes.data_to_store()
+
+        return output
+
+    def _data_to_store(self):
         output = collections.OrderedDict()
         for key, value in self._data.items():
             if key in ("creator_attributes", "publish_attributes"):
                 continue
             output[key] = value
 
-        output["creator_attributes"] = self.creator_attributes.data_to_store()
-        output["publish_attributes"] = self.publish_attributes.data_to_store()
-
+        output["creator_attributes"] = (
+            self.creator_attributes._data_to_store()
+        )
+        output["publish_attributes"] = (
+            self.publish_attributes._data_to_store()
+        )
         return output
 
     @classmethod
@@ -1199,7 +1440,7 @@ class CreatedInstance:
             product_type, product_name, instance_data, creator
         )
 
-    def set_publish_plugins(self, attr_plugins):
+    def set_publish_plugins(self, attr_plugins, attr_defs_by_plugin=None):
         """Set publish plugins with attribute definitions.
 
         This method should be called only from 'CreateContext'.
@@ -1208,9 +1449,23 @@ class CreatedInstance:
             attr_plugins (List[pyblish.api.Plugin]): Pyblish plugins which
                 inherit from 'AYONPyblishPluginMixin' and may contain
                 attribute definitions.
+            attr_defs_by_plugin (Optional[dict[pyblish.api.Plugin,
+                Iterable[AbstractAttrDef]]]): Cached attribute definitions
+                of plugins. Definitions are shared with other instances
+                and must not be modified.
         """
 
-        self.publish_attributes.set_publish_plugins(attr_plugins)
+        self.publish_attributes.set_publish_plugins(
+            attr_plugins, attr_defs_by_plugin
+        )
+
+    def _track_exposed_value(self, key, value):
+        if not isinstance(value, _IMMUTABLE_TYPES):
+            self._exposed_keys.add(key)
+
+    def _track_exposed_values(self):
+        for key, value in self._data.items():
+            self._track_exposed_value(key, value)
 
     def add_members(self, members):
         """Currently unused method."""
@@ -1250,19 +1505,60 @@ class CreatedInstance:
                 recreating. Should contain 'data' and 'orig_data'.
         """
 
-        instance_data = copy.deepcopy(serialized_data["data"])
+        publish_attributes = serialized_data["publish_attributes"]
+        return cls._create_on_remote(
+            serialized_data["data"],
+            serialized_data["orig_data"],
+            serialized_data["creator_label"],
+            serialized_data["group_label"],
+            deserialize_attr_defs(serialized_data["creator_attr_defs"]),
+            {
+                plugin_name: deserialize_attr_defs(attr_defs_data)
+                for plugin_name, attr_defs_data in (
+                    publish_attributes["attr_defs"].items()
+                )
+            },
+            publish_attributes["plugin_names_order"],
+            publish_attributes["missing_plugins"],
+        )
+
+    @classmethod
+    def _create_on_remote(
+        cls,
+        data,
+        orig_data,
+        creator_label,
+        group_label,
+        creator_attr_defs,
+        publish_attr_defs_by_plugin_name,
+        plugin_names_order,
+        missing_plugins,
+    ):
+        """Create instance in remote process from deserialized data.
+
+        Args:
+            data (dict[str, Any]): Instance data.
+            orig_data (dict[str, Any]): Original instance data.
+            creator_label (str): Label of creator.
+            group_label (str): Group label of instance.
+            creator_attr_defs (list[AbstractAttrDef]): Creator attribute
+                definitions.
+            publish_attr_defs_by_plugin_name (dict[str,
+                list[AbstractAttrDef]]): Publish attribute definitions by
+                plugin name.
+            plugin_names_order (list[str]): Order of publish plugin names.
+            missing_plugins (list[str]): Missing publish plugin names.
+
+        Returns:
+            CreatedInstance: Instance in remote process.
+        """
+
+        instance_data = copy.deepcopy(data)
         creator_identifier = instance_data["creator_identifier"]
 
         product_type = instance_data["productType"]
         product_name = instance_data.get("productName", None)
 
-        creator_label = serialized_data["creator_label"]
-        group_label = serialized_data["group_label"]
-        creator_attr_defs = deserialize_attr_defs(
-            serialized_data["creator_attr_defs"]
-        )
-        publish_attributes = serialized_data["publish_attributes"]
-
         obj = cls(
             product_type,
             product_name,
@@ -1270,10 +1566,15 @@ class CreatedInstance:
             creator_identifier=creator_identifier,
             creator_label=creator_label,
             group_label=group_label,
-            creator_attr_defs=creator_attr_defs
+            creator_attr_defs=list(creator_attr_defs)
+        )
+        obj._orig_data = copy.deepcopy(orig_data)
+        obj._changed_keys = None
+        obj.publish_attributes.set_deserialized_attr_defs(
+            publish_attr_defs_by_plugin_name,
+            plugin_names_order,
+            missing_plugins,
         )
-        obj._orig_data = serialized_data["orig_data"]
-        obj.publish_attributes.deserialize_attributes(publish_attributes)
 
         return obj
 
@@ -1371,6 +1672,14 @@ class CreateContext:
             phase.
     """
 
+    # Lifetime of cached folders and tasks used for validation of
+    #   instances context (in seconds)
+    context_validation_cache_lifetime = 60
+    # Maximum number of threads used to collect instances of creators
+    #   with 'collect_instances_in_thread' enabled
+    # - default of 'ThreadPoolExecutor' is used when set to 'None'
+    collect_instances_max_workers = None
+
     def __init__(
         self, host, headless=False, reset=True, discover_publish_plugins=True
     ):
@@ -1410,6 +1719,12 @@ class CreateContext:
 
         # Instances by their ID
         self._instances_by_id = {}
+        # Instances added by creators collecting in threads are stored
+        #   to buffer of the thread and added to context in main thread
+        self._collection_buffer = threading.local()
+        # Time in seconds spent on collection of instances by creator
+        #   identifier
+        self.creator_collection_times = {}
 
         self.creator_discover_result = None
         self.convertor_discover_result = None
@@ -1430,6 +1745,8 @@ class CreateContext:
         self.publish_plugins = []
         self.plugins_with_defs = []
         self._attr_plugins_by_product_type = {}
+        # Attribute definitions of publish plugins by plugin
+        self._publish_attr_defs_by_plugin = {}
 
         # Helpers for validating context of collected instances
         #   - they can be validation for multiple instances at one time
@@ -1438,8 +1755,22 @@ class CreateContext:
         self._bulk_counter = 0
         self._bulk_instances_to_process = []
 
+        # Cached folders and tasks used for validation of instances context
+        lifetime = self.context_validation_cache_lifetime
+        self._folders_by_path_cache = NestedCacheItem(
+            levels=2, lifetime=lifetime
+        )
+        self._folders_by_name_cache = NestedCacheItem(
+            levels=2, lifetime=lifetime
+        )
+        self._task_names_by_folder_id_cache = NestedCacheItem(
+            levels=2, lifetime=lifetime
+        )
+
         # Shared data across creators during collection phase
         self._collection_shared_data = None
+        # Creators may collect instances in threads at the same time
+        self._collection_shared_data_lock = threading.RLock()
 
         self.thumbnail_paths_by_instance_id = {}
 
@@ -1630,6 +1961,7 @@ class CreateContext:
         """
 
         self.reset_preparation()
+        self.reset_context_validation_cache()
 
         self.reset_current_context()
         self.reset_plugins(discover_publish_plugins)
@@ -1739,6 +2071,7 @@ class CreateContext:
 
         # Reset publish plugins
         self._attr_plugins_by_product_type = {}
+        self._publish_attr_defs_by_plugin = {}
 
         discover_result = DiscoverResult(pyblish.api.Plugin)
         plugins_with_defs = []
@@ -1868,8 +2201,9 @@ class CreateContext:
         publish_attributes = original_data.get("publish_attributes") or {}
 
         attr_plugins = self._get_publish_plugins_with_attr_for_context()
-        self._publish_attributes = PublishAttributes(
-            self, publish_attributes, attr_plugins
+        self._publish_attributes = PublishAttributes(self, publish_attributes)
+        self._publish_attributes.set_publish_plugins(
+            attr_plugins, self._get_publish_attr_defs_by_plugin(attr_plugins)
         )
 
     def context_data_to_store(self):
@@ -1899,6 +2233,14 @@ class CreateContext:
 
         TODO: Rename method to more suit.
         """
+        # Creator is collecting instances in a thread
+        buffered_instances = getattr(
+            self._collection_buffer, "instances", None
+        )
+        if buffered_instances is not None:
+            buffered_instances.append(instance)
+            return
+
         # Add instance to instances list
         if instance.id in self._instances_by_id:
             self.log.warning((
@@ -1911,10 +2253,13 @@ class CreateContext:
         attr_plugins = self._get_publish_plugins_with_attr_for_product_type(
             instance.product_type
         )
-        instance.set_publish_plugins(attr_plugins)
+        attr_defs_by_plugin = self._get_publish_attr_defs_by_plugin(
+            attr_plugins
+        )
+        instance.set_publish_plugins(attr_plugins, attr_defs_by_plugin)
 
-        # Add instance to be validated inside 'bulk_instances_collection'
-        #   context manager if is inside bulk
+        # Add instance to be validated inside
+        #   'bulk_instances_collection' context manager if is inside bulk
         with self.bulk_instances_collection():
             self._bulk_instances_to_process.append(instance)
 
@@ -2143,45 +2488,156 @@ class CreateContext:
             self.validate_instances_context(instances_to_validate)
 
     def reset_instances(self):
-        """Reload instances"""
-        self._instances_by_id = collections.OrderedDict()
+        """Reload instances.
 
-        # Collect instances
-        error_message = "Collection of instances for creator {} failed. {}"
-        failed_info = []
-        for creator in self.sorted_creators:
-            label = creator.label
-            identifier = creator.identifier
-            failed = False
-            add_traceback = False
-            exc_info = None
-            try:
-                creator.collect_instances()
+        Creators with 'collect_instances_in_thread' enabled collect
+        instances in a thread pool, other creators collect instances in
+        the current thread at the same time. Instances collected in
+        threads are added to the context in the current thread.
+        """
+        self._instances_by_id = collections.OrderedDict()
+        self.creator_collection_times = {}
 
-            except CreatorError:
-                failed = True
-                exc_info = sys.exc_info()
-                self.log.warning(error_message.format(identifier, exc_info[1]))
+        sorted_creators = self.sorted_creators
+        thread_creators = [
+            creator
+            for creator in sorted_creators
+            if creator.collect_instances_in_thread
+        ]
 
-            except:  # noqa: E722
-                failed = True
-                add_traceback = True
-                exc_info = sys.exc_info()
-                self.log.warning(
-                    error_message.format(identifier, ""),
-                    exc_info=True
+        # Collect instances
+        failed_info_by_identifier = {}
+        executor = None
+        futures = []
+        if thread_creators:
+            # Collection is usually IO bound, use default of executor
+            max_workers = self.collect_instances_max_workers
+            if max_workers is None:
+                max_workers = min(32, (os.cpu_count() or 1) + 4)
+            executor = ThreadPoolExecutor(
+                max_workers=min(max_workers, len(thread_creators))
+            )
+            futures = [
+                executor.submit(
+                    self._collect_creator_instances_in_thread, creator
                 )
+                for creator in thread_creators
+            ]
 
-            if failed:
-                failed_info.append(
-                    prepare_failed_creator_operation_info(
-                        identifier, label, exc_info, add_traceback
+        try:
+            for creator in sorted_creators:
+                if creator.collect_instances_in_thread:
+                    continue
+                failed_info = self._collect_creator_instances(creator)
+                if failed_info is not None:
+                    failed_info_by_identifier[creator.identifier] = (
+                        failed_info
                     )
-                )
 
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        for creator, future in zip(thread_creators, futures):
+            failed_info, instances = future.result()
+            for instance in instances:
+                self.creator_adds_instance(instance)
+            if failed_info is not None:
+                failed_info_by_identifier[creator.identifier] = failed_info
+
+        if thread_creators:
+            # Keep order of instances as if collected one by one
+            instances_by_identifier = collections.defaultdict(list)
+            for instance in self._instances_by_id.values():
+                instances_by_identifier[instance.creator_identifier].append(
+                    instance
+                )
+            instances_by_id = collections.OrderedDict()
+            for creator in sorted_creators:
+                for instance in instances_by_identifier.pop(
+                    creator.identifier, []
+                ):
+                    instances_by_id[instance.id] = instance
+
+            for instances in instances_by_identifier.values():
+                for instance in instances:
+                    instances_by_id[instance.id] = instance
+            self._instances_by_id = instances_by_id
+
+        failed_info = [
+            failed_info_by_identifier[creator.identifier]
+            for creator in sorted_creators
+            if creator.identifier in failed_info_by_identifier
+        ]
         if failed_info:
             raise CreatorsCollectionFailed(failed_info)
 
+    def _collect_creator_instances_in_thread(self, creator):
+        """Collect instances of a creator in a worker thread.
+
+        Instances are not added to the context, they're returned to be
+        added in main thread.
+
+        Args:
+            creator (BaseCreator): Creator which collects instances.
+
+        Returns:
+            tuple[Union[dict[str, Any], None], list[CreatedInstance]]:
+                Information about failed collection and collected instances.
+        """
+
+        instances = []
+        self._collection_buffer.instances = instances
+        try:
+            failed_info = self._collect_creator_instances(creator)
+        finally:
+            self._collection_buffer.instances = None
+        return failed_info, instances
+
+    def _collect_creator_instances(self, creator):
+        """Collect instances of a creator.
+
+        Args:
+            creator (BaseCreator): Creator which collects instances.
+
+        Returns:
+            Union[dict[str, Any], None]: Information about failed
+                collection or 'None' if collection was successful.
+        """
+
+        error_message = "Collection of instances for creator {} failed. {}"
+        label = creator.label
+        identifier = creator.identifier
+        failed = False
+        add_traceback = False
+        exc_info = None
+        start_time = time.perf_counter()
+        try:
+            creator.collect_instances()
+
+        except CreatorError:
+            failed = True
+            exc_info = sys.exc_info()
+            self.log.warning(error_message.format(identifier, exc_info[1]))
+
+        except:  # noqa: E722
+            failed = True
+            add_traceback = True
+            exc_info = sys.exc_info()
+            self.log.warning(
+                error_message.format(identifier, ""),
+                exc_info=True
+            )
+
+        self.creator_collection_times[identifier] = (
+            time.perf_counter() - start_time
+        )
+        if failed:
+            return prepare_failed_creator_operation_info(
+                identifier, label, exc_info, add_traceback
+            )
+        return None
+
     def find_convertor_items(self):
         """Go through convertor plugins to look for items to convert.
 
@@ -2241,61 +2697,38 @@ class CreateContext:
 
         project_name = self.project_name
 
-        task_names_by_folder_path = {}
-        for instance in instances:
-            folder_path = instance.get("folderPath")
-            task_name = instance.get("task")
-            if folder_path:
-                task_names_by_folder_path[folder_path] = set()
-                if task_name:
-                    task_names_by_folder_path[folder_path].add(task_name)
-
         # Backwards compatibility for cases where folder name is set instead
         #   of folder path
         folder_names = set()
         folder_paths = set()
-        for folder_path in task_names_by_folder_path.keys():
-            if folder_path is None:
-                pass
-            elif "/" in folder_path:
+        for instance in instances:
+            folder_path = instance.get("folderPath")
+            if not folder_path:
+                continue
+            if "/" in folder_path:
                 folder_paths.add(folder_path)
             else:
                 folder_names.add(folder_path)
 
-        folder_paths_by_id = {}
-        if folder_paths:
-            for folder_entity in ayon_api.get_folders(
-                project_name,
-                folder_paths=folder_paths,
-                fields={"id", "path"}
-            ):
-                folder_id = folder_entity["id"]
-                folder_paths_by_id[folder_id] = folder_entity["path"]
-
-        folder_entities_by_name = collections.defaultdict(list)
-        if folder_names:
-            for folder_entity in ayon_api.get_folders(
-                project_name,
-                folder_names=folder_names,
-                fields={"id", "name", "path"}
-            ):
-                folder_id = folder_entity["id"]
-                folder_name = folder_entity["name"]
-                folder_paths_by_id[folder_id] = folder_entity["path"]
-                folder_entities_by_name[folder_name].append(folder_entity)
+        folder_entities_by_name = self._get_folders_by_name(
+            project_name, folder_names
+        )
+        for folder_entities in folder_entities_by_name.values():
+            if len(folder_entities) == 1:
+                folder_paths.add(folder_entities[0]["path"])
 
-        tasks_entities = ayon_api.get_tasks(
+        folder_entities_by_path = self._get_folders_by_path(
+            project_name, folder_paths
+        )
+        task_names_by_folder_id = self._get_task_names_by_folder_id(
             project_name,
-            folder_ids=folder_paths_by_id.keys(),
-            fields={"name", "folderId"}
+            {
+                folder_entity["id"]
+                for folder_entity in folder_entities_by_path.values()
+                if folder_entity is not None
+            }
         )
 
-        task_names_by_folder_path = collections.defaultdict(set)
-        for task_entity in tasks_entities:
-            folder_id = task_entity["folderId"]
-            folder_path = folder_paths_by_id[folder_id]
-            task_names_by_folder_path[folder_path].add(task_entity["name"])
-
         for instance in instances:
             if not instance.has_valid_folder or not instance.has_valid_task:
                 continue
@@ -2303,11 +2736,12 @@ class CreateContext:
             folder_path = instance["folderPath"]
             if folder_path and "/" not in folder_path:
                 folder_entities = folder_entities_by_name.get(folder_path)
-                if len(folder_entities) == 1:
+                if folder_entities and len(folder_entities) == 1:
                     folder_path = folder_entities[0]["path"]
                     instance["folderPath"] = folder_path
 
-            if folder_path not in task_names_by_folder_path:
+            folder_entity = folder_entities_by_path.get(folder_path)
+            if folder_entity is None:
                 instance.set_folder_invalid(True)
                 continue
 
@@ -2315,9 +2749,147 @@ class CreateContext:
             if not task_name:
                 continue
 
-            if task_name not in task_names_by_folder_path[folder_path]:
+            task_names = task_names_by_folder_id[folder_entity["id"]]
+            if task_name not in task_names:
                 instance.set_task_invalid(True)
 
+    def reset_context_validation_cache(self):
+        """Reset cached folders and tasks used to validate instances context.
+
+        Should be called when folders or tasks were created or changed
+            on server.
+        """
+
+        self._folders_by_path_cache.reset()
+        self._folders_by_name_cache.reset()
+        self._task_names_by_folder_id_cache.reset()
+
+    def _get_folders_by_path(self, project_name, folder_paths):
+        """Get folders by paths using cache.
+
+        Folders which are not cached are queried in one request.
+
+        Args:
+            project_name (str): Project name.
+            folder_paths (Iterable[str]): Folder paths.
+
+        Returns:
+            dict[str, Union[dict[str, Any], None]]: Folder entities with
+                'id' and 'path' by path. Value is 'None' if folder does
+                not exist.
+        """
+
+        project_cache = self._folders_by_path_cache[project_name]
+        output = {}
+        missing_paths = set()
+        for folder_path in folder_paths:
+            cache = project_cache[folder_path]
+            if cache.is_valid:
+                output[folder_path] = cache.get_data()
+            else:
+                missing_paths.add(folder_path)
+
+        if not missing_paths:
+            return output
+
+        for folder_path in missing_paths:
+            output[folder_path] = None
+
+        for folder_entity in ayon_api.get_folders(
+            project_name,
+            folder_paths=missing_paths,
+            fields={"id", "path"}
+        ):
+            output[folder_entity["path"]] = folder_entity
+
+        for folder_path in missing_paths:
+            project_cache[folder_path].update_data(output[folder_path])
+        return output
+
+    def _get_folders_by_name(self, project_name, folder_names):
+        """Get folders by names using cache.
+
+        Folders which are not cached are queried in one request.
+
+        Args:
+            project_name (str): Project name.
+            folder_names (Iterable[str]): Folder names.
+
+        Returns:
+            dict[str, list[dict[str, Any]]]: Folder entities with 'id' and
+                'path' by folder name.
+        """
+
+        project_cache = self._folders_by_name_cache[project_name]
+        output = {}
+        missing_names = set()
+        for folder_name in folder_names:
+            cache = project_cache[folder_name]
+            if cache.is_valid:
+                output[folder_name] = cache.get_data()
+            else:
+                missing_names.add(folder_name)
+
+        if not missing_names:
+            return output
+
+        for folder_name in missing_names:
+            output[folder_name] = []
+
+        paths_cache = self._folders_by_path_cache[project_name]
+        for folder_entity in ayon_api.get_folders(
+            project_name,
+            folder_names=missing_names,
+            fields={"id", "name", "path"}
+        ):
+            folder_name = folder_entity.pop("name")
+            output[folder_name].append(folder_entity)
+            paths_cache[folder_entity["path"]].update_data(folder_entity)
+
+        for folder_name in missing_names:
+            project_cache[folder_name].update_data(output[folder_name])
+        return output
+
+    def _get_task_names_by_folder_id(self, project_name, folder_ids):
+        """Get task names of folders using cache.
+
+        Tasks of folders which are not cached are queried in one request.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+
+        Returns:
+            dict[str, set[str]]: Task names by folder id.
+        """
+
+        project_cache = self._task_names_by_folder_id_cache[project_name]
+        output = {}
+        missing_ids = set()
+        for folder_id in folder_ids:
+            cache = project_cache[folder_id]
+            if cache.is_valid:
+                output[folder_id] = cache.get_data()
+            else:
+                missing_ids.add(folder_id)
+
+        if not missing_ids:
+            return output
+
+        for folder_id in missing_ids:
+            output[folder_id] = set()
+
+        for task_entity in ayon_api.get_tasks(
+            project_name,
+            folder_ids=missing_ids,
+            fields={"name", "folderId"}
+        ):
+            output[task_entity["folderId"]].add(task_entity["name"])
+
+        for folder_id in missing_ids:
+            project_cache[folder_id].update_data(output[folder_id])
+        return output
+
     def save_changes(self):
         """Save changes. Update all changed values."""
         if not self.host_is_valid:
@@ -2338,9 +2910,10 @@ class CreateContext:
         """Save instance specific values."""
         instances_by_identifier = collections.defaultdict(list)
         for instance in self._instances_by_id.values():
-            instance_changes = instance.changes()
-            if not instance_changes:
+            # Only keys which could change are compared
+            if not instance.has_changes():
                 continue
+            instance_changes = instance.changes()
 
             identifier = instance.creator_identifier
             instances_by_identifier[identifier].append(
@@ -2483,6 +3056,32 @@ class CreateContext:
 
         return self._attr_plugins_by_product_type[product_type]
 
+    def _get_publish_attr_defs_by_plugin(self, attr_plugins):
+        """Attribute definitions of publish plugins.
+
+        Definitions don't depend on instance, so they are cached by plugin
+        until publish plugins are reset. The same definition objects are
+        shared by context and all instances, they must be treated as
+        immutable.
+
+        Args:
+            attr_plugins (List[pyblish.api.Plugin]): Publish plugins with
+                attribute definitions.
+
+        Returns:
+            dict[pyblish.api.Plugin, tuple[AbstractAttrDef]]: Attribute
+                definitions by plugin.
+        """
+
+        output = {}
+        for plugin in attr_plugins:
+            attr_defs = self._publish_attr_defs_by_plugin.get(plugin)
+            if attr_defs is None:
+                attr_defs = tuple(plugin.get_attribute_defs() or [])
+                self._publish_attr_defs_by_plugin[plugin] = attr_defs
+            output[plugin] = attr_defs
+        return output
+
     def _get_publish_plugins_with_attr_for_context(self):
         """Publish plugins attributes for Context plugins.
 
@@ -2514,6 +3113,20 @@ class CreateContext:
             )
         return self._collection_shared_data
 
+    @property
+    def collection_shared_data_lock(self):
+        """Lock for access to shared data during collection.
+
+        Creators with 'collect_instances_in_thread' enabled collect
+        instances at the same time as other creators. Shared data should
+        be read and filled under this lock.
+
+        Returns:
+            threading.RLock: Lock of collection shared data.
+        """
+
+        return self._collection_shared_data_lock
+
     def run_convertor(self, convertor_identifier):
         """Run convertor plugin by identifier.
 
@@ -194,6 +194,15 @@ class BaseCreator:
     # QUESTION make this required?
     host_name = None
 
+    # Instances can be collected in a thread in parallel with other creators
+    # - collection must not use host api, or the api must be thread safe
+    # - collection must not access instances of create context, instances
+    #   are added to the context in main thread after collection
+    # - 'collection_shared_data' must be accessed under
+    #   'collection_shared_data_lock' (see 'cache_and_get_instances')
+    # - instances are still collected in main thread when set to 'False'
+    collect_instances_in_thread = False
+
     # Settings auto-apply helpers
     # Root key in project settings (mandatory for auto-apply to work)
     settings_category = None
@@ -571,6 +580,16 @@ class BaseCreator:
 
         return self.create_context.collection_shared_data
 
+    @property
+    def collection_shared_data_lock(self):
+        """Lock for access to shared data during creator's collection.
+
+        Returns:
+            threading.RLock: Lock of collection shared data.
+        """
+
+        return self.create_context.collection_shared_data_lock
+
     def set_instance_thumbnail_path(self, instance_id, thumbnail_path=None):
         """Set path to thumbnail for instance."""
 
@@ -907,7 +926,9 @@ def cache_and_get_instances(creator, shared_key, list_instances_func):
     we've decided to unify it to some degree.
 
     Function 'list_instances_func' is called only if 'shared_key' is not
-    available in 'collection_shared_data' on creator.
+    available in 'collection_shared_data' on creator. Shared data are
+    accessed under lock, so the function is called only once also when
+    creators collect instances in threads.
 
     Args:
         creator (Creator): Plugin which would like to get instance data.
@@ -920,10 +941,11 @@ def cache_and_get_instances(creator, shared_key, list_instances_func):
             result of passed function.
     """
 
-    if shared_key not in creator.collection_shared_data:
-        value = collections.defaultdict(list)
-        for instance in list_instances_func():
-            identifier = instance.get("creator_identifier")
-            value[identifier].append(instance)
-        creator.collection_shared_data[shared_key] = value
-    return creator.collection_shared_data[shared_key]
+    with creator.collection_shared_data_lock:
+        if shared_key not in creator.collection_shared_data:
+            value = collections.defaultdict(list)
+            for instance in list_instances_func():
+                identifier = instance.get("creator_identifier")
+                value[identifier].append(instance)
+            creator.collection_shared_data[shared_key] = value
+        return creator.collection_shared_data[shared_key]
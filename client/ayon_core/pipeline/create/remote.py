@@ -0,0 +1,260 @@
+"""Compact wire format of created instances for remote publisher UI.
+
+Hosts with remote publisher UI (e.g. UI in separate process connected over
+websocket) send created instances to the UI on each refresh. This module
+defines versioned compact format of the transport:
+- attribute definitions are sent only once and instances reference them
+    by content hash
+- instances are sent as lists instead of dictionaries with repeated keys
+- instances which the UI already has in the same state are not sent again,
+    only their id is sent in place of the instance item
+
+The payload contains only JSON serializable types, so it can be sent
+through JSON-RPC without additional conversion.
+
+Example:
+    ```python
+    # Host side - 'known_hashes' are received from UI
+    payload = serialize_instances_for_remote(
+        create_context.instances, known_hashes
+    )
+
+    # UI side - hashes of instances without local changes should be sent
+    #   with next request
+    known_hashes = get_known_instance_hashes(instances_by_id, hashes)
+    instances_by_id, hashes = deserialize_instances_on_remote(
+        payload, instances_by_id, hashes
+    )
+    ```
+"""
+import copy
+import json
+import hashlib
+
+from ayon_core.lib.attribute_definitions import (
+    serialize_attr_def,
+    deserialize_attr_def,
+)
+
+from .context import CreatedInstance
+
+REMOTE_FORMAT_VERSION = 1
+
+# Indexes of instance item in payload
+_ITEM_ID = 0
+_ITEM_HASH = 1
+_ITEM_DATA = 2
+_ITEM_ORIG_DATA = 3
+_ITEM_CREATOR_LABEL = 4
+_ITEM_GROUP_LABEL = 5
+_ITEM_CREATOR_ATTR_DEFS = 6
+_ITEM_PUBLISH_ATTR_DEFS = 7
+_ITEM_PLUGIN_NAMES_ORDER = 8
+_ITEM_MISSING_PLUGINS = 9
+
+
+def _get_data_hash(data):
+    content = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.md5(content.encode("utf-8")).hexdigest()
+
+
+class _AttrDefsSerializer:
+    """Serialize attribute definitions once and reference them by hash."""
+
+    def __init__(self):
+        self.attr_defs_by_hash = {}
+        self._hash_by_attr_def_id = {}
+
+    def get_attr_def_hashes(self, attr_defs):
+        output = []
+        for attr_def in attr_defs:
+            attr_def_hash = self._hash_by_attr_def_id.get(attr_def.id)
+            if attr_def_hash is None:
+                data = serialize_attr_def(attr_def)
+                attr_def_hash = _get_data_hash(data)
+                self._hash_by_attr_def_id[attr_def.id] = attr_def_hash
+                self.attr_defs_by_hash[attr_def_hash] = data
+            output.append(attr_def_hash)
+        return output
+
+
+def serialize_instances_for_remote(instances, known_hashes=None):
+    """Serialize instances to compact payload for remote process.
+
+    Args:
+        instances (Iterable[CreatedInstance]): Instances to serialize.
+        known_hashes (Optional[dict[str, str]]): Hashes of instances by
+            instance id which remote process already has. Instances with
+            matching hash are not sent.
+
+    Returns:
+        dict[str, Any]: Payload for remote process.
+    """
+
+    if known_hashes is None:
+        known_hashes = {}
+
+    attr_defs_serializer = _AttrDefsSerializer()
+    items = []
+    used_attr_def_hashes = set()
+    for instance in instances:
+        publish_attributes = instance.publish_attributes
+        data = instance.data_to_store()
+        orig_data = instance.origin_data
+        creator_attr_def_hashes = attr_defs_serializer.get_attr_def_hashes(
+            instance.creator_attributes.attr_defs
+        )
+        publish_attr_def_hashes = {
+            plugin_name: attr_defs_serializer.get_attr_def_hashes(
+                attr_values.attr_defs
+            )
+            for plugin_name, attr_values in publish_attributes.items()
+        }
+        item = [
+            instance.id,
+            None,
+            data,
+            # Don't send the same data twice
+            None if orig_data == data else orig_data,
+            instance.creator_label,
+            instance.group_label,
+            creator_attr_def_hashes,
+            publish_attr_def_hashes,
+            list(publish_attributes.plugin_names_order()),
+            publish_attributes.missing_plugins,
+        ]
+        item_hash = _get_data_hash(item)
+        if known_hashes.get(instance.id) == item_hash:
+            items.append(instance.id)
+            continue
+
+        item[_ITEM_HASH] = item_hash
+        items.append(item)
+        used_attr_def_hashes.update(creator_attr_def_hashes)
+        for attr_def_hashes in publish_attr_def_hashes.values():
+            used_attr_def_hashes.update(attr_def_hashes)
+
+    return {
+        "version": REMOTE_FORMAT_VERSION,
+        "attr_defs": {
+            attr_def_hash: attr_def_data
+            for attr_def_hash, attr_def_data in (
+                attr_defs_serializer.attr_defs_by_hash.items()
+            )
+            if attr_def_hash in used_attr_def_hashes
+        },
+        "instances": items,
+    }
+
+
+def get_known_instance_hashes(instances_by_id, hashes_by_id):
+    """Hashes of instances which remote process can reuse.
+
+    Instance with changes may not be in the same state as on host, so
+    its hash is not returned and host sends it again.
+
+    Args:
+        instances_by_id (dict[str, CreatedInstance]): Instances which remote
+            process has by id.
+        hashes_by_id (dict[str, str]): Hashes of instances by id, returned
+            by 'deserialize_instances_on_remote'.
+
+    Returns:
+        dict[str, str]: Hashes by instance id which should be sent to host.
+    """
+
+    return {
+        instance_id: hash_value
+        for instance_id, hash_value in hashes_by_id.items()
+        if (
+            instance_id in instances_by_id
+            and not instances_by_id[instance_id].has_changes()
+        )
+    }
+
+
+def deserialize_instances_on_remote(
+    payload, current_instances=None, current_hashes=None
+):
+    """Recreate instances from payload in remote process.
+
+    Args:
+        payload (dict[str, Any]): Payload created with
+            'serialize_instances_for_remote'.
+        current_instances (Optional[dict[str, CreatedInstance]]): Instances
+            which remote process already has by id. Used for instances
+            which were not changed, see 'get_known_instance_hashes'.
+        current_hashes (Optional[dict[str, str]]): Hashes of current
+            instances by id, returned by previous call.
+
+    Returns:
+        tuple[dict[str, CreatedInstance], dict[str, str]]: Instances by id
+            and their hashes by id which should be sent with next request.
+
+    Raises:
+        ValueError: Payload has unsupported version, or unchanged instance
+            is not available in current instances.
+    """
+
+    version = payload.get("version")
+    if version != REMOTE_FORMAT_VERSION:
+        raise ValueError(
+            "Unsupported version of instances payload: {}".format(version)
+        )
+
+    if current_instances is None:
+        current_instances = {}
+
+    if current_hashes is None:
+        current_hashes = {}
+
+    # Attribute definitions are deserialized only once and shared
+    attr_defs_by_hash = {
+        attr_def_hash: deserialize_attr_def(copy.deepcopy(attr_def_data))
+        for attr_def_hash, attr_def_data in payload["attr_defs"].items()
+    }
+
+    instances_by_id = {}
+    hashes_by_id = {}
+    for item in payload["instances"]:
+        # Only id is sent for unchanged instances
+        if isinstance(item, str):
+            instance = current_instances.get(item)
+            hash_value = current_hashes.get(item)
+            if instance is None or hash_value is None:
+                raise ValueError(
+                    "Unchanged instance '{}' is not available.".format(item)
+                )
+            instances_by_id[item] = instance
+            hashes_by_id[item] = hash_value
+            continue
+
+        data = item[_ITEM_DATA]
+        orig_data = item[_ITEM_ORIG_DATA]
+        if orig_data is None:
+            orig_data = data
+        instance = CreatedInstance._create_on_remote(
+            data,
+            orig_data,
+            item[_ITEM_CREATOR_LABEL],
+            item[_ITEM_GROUP_LABEL],
+            [
+                attr_defs_by_hash[attr_def_hash]
+                for attr_def_hash in item[_ITEM_CREATOR_ATTR_DEFS]
+            ],
+            {
+                plugin_name: [
+                    attr_defs_by_hash[attr_def_hash]
+                    for attr_def_hash in attr_def_hashes
+                ]
+                for plugin_name, attr_def_hashes in (
+                    item[_ITEM_PUBLISH_ATTR_DEFS].items()
+                )
+            },
+            item[_ITEM_PLUGIN_NAMES_ORDER],
+            item[_ITEM_MISSING_PLUGINS],
+        )
+        instances_by_id[item[_ITEM_ID]] = instance
+        hashes_by_id[item[_ITEM_ID]] = item[_ITEM_HASH]
+
+    return instances_by_id, hashes_by_id
@@ -1,12 +1,11 @@
 """Functions useful for delivery of published representations."""
 import os
 import copy
-import shutil
 import glob
 import clique
 import collections
 
-from ayon_core.lib import create_hard_link
+from ayon_core.lib import create_hard_link, copy_file
 
 
 def _copy_file(src_path, dst_path):
@@ -24,7 +23,7 @@ def _copy_file(src_path, dst_path):
             dst_path
         )
     except OSError:
-        shutil.copyfile(src_path, dst_path)
+        copy_file(src_path, dst_path)
 
 
 def get_format_dict(anatomy, location_path):
@@ -1,4 +1,5 @@
 import os
+import time
 import inspect
 import traceback
 
@@ -25,6 +26,8 @@ class DiscoverResult:
         self.duplicated_plugins = []
         self.abstract_plugins = []
         self.ignored_plugins = set()
+        # Time in seconds spent on discovery of each path
+        self.discover_times = {}
         # Store loaded modules to keep them in memory
         self._modules = set()
 
@@ -42,9 +45,28 @@ class DiscoverResult:
         """Add dynamically loaded python module to keep it in memory."""
         self._modules.add(module)
 
+    def add_discover_time(self, path, start_time):
+        """Store time spent on discovery of a path.
+
+        Args:
+            path (str): Discovered path.
+            start_time (float): Time when discovery of the path started.
+                Value of 'time.perf_counter'.
+        """
+        self.discover_times[path] = time.perf_counter() - start_time
+
     def get_report(self, only_errors=True, exc_info=True, full_report=False):
         lines = []
         if not only_errors:
+            # Time spent on discovery of paths
+            if self.discover_times or full_report:
+                lines.append("*** Discovery of {} paths took {:.3f}s".format(
+                    len(self.discover_times),
+                    sum(self.discover_times.values())
+                ))
+                for path, duration in self.discover_times.items():
+                    lines.append("- {:.3f}s {}".format(duration, path))
+
             # Successfully discovered plugins
             if self.plugins or full_report:
                 lines.append(
@@ -168,6 +190,7 @@ class PluginDiscoverContext(object):
 
         # Include plug-ins from registered paths
         for path in registered_paths:
+            start_time = time.perf_counter()
             modules, crashed = modules_from_path(path)
             for item in crashed:
                 filepath, exc_info = item
@@ -193,6 +216,7 @@ class PluginDiscoverContext(object):
                         plugin_names.add(class_name)
 
                     result.plugins.append(cls)
+            result.add_discover_time(path, start_time)
 
         # Store in memory last result to keep in memory loaded modules
         self._last_discovered_results[superclass] = result
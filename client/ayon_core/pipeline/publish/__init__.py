@@ -35,6 +35,7 @@ from .lib import (
 
     filter_instances_for_context_plugin,
     context_plugin_should_run,
+    concurrent_publish_iter,
     get_instance_staging_dir,
     get_publish_repre_path,
 
@@ -44,6 +45,17 @@ from .lib import (
     get_publish_instance_families,
 )
 
+from .profiling import (
+    PublishProfiler,
+    is_publish_profiling_enabled,
+    start_publish_profiling,
+    stop_publish_profiling,
+    get_publish_profiler,
+    profile_span,
+    get_chrome_trace,
+    export_chrome_trace,
+)
+
 from .abstract_expected_files import ExpectedFiles
 from .abstract_collect_render import (
     RenderInstance,
@@ -84,6 +96,7 @@ __all__ = (
 
     "filter_instances_for_context_plugin",
     "context_plugin_should_run",
+    "concurrent_publish_iter",
     "get_instance_staging_dir",
     "get_publish_repre_path",
 
@@ -92,6 +105,15 @@ __all__ = (
     "get_publish_instance_label",
     "get_publish_instance_families",
 
+    "PublishProfiler",
+    "is_publish_profiling_enabled",
+    "start_publish_profiling",
+    "stop_publish_profiling",
+    "get_publish_profiler",
+    "profile_span",
+    "get_chrome_trace",
+    "export_chrome_trace",
+
     "ExpectedFiles",
 
     "RenderInstance",
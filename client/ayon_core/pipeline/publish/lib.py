@@ -1,18 +1,27 @@
 import os
 import sys
+import time
 import inspect
 import copy
+import logging
 import tempfile
+import itertools
+import threading
+import contextvars
 import xml.etree.ElementTree
+from concurrent.futures import ThreadPoolExecutor
 
 import pyblish.util
 import pyblish.plugin
+import pyblish.logic
+import pyblish.lib
 import pyblish.api
 
 from ayon_core.lib import (
     Logger,
     import_filepath,
     filter_profiles,
+    collect_subprocess_stats,
 )
 from ayon_core.settings import get_project_settings
 from ayon_core.pipeline import (
@@ -239,6 +248,7 @@ def publish_plugins_discover(paths=None):
         if not os.path.isdir(path):
             continue
 
+        start_time = time.perf_counter()
         for fname in os.listdir(path):
             if fname.startswith("_"):
                 continue
@@ -286,6 +296,7 @@ def publish_plugins_discover(paths=None):
                 plugin.__module__ = module.__file__
                 key = "{0}.{1}".format(plugin.__module__, plugin.__name__)
                 plugins[key] = plugin
+        result.add_discover_time(path, start_time)
 
     # Include plug-ins from registration.
     # Directly registered plug-ins take precedence.
@@ -579,6 +590,332 @@ def context_plugin_should_run(plugin, context):
     return False
 
 
+# Id of concurrent publish worker which is processing current context
+_PUBLISH_WORKER_ID = contextvars.ContextVar(
+    "publish_worker_id", default=None
+)
+_PUBLISH_WORKER_COUNTER = itertools.count(1)
+_RECORD_FACTORY_LOCK = threading.Lock()
+_RECORD_FACTORY_INSTALLED = False
+
+
+def _install_publish_worker_record_factory():
+    """Store id of publish worker to each created log record.
+
+    Records are attributed to worker which logged them, also when they are
+    logged from threads started by the worker in its context (e.g. output
+    of 'run_subprocess').
+    """
+
+    global _RECORD_FACTORY_INSTALLED
+
+    with _RECORD_FACTORY_LOCK:
+        if _RECORD_FACTORY_INSTALLED:
+            return
+
+        orig_factory = logging.getLogRecordFactory()
+
+        def _record_factory(*args, **kwargs):
+            record = orig_factory(*args, **kwargs)
+            record.publish_worker_id = _PUBLISH_WORKER_ID.get()
+            return record
+
+        logging.setLogRecordFactory(_record_factory)
+        _RECORD_FACTORY_INSTALLED = True
+
+
+def _process_plugin(plugin, context, instance):
+    """Process plugin and store stats of subprocesses it launched.
+
+    Args:
+        plugin (pyblish.api.Plugin): Plugin to process.
+        context (pyblish.api.Context): Publish context.
+        instance (Union[pyblish.api.Instance, None]): Processed instance.
+
+    Returns:
+        dict[str, Any]: Pyblish result with 'subprocesses'.
+    """
+
+    with collect_subprocess_stats() as subprocesses:
+        result = pyblish.plugin.process(plugin, context, instance)
+    result["subprocesses"] = subprocesses
+    return result
+
+
+def _get_plugin_tasks(plugin, context):
+    """Instances which should be processed by plugin.
+
+    Args:
+        plugin (pyblish.api.Plugin): Plugin to process.
+        context (pyblish.api.Context): Publish context.
+
+    Returns:
+        list[Union[pyblish.api.Instance, None]]: Instances to process,
+            'None' is used for context plugins.
+    """
+
+    if not plugin.__instanceEnabled__:
+        return [None]
+    return [
+        instance
+        for instance in pyblish.logic.instances_by_plugin(context, plugin)
+        if instance.data.get("publish") is not False
+    ]
+
+
+def _group_plugins_for_processing(plugins):
+    """Group plugins which can be processed concurrently.
+
+    Consecutive thread safe plugins with the same order are grouped
+    together. Any other plugin is in a group on its own.
+
+    Args:
+        plugins (list[pyblish.api.Plugin]): Sorted plugins.
+
+    Returns:
+        list[list[pyblish.api.Plugin]]: Groups of plugins.
+    """
+
+    groups = []
+    for plugin in plugins:
+        thread_safe = getattr(plugin, "thread_safe", False)
+        if (
+            thread_safe
+            and groups
+            and groups[-1][0].order == plugin.order
+            and getattr(groups[-1][0], "thread_safe", False)
+        ):
+            groups[-1].append(plugin)
+        else:
+            groups.append([plugin])
+    return groups
+
+
+def _process_plugins_in_thread(plugins, context, instance, stop_event):
+    """Process plugins on an instance in a worker thread.
+
+    Plugins are processed one after another and processing stops on first
+    error, or when an error happened in another worker.
+
+    Args:
+        plugins (list[pyblish.api.Plugin]): Plugins to process.
+        context (pyblish.api.Context): Publish context.
+        instance (Union[pyblish.api.Instance, None]): Processed instance.
+        stop_event (threading.Event): Event set when an error happened.
+
+    Returns:
+        list[dict[str, Any]]: Pyblish results of processed plugins.
+    """
+
+    worker_id = next(_PUBLISH_WORKER_COUNTER)
+    token = _PUBLISH_WORKER_ID.set(worker_id)
+    results = []
+    try:
+        for plugin in plugins:
+            if stop_event.is_set():
+                break
+            result = _process_plugin(plugin, context, instance)
+            # Pyblish captures records using handler on root logger, so
+            #   records from other workers must be filtered out
+            result["records"] = [
+                record
+                for record in result["records"]
+                if getattr(record, "publish_worker_id", None) == worker_id
+            ]
+            results.append(result)
+            if result["error"] is not None:
+                stop_event.set()
+                break
+    finally:
+        _PUBLISH_WORKER_ID.reset(token)
+    return results
+
+
+def _process_plugins_concurrently(plugins, context, executor):
+    """Process thread safe plugins with the same order concurrently.
+
+    Each instance is processed in a worker, which processes the plugins
+    in their order. Results are returned in the same order as they would
+    be returned by sequential processing.
+
+    Args:
+        plugins (list[pyblish.api.Plugin]): Thread safe plugins with the
+            same order.
+        context (pyblish.api.Context): Publish context.
+        executor (ThreadPoolExecutor): Pool of workers.
+
+    Returns:
+        list[dict[str, Any]]: Pyblish results.
+    """
+
+    tasks = [
+        (plugin, instance)
+        for plugin in plugins
+        for instance in _get_plugin_tasks(plugin, context)
+    ]
+    plugins_by_instance_id = {}
+    instances_by_id = {}
+    for plugin, instance in tasks:
+        instance_id = id(instance)
+        instances_by_id[instance_id] = instance
+        plugins_by_instance_id.setdefault(instance_id, []).append(plugin)
+
+    stop_event = threading.Event()
+    futures = [
+        executor.submit(
+            _process_plugins_in_thread,
+            plugins_by_instance_id[instance_id],
+            context,
+            instance,
+            stop_event,
+        )
+        for instance_id, instance in instances_by_id.items()
+    ]
+
+    results_by_key = {}
+    for future in futures:
+        for result in future.result():
+            key = (result["plugin"], id(result["instance"]))
+            results_by_key[key] = result
+
+    results = []
+    for plugin, instance in tasks:
+        result = results_by_key.get((plugin, id(instance)))
+        if result is not None:
+            results.append(result)
+
+    # Workers added results to context in order of processing
+    if results:
+        result_ids = {id(result) for result in results}
+        context_results = context.data["results"]
+        context_results[:] = [
+            result
+            for result in context_results
+            if id(result) not in result_ids
+        ] + results
+    return results
+
+
+def concurrent_publish_iter(
+    context=None, plugins=None, targets=None, max_workers=None
+):
+    """Publish iterator processing thread safe plugins concurrently.
+
+    Replacement of 'pyblish.util.publish_iter' for headless publishing.
+    Plugins with class attribute 'thread_safe' set to 'True' process
+    their instances concurrently in a pool of workers. Consecutive thread
+    safe plugins with the same order are processed in the same batch,
+    each instance is processed by the plugins in their order.
+
+    Collectors, and plugins which are not thread safe, are processed
+    sequentially. Results are yielded in the same order as sequential
+    processing would yield them. Processing of the batch stops on first
+    error, already running plugins are finished.
+
+    Each result contains 'subprocesses' with resource usage of
+    subprocesses launched by the plugin (see 'collect_subprocess_stats').
+
+    Args:
+        context (Optional[pyblish.api.Context]): Publish context, new
+            context is created if not passed.
+        plugins (Optional[list[pyblish.api.Plugin]]): Plugins to process,
+            discovered plugins are used if not passed.
+        targets (Optional[list[str]]): Targets of publishing, registered
+            targets are used if not passed.
+        max_workers (Optional[int]): Maximum number of workers. All plugins
+            are processed sequentially in current thread if lower than 2.
+            Default of 'ThreadPoolExecutor' is used if not passed.
+
+    Yields:
+        dict[str, Any]: Pyblish result of processed plugin.
+    """
+
+    context = pyblish.api.Context() if context is None else context
+    plugins = pyblish.api.discover() if plugins is None else plugins
+
+    if not targets:
+        targets = ["default"] + pyblish.api.registered_targets()
+
+    plugins = [
+        plugin
+        for plugin in pyblish.logic.plugins_by_targets(plugins, targets)
+        if plugin.active
+    ]
+    collectors = [
+        plugin
+        for plugin in plugins
+        if pyblish.lib.inrange(plugin.order, pyblish.api.CollectorOrder)
+    ]
+    # Approximation of all tasks, used for progress
+    task_count = max(1, len(list(
+        pyblish.logic.Iterator(plugins, context, targets=targets)
+    )))
+
+    processed_count = 0
+    for plugin, instance in pyblish.logic.Iterator(
+        collectors, context, targets=targets
+    ):
+        result = _process_plugin(plugin, context, instance)
+        processed_count += 1
+        result["progress"] = float(processed_count) / task_count
+        yield result
+
+    plugins = [plugin for plugin in plugins if plugin not in collectors]
+
+    log = Logger.get_logger("concurrent_publish_iter")
+    test = pyblish.logic.registered_test()
+    state = {
+        "nextOrder": None,
+        "ordersWithError": set()
+    }
+    root_logger = logging.getLogger()
+    executor = None
+    if max_workers is None or max_workers > 1:
+        _install_publish_worker_record_factory()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    try:
+        for group in _group_plugins_for_processing(plugins):
+            state["nextOrder"] = group[0].order
+            message = test(**state)
+            if message:
+                log.error("Stopped due to {}".format(message))
+                return
+
+            if (
+                executor is not None
+                and getattr(group[0], "thread_safe", False)
+            ):
+                # Pyblish changes level of root logger during processing,
+                #   which is not safe to do from multiple threads
+                old_level = root_logger.level
+                root_logger.setLevel(logging.DEBUG)
+                try:
+                    results = _process_plugins_concurrently(
+                        group, context, executor
+                    )
+                finally:
+                    root_logger.setLevel(old_level)
+            else:
+                results = (
+                    _process_plugin(plugin, context, instance)
+                    for plugin in group
+                    for instance in _get_plugin_tasks(plugin, context)
+                )
+
+            for result in results:
+                processed_count += 1
+                result["progress"] = float(processed_count) / task_count
+                if result["error"] is not None:
+                    state["ordersWithError"].add(result["plugin"].order)
+                yield result
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    pyblish.api.emit("published", context=context)
+
+
 def get_instance_staging_dir(instance):
     """Unified way how staging dir is stored and created on instances.
 
@@ -0,0 +1,468 @@
+"""Timeline profiling of publishing.
+
+Profiling is disabled by default and can be enabled by setting environment
+variable 'AYON_PUBLISH_PROFILING' to '1'. When enabled, publisher records
+timeline of processed plugins and instances, CPU and memory samples and
+subprocesses. Publish plugins can add their own spans using 'profile_span'.
+
+Recorded timeline can be exported to Chrome trace JSON format which can be
+opened in 'chrome://tracing' or in 'https://ui.perfetto.dev'.
+
+Example:
+    ```python
+    from ayon_core.pipeline.publish import profile_span
+
+    class ExtractSomething(pyblish.api.InstancePlugin):
+        def process(self, instance):
+            with profile_span("Export geometry", nodes=len(instance)):
+                ...
+    ```
+"""
+import os
+import sys
+import json
+import time
+import threading
+import contextlib
+
+PUBLISH_PROFILING_ENV_KEY = "AYON_PUBLISH_PROFILING"
+# Interval of CPU and memory samples in seconds
+DEFAULT_SAMPLE_INTERVAL = 0.5
+
+_ACTIVE_PROFILER = None
+
+
+def is_publish_profiling_enabled():
+    """Profiling of publishing is enabled.
+
+    Returns:
+        bool: Profiling is enabled using environment variable.
+    """
+
+    value = os.getenv(PUBLISH_PROFILING_ENV_KEY) or ""
+    return value.lower() in ("1", "true", "yes")
+
+
+def _get_memory_usage():
+    """Memory used by current process in bytes.
+
+    Returns:
+        Union[int, None]: Memory used by process or 'None' if is not
+            available.
+    """
+
+    try:
+        import psutil
+
+        return psutil.Process(os.getpid()).memory_info().rss
+    except Exception:
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    # Peak memory usage is used as fallback
+    # - Linux reports kilobytes, macOS bytes
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != "darwin":
+        max_rss *= 1024
+    return max_rss
+
+
+def _get_cpu_time():
+    times = os.times()
+    return times.user + times.system
+
+
+def _to_microseconds(value):
+    return int(value * 1000000)
+
+
+class PublishProfiler:
+    """Record timeline of publishing.
+
+    Timeline is stored as events in Chrome trace format. Plugins, instances
+    and spans are stored as complete events ("ph": "X"), which are nested
+    by their time in viewers. CPU and memory samples are stored as counter
+    events ("ph": "C").
+
+    Args:
+        sample_interval (Optional[float]): Interval of CPU and memory
+            samples in seconds. Samples are not recorded if is '0'.
+    """
+
+    def __init__(self, sample_interval=None):
+        if sample_interval is None:
+            sample_interval = DEFAULT_SAMPLE_INTERVAL
+        self._sample_interval = sample_interval
+        self._pid = os.getpid()
+        self._events = []
+        self._lock = threading.Lock()
+        self._current_plugin = None
+        self._current_plugin_start = None
+        self._current_plugin_thread_id = None
+        self._sampler_thread = None
+        self._stop_event = threading.Event()
+        self._last_cpu_sample = None
+
+    @property
+    def is_running(self):
+        return self._sampler_thread is not None
+
+    def start(self):
+        """Start profiling, which starts recording of samples."""
+
+        if self._sampler_thread is not None or self._sample_interval <= 0:
+            return
+        self._stop_event.clear()
+        self._sampler_thread = threading.Thread(
+            target=self._sample_loop,
+            name="PublishProfilerSampler",
+            daemon=True,
+        )
+        self._sampler_thread.start()
+
+    def stop(self):
+        """Stop profiling and finish currently profiled plugin."""
+
+        self.finish_plugin()
+        if self._sampler_thread is None:
+            return
+        self._stop_event.set()
+        self._sampler_thread.join()
+        self._sampler_thread = None
+
+    def add_event(
+        self,
+        name,
+        category,
+        start_time,
+        duration,
+        args=None,
+        thread_id=None
+    ):
+        """Add complete event to timeline.
+
+        Args:
+            name (str): Name of event.
+            category (str): Category of event e.g. 'plugin'.
+            start_time (float): Start time in seconds since epoch.
+            duration (float): Duration in seconds.
+            args (Optional[dict[str, Any]]): Additional data of event.
+            thread_id (Optional[int]): Thread id, current thread is
+                used if not passed.
+        """
+
+        event = self._create_event(
+            name, category, start_time, duration, args, thread_id
+        )
+        with self._lock:
+            self._events.append(event)
+
+    @contextlib.contextmanager
+    def span(self, name, category="span", **kwargs):
+        """Record time spent in context as an event.
+
+        Args:
+            name (str): Name of span.
+            category (Optional[str]): Category of span.
+            **kwargs: Additional data of span.
+        """
+
+        start_time = time.time()
+        try:
+            yield
+        finally:
+            self.add_event(
+                name, category, start_time, time.time() - start_time, kwargs
+            )
+
+    def start_plugin(self, plugin, start_time=None):
+        """Start event of processed plugin.
+
+        Event of previous plugin is finished.
+
+        Args:
+            plugin (pyblish.api.Plugin): Processed plugin.
+            start_time (Optional[float]): Start time in seconds since
+                epoch. Current time is used if not passed.
+        """
+
+        if start_time is None:
+            start_time = time.time()
+        self.finish_plugin(start_time)
+        self._current_plugin = plugin
+        self._current_plugin_start = start_time
+        self._current_plugin_thread_id = threading.get_ident()
+
+    def finish_plugin(self, end_time=None):
+        """Finish event of currently processed plugin.
+
+        Args:
+            end_time (Optional[float]): End time in seconds since epoch.
+                Current time is used if not passed.
+        """
+
+        plugin = self._current_plugin
+        if plugin is None:
+            return
+        if end_time is None:
+            end_time = time.time()
+        event = self._create_plugin_event(end_time)
+        with self._lock:
+            self._events.append(event)
+        self._current_plugin = None
+        self._current_plugin_start = None
+        self._current_plugin_thread_id = None
+
+    def add_result(self, result, subprocesses=None):
+        """Add events of processed instance and its subprocesses.
+
+        Args:
+            result (dict[str, Any]): Pyblish result of plugin processing.
+            subprocesses (Optional[list[dict[str, Any]]]): Statistics of
+                subprocesses launched during processing.
+        """
+
+        end_time = time.time()
+        duration = (result.get("duration") or 0.0) / 1000.0
+        start_time = end_time - duration
+        plugin = result.get("plugin")
+        if plugin is not None and plugin is not self._current_plugin:
+            self.start_plugin(plugin, start_time)
+
+        instance = result.get("instance")
+        if instance is None:
+            name = "Context"
+        else:
+            name = instance.data.get("label") or instance.data.get("name")
+        args = {}
+        if result.get("error") is not None:
+            args["error"] = str(result["error"])
+        self.add_event(str(name), "instance", start_time, duration, args)
+
+        for item in subprocesses or []:
+            item_end_time = item.get("end_time")
+            wall_time = item.get("wall_time")
+            if item_end_time is None or wall_time is None:
+                continue
+            self.add_event(
+                "Subprocess",
+                "subprocess",
+                item_end_time - wall_time,
+                wall_time,
+                {
+                    key: item.get(key)
+                    for key in ("args", "returncode", "cpu_time", "max_rss")
+                }
+            )
+
+    def sample(self):
+        """Record CPU and memory usage of current process."""
+
+        now = time.time()
+        cpu_time = _get_cpu_time()
+        args = {}
+        if self._last_cpu_sample is not None:
+            last_time, last_cpu_time = self._last_cpu_sample
+            elapsed = now - last_time
+            if elapsed > 0:
+                args["cpu_percent"] = round(
+                    (cpu_time - last_cpu_time) / elapsed * 100, 2
+                )
+        self._last_cpu_sample = (now, cpu_time)
+
+        memory = _get_memory_usage()
+        if memory is not None:
+            args["memory_mb"] = round(memory / (1024 * 1024), 2)
+
+        if not args:
+            return
+        with self._lock:
+            self._events.append({
+                "name": "Process",
+                "cat": "sample",
+                "ph": "C",
+                "ts": _to_microseconds(now),
+                "pid": self._pid,
+                "tid": threading.get_ident(),
+                "args": args,
+            })
+
+    def get_trace_events(self):
+        """Recorded events in Chrome trace format.
+
+        Currently processed plugin is included with duration up to now.
+
+        Returns:
+            list[dict[str, Any]]: Trace events.
+        """
+
+        with self._lock:
+            events = [dict(event) for event in self._events]
+
+        if self._current_plugin is not None:
+            events.append(self._create_plugin_event(time.time()))
+        events.sort(key=lambda event: event["ts"])
+        return events
+
+    def to_chrome_trace(self):
+        """Timeline in Chrome trace format.
+
+        Returns:
+            dict[str, Any]: Chrome trace data.
+        """
+
+        return get_chrome_trace(self.get_trace_events())
+
+    def export_chrome_trace(self, filepath):
+        """Export timeline to Chrome trace JSON file.
+
+        Args:
+            filepath (str): Path to output JSON file.
+        """
+
+        export_chrome_trace(self.get_trace_events(), filepath)
+
+    def _create_event(
+        self, name, category, start_time, duration, args, thread_id=None
+    ):
+        if thread_id is None:
+            thread_id = threading.get_ident()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": _to_microseconds(start_time),
+            "dur": _to_microseconds(duration),
+            "pid": self._pid,
+            "tid": thread_id,
+        }
+        if args:
+            event["args"] = args
+        return event
+
+    def _create_plugin_event(self, end_time):
+        plugin = self._current_plugin
+        label = getattr(plugin, "label", None) or plugin.__name__
+        return self._create_event(
+            label,
+            "plugin",
+            self._current_plugin_start,
+            end_time - self._current_plugin_start,
+            {"plugin": plugin.__name__, "order": plugin.order},
+            self._current_plugin_thread_id,
+        )
+
+    def _sample_loop(self):
+        while not self._stop_event.is_set():
+            self.sample()
+            self._stop_event.wait(self._sample_interval)
+
+
+def get_chrome_trace(trace_events):
+    """Create Chrome trace data from trace events.
+
+    Args:
+        trace_events (list[dict[str, Any]]): Trace events.
+
+    Returns:
+        dict[str, Any]: Chrome trace data.
+    """
+
+    return {
+        "traceEvents": trace_events,
+        "displayTimeUnit": "ms",
+    }
+
+
+def export_chrome_trace(trace_events, filepath):
+    """Export trace events to Chrome trace JSON file.
+
+    Args:
+        trace_events (list[dict[str, Any]]): Trace events.
+        filepath (str): Path to output JSON file.
+    """
+
+    dirpath = os.path.dirname(filepath)
+    if dirpath:
+        os.makedirs(dirpath, exist_ok=True)
+    with open(filepath, "w") as stream:
+        json.dump(get_chrome_trace(trace_events), stream)
+
+
+def start_publish_profiling(sample_interval=None, profiler=None):
+    """Start new profiling of publishing.
+
+    Previously running profiling is stopped.
+
+    Args:
+        sample_interval (Optional[float]): Interval of CPU and memory
+            samples in seconds.
+        profiler (Optional[PublishProfiler]): Stopped profiler which should
+            continue in profiling, e.g. when paused publishing continues.
+            New profiler is created if not passed.
+
+    Returns:
+        PublishProfiler: Started profiler.
+    """
+
+    global _ACTIVE_PROFILER
+
+    stop_publish_profiling()
+    if profiler is None:
+        profiler = PublishProfiler(sample_interval)
+    profiler.start()
+    _ACTIVE_PROFILER = profiler
+    return profiler
+
+
+def stop_publish_profiling():
+    """Stop running profiling of publishing.
+
+    Returns:
+        Union[PublishProfiler, None]: Stopped profiler or 'None' if
+            profiling was not running.
+    """
+
+    global _ACTIVE_PROFILER
+
+    profiler = _ACTIVE_PROFILER
+    _ACTIVE_PROFILER = None
+    if profiler is not None:
+        profiler.stop()
+    return profiler
+
+
+def get_publish_profiler():
+    """Profiler of currently running publishing.
+
+    Returns:
+        Union[PublishProfiler, None]: Profiler or 'None' if profiling is
+            not running.
+    """
+
+    return _ACTIVE_PROFILER
+
+
+@contextlib.contextmanager
+def profile_span(name, category="span", **kwargs):
+    """Record time spent in context to publish timeline.
+
+    Does nothing if profiling of publishing is not running.
+
+    Args:
+        name (str): Name of span.
+        category (Optional[str]): Category of span.
+        **kwargs: Additional data of span.
+    """
+
+    profiler = _ACTIVE_PROFILER
+    if profiler is None:
+        yield
+        return
+
+    with profiler.span(name, category, **kwargs):
+        yield
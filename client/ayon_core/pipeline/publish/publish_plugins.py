@@ -279,6 +279,9 @@ class Extractor(pyblish.api.InstancePlugin):
     """
 
     order = 2.0
+    # Instances can be processed concurrently in headless publishing
+    # - see 'concurrent_publish_iter'
+    thread_safe = False
 
     def staging_dir(self, instance):
         """Provide a temporary directory in which to store extracted files
@@ -1,5 +1,9 @@
 import os
 import time
+import atexit
+import sqlite3
+import weakref
+import threading
 import collections
 
 import ayon_api
@@ -12,6 +16,18 @@ FileInfo = collections.namedtuple(
     ("path", "size", "modification_time")
 )
 
+THUMBNAILS_INDEX_VERSION = 1
+THUMBNAIL_EXTENSIONS = (".png", ".jpeg")
+
+
+def _flush_cache_access_times(cache_ref):
+    cache = cache_ref()
+    if cache is not None:
+        try:
+            cache._flush_access_times()
+        except sqlite3.OperationalError:
+            pass
+
 
 class ThumbnailsCache:
     """Cache of thumbnails on local storage.
@@ -21,16 +37,25 @@ class ThumbnailsCache:
     thumbnail id validation and file names are thumbnail ids with matching
     extension. Extensions are predefined (.png and .jpeg).
 
-    Cache has cleanup mechanism which is triggered on initialized by default.
+    Cached thumbnails are tracked in SQLite index in thumbnails directory
+    with extension, size and time of last access of each thumbnail. Lookups
+    use the index, so thumbnails directory is not scanned. Files cached
+    before the index existed are added to the index on first cleanup. If
+    index can't be used, e.g. when database is locked for too long, lookup
+    falls back to check of files in thumbnails directory.
+
+    Cache has cleanup mechanism which is triggered on initialized by default
+    and runs in background thread. Cleanup is also triggered when size of
+    stored thumbnails reaches 'cleanup_stored_size'.
 
     The cleanup has 2 levels:
-    1. soft cleanup which remove all files that are older then 'days_alive'
-    2. max size cleanup which remove all files until the thumbnails folder
-        contains less then 'max_filesize'
-        - this is time consuming so it's not triggered automatically
+    1. soft cleanup which remove all thumbnails that were not accessed for
+        'days_alive'
+    2. max size cleanup which remove least recently accessed thumbnails
+        until the thumbnails folder contains less then 'max_filesize'
 
     Args:
-        cleanup (bool): Trigger soft cleanup (Cleanup expired thumbnails).
+        cleanup (bool): Trigger cleanup in background thread.
     """
 
     # Lifetime of thumbnails (in seconds)
@@ -39,12 +64,32 @@ class ThumbnailsCache:
     # Max size of thumbnail directory (in bytes)
     # - default 2 Gb
     max_filesize = 2 * 1024 * 1024 * 1024
+    # Size of stored thumbnails which triggers cleanup (in bytes)
+    # - default 64 Mb
+    cleanup_stored_size = 64 * 1024 * 1024
+    # Number of accessed thumbnails which triggers write to index
+    access_flush_count = 100
+    # Max time before access times are written to index (in seconds)
+    access_flush_interval = 30
+    # Number of thumbnails removed from index in one transaction
+    cleanup_batch_size = 500
+    index_filename = "thumbnails_index.sqlite"
 
     def __init__(self, cleanup=True):
         self._thumbnails_dir = None
         self._days_alive_secs = self.days_alive * 24 * 60 * 60
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._index_initialized = False
+        self._index_migrated = False
+        self._access_times = {}
+        self._flush_timer = None
+        self._stored_size = 0
+        self._cleanup_thread = None
+        # Write access times which were not written yet on exit
+        atexit.register(_flush_cache_access_times, weakref.ref(self))
         if cleanup:
-            self.cleanup()
+            self.cleanup_in_background()
 
     def get_thumbnails_dir(self):
         """Root directory where thumbnails are stored.
@@ -73,6 +118,9 @@ class ThumbnailsCache:
 
         for root, _, filenames in os.walk(thumbnails_dir):
             for filename in filenames:
+                # Skip index files
+                if filename.startswith(self.index_filename):
+                    continue
                 path = os.path.join(root, filename)
                 files_info.append(FileInfo(
                     path, os.path.getsize(path), os.path.getmtime(path)
@@ -114,36 +162,270 @@ class ThumbnailsCache:
         if not os.path.exists(thumbnails_dir):
             return
 
-        self._soft_cleanup(thumbnails_dir)
+        self._migrate_index(thumbnails_dir)
+        self._flush_access_times()
+        self._soft_cleanup()
         if check_max_size:
-            self._max_size_cleanup(thumbnails_dir)
+            self._max_size_cleanup()
 
-    def _soft_cleanup(self, thumbnails_dir):
-        current_time = time.time()
-        for root, _, filenames in os.walk(thumbnails_dir):
-            for filename in filenames:
-                path = os.path.join(root, filename)
-                modification_time = os.path.getmtime(path)
-                if current_time - modification_time > self._days_alive_secs:
-                    os.remove(path)
-
-    def _max_size_cleanup(self, thumbnails_dir):
-        files_info = self.get_thumbnails_dir_file_info()
-        size = self.get_thumbnails_dir_size(files_info)
-        if size < self.max_filesize:
-            return
+    def cleanup_in_background(self):
+        """Run full cleanup in background thread.
 
-        sorted_file_info = collections.deque(
-            sorted(files_info, key=lambda item: item.modification_time)
-        )
-        diff = size - self.max_filesize
-        while diff > 0:
-            if not sorted_file_info:
+        Cleanup is not started if is already running.
+        """
+
+        with self._lock:
+            thread = self._cleanup_thread
+            if thread is not None and thread.is_alive():
+                return
+            self._stored_size = 0
+            thread = threading.Thread(
+                target=self._cleanup_thread_main,
+                name="ThumbnailsCacheCleanup",
+                daemon=True,
+            )
+            self._cleanup_thread = thread
+        thread.start()
+
+    def _cleanup_thread_main(self):
+        try:
+            self.cleanup(check_max_size=True)
+        except Exception:
+            # Cleanup failure must not affect tools
+            pass
+        finally:
+            self._close_connection()
+
+    def _soft_cleanup(self):
+        min_access_time = time.time() - self._days_alive_secs
+        while True:
+            rows = self._get_connection().execute(
+                "SELECT project_name, thumbnail_id, ext FROM thumbnails"
+                " WHERE last_access < ? LIMIT ?",
+                (min_access_time, self.cleanup_batch_size)
+            ).fetchall()
+            if not rows:
+                break
+            self._remove_thumbnails(rows)
+
+    def _max_size_cleanup(self):
+        connection = self._get_connection()
+        size = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM thumbnails"
+        ).fetchone()[0]
+        while size > self.max_filesize:
+            # Least recently accessed thumbnails are removed first
+            rows = connection.execute(
+                "SELECT project_name, thumbnail_id, ext, size"
+                " FROM thumbnails ORDER BY last_access LIMIT ?",
+                (self.cleanup_batch_size, )
+            ).fetchall()
+            if not rows:
                 break
 
-            file_info = sorted_file_info.popleft()
-            diff -= file_info.size
-            os.remove(file_info.path)
+            to_remove = []
+            for project_name, thumbnail_id, ext, file_size in rows:
+                if size <= self.max_filesize:
+                    break
+                size -= file_size
+                to_remove.append((project_name, thumbnail_id, ext))
+            self._remove_thumbnails(to_remove)
+
+    def _remove_thumbnails(self, rows):
+        """Remove thumbnail files and their records in index.
+
+        Args:
+            rows (list[tuple[str, str, str]]): Project name, thumbnail id
+                and extension of thumbnails.
+        """
+
+        thumbnails_dir = self.get_thumbnails_dir()
+        for project_name, thumbnail_id, ext in rows:
+            path = os.path.join(
+                thumbnails_dir, project_name, thumbnail_id + ext
+            )
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+        connection = self._get_connection()
+        with connection:
+            connection.executemany(
+                "DELETE FROM thumbnails"
+                " WHERE project_name = ? AND thumbnail_id = ?",
+                [row[:2] for row in rows]
+            )
+
+    def _get_index_path(self):
+        return os.path.join(self.get_thumbnails_dir(), self.index_filename)
+
+    def _get_connection(self):
+        """Connection to index database of current thread.
+
+        Returns:
+            sqlite3.Connection: Connection to index.
+        """
+
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            return connection
+
+        thumbnails_dir = self.get_thumbnails_dir()
+        os.makedirs(thumbnails_dir, exist_ok=True)
+        # Index can be used by multiple processes
+        connection = sqlite3.connect(self._get_index_path(), timeout=10)
+        if not self._index_initialized:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS meta"
+                    " (key TEXT PRIMARY KEY, value TEXT)"
+                )
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS thumbnails ("
+                    "project_name TEXT,"
+                    " thumbnail_id TEXT,"
+                    " ext TEXT,"
+                    " size INTEGER,"
+                    " last_access REAL,"
+                    " PRIMARY KEY (project_name, thumbnail_id))"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS thumbnails_last_access"
+                    " ON thumbnails (last_access)"
+                )
+            self._index_initialized = True
+        self._local.connection = connection
+        return connection
+
+    def _close_connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _migrate_index(self, thumbnails_dir):
+        """Add thumbnails cached before index existed to the index.
+
+        Args:
+            thumbnails_dir (str): Path to thumbnails directory.
+        """
+
+        if self._index_migrated:
+            return
+
+        connection = self._get_connection()
+        version = connection.execute(
+            "SELECT value FROM meta WHERE key = 'version'"
+        ).fetchone()
+        if version is not None:
+            self._index_migrated = True
+            return
+
+        rows = []
+        for project_name in os.listdir(thumbnails_dir):
+            project_dir = os.path.join(thumbnails_dir, project_name)
+            if not os.path.isdir(project_dir):
+                continue
+            for filename in os.listdir(project_dir):
+                thumbnail_id, ext = os.path.splitext(filename)
+                if ext not in THUMBNAIL_EXTENSIONS:
+                    continue
+                path = os.path.join(project_dir, filename)
+                stat = os.stat(path)
+                rows.append((
+                    project_name,
+                    thumbnail_id,
+                    ext,
+                    stat.st_size,
+                    stat.st_mtime,
+                ))
+
+        with connection:
+            # Thumbnails stored by other processes are already in index
+            connection.executemany(
+                "INSERT OR IGNORE INTO thumbnails VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('version', ?)",
+                (str(THUMBNAILS_INDEX_VERSION), )
+            )
+        self._index_migrated = True
+
+    def _mark_accessed(self, project_name, thumbnail_id):
+        with self._lock:
+            self._access_times[(project_name, thumbnail_id)] = time.time()
+            flush = len(self._access_times) >= self.access_flush_count
+            if not flush and self._flush_timer is None:
+                # Access times are written even if there are no more
+                #   lookups
+                timer = threading.Timer(
+                    self.access_flush_interval,
+                    self._flush_timer_main
+                )
+                timer.daemon = True
+                self._flush_timer = timer
+                timer.start()
+        if flush:
+            try:
+                self._flush_access_times()
+            except sqlite3.OperationalError:
+                # Access times are written on next flush
+                pass
+
+    def _flush_timer_main(self):
+        try:
+            self._flush_access_times()
+        except Exception:
+            # Failed write must not affect tools
+            pass
+        finally:
+            self._close_connection()
+
+    def _flush_access_times(self):
+        """Write times of last access to index."""
+
+        with self._lock:
+            access_times, self._access_times = self._access_times, {}
+            timer, self._flush_timer = self._flush_timer, None
+        if timer is not None:
+            timer.cancel()
+        if not access_times:
+            return
+
+        connection = self._get_connection()
+        with connection:
+            connection.executemany(
+                "UPDATE thumbnails SET last_access = ?"
+                " WHERE project_name = ? AND thumbnail_id = ?",
+                [
+                    (access_time, project_name, thumbnail_id)
+                    for (project_name, thumbnail_id), access_time in (
+                        access_times.items()
+                    )
+                ]
+            )
+
+    def _add_to_index(self, project_name, thumbnail_id, filepath):
+        _, ext = os.path.splitext(filepath)
+        try:
+            connection = self._get_connection()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO thumbnails"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (
+                        project_name,
+                        thumbnail_id,
+                        ext,
+                        os.path.getsize(filepath),
+                        time.time(),
+                    )
+                )
+        except sqlite3.OperationalError:
+            # Thumbnail is added to index on next lookup or cleanup
+            pass
 
     def get_thumbnail_filepath(self, project_name, thumbnail_id):
         """Get thumbnail by thumbnail id.
@@ -160,15 +442,49 @@ class ThumbnailsCache:
         if not thumbnail_id:
             return None
 
-        for ext in (
-            ".png",
-            ".jpeg",
-        ):
+        try:
+            row = self._get_connection().execute(
+                "SELECT ext FROM thumbnails"
+                " WHERE project_name = ? AND thumbnail_id = ?",
+                (project_name, thumbnail_id)
+            ).fetchone()
+        except sqlite3.OperationalError:
+            # Index is not available, look for the file
+            row = None
+            index_available = False
+        else:
+            index_available = True
+
+        if row is not None:
+            filepath = os.path.join(
+                self.thumbnails_dir, project_name, thumbnail_id + row[0]
+            )
+            # File could be removed by other process
+            if os.path.exists(filepath):
+                self._mark_accessed(project_name, thumbnail_id)
+                return filepath
+
+        # Thumbnail may be cached but not indexed yet
+        for ext in THUMBNAIL_EXTENSIONS:
             filepath = os.path.join(
                 self.thumbnails_dir, project_name, thumbnail_id + ext
             )
             if os.path.exists(filepath):
+                if index_available:
+                    self._add_to_index(project_name, thumbnail_id, filepath)
                 return filepath
+
+        if row is not None:
+            try:
+                connection = self._get_connection()
+                with connection:
+                    connection.execute(
+                        "DELETE FROM thumbnails"
+                        " WHERE project_name = ? AND thumbnail_id = ?",
+                        (project_name, thumbnail_id)
+                    )
+            except sqlite3.OperationalError:
+                pass
         return None
 
     def get_project_dir(self, project_name):
@@ -219,6 +535,13 @@ class ThumbnailsCache:
         current_time = time.time()
         os.utime(thumbnail_path, (current_time, current_time))
 
+        self._add_to_index(project_name, thumbnail_id, thumbnail_path)
+        with self._lock:
+            self._stored_size += len(content)
+            run_cleanup = self._stored_size >= self.cleanup_stored_size
+        if run_cleanup:
+            self.cleanup_in_background()
+
         return thumbnail_path
 
 
@@ -33,6 +33,7 @@ class ExtractBurnin(publish.Extractor):
 
     label = "Extract burnins"
     order = pyblish.api.ExtractorOrder + 0.03
+    thread_safe = True
 
     families = ["review", "burnin"]
     hosts = [
@@ -383,7 +384,8 @@ class ExtractBurnin(publish.Extractor):
 
                 # Run burnin script
                 process_kwargs = {
-                    "logger": self.log
+                    "logger": self.log,
+                    "stream_output": True,
                 }
 
                 run_ayon_launcher_process(*args, **process_kwargs)
@@ -54,6 +54,7 @@ class ExtractOIIOTranscode(publish.Extractor):
 
     label = "Transcode color spaces"
     order = pyblish.api.ExtractorOrder + 0.019
+    thread_safe = True
 
     optional = True
 
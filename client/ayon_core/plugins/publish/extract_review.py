@@ -74,6 +74,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     label = "Extract Review"
     order = pyblish.api.ExtractorOrder + 0.02
+    thread_safe = True
     families = ["review"]
     hosts = [
         "nuke",
@@ -459,7 +460,9 @@ class ExtractReview(pyblish.api.InstancePlugin):
             # run subprocess
             self.log.debug("Executing: {}".format(subprcs_cmd))
 
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+            run_subprocess(
+                subprcs_cmd, shell=True, logger=self.log, stream_output=True
+            )
 
             # delete files added to fill gaps
             if files_to_clean:
@@ -25,6 +25,7 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
 
     label = "Extract Thumbnail"
     order = pyblish.api.ExtractorOrder + 0.49
+    thread_safe = True
     families = [
         "imagesequence", "render", "render2d", "prerender",
         "source", "clip", "take", "online", "image"
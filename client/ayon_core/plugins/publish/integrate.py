@@ -129,6 +129,15 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         "output"
     ]
 
+    # Number of files transferred at the same time
+    transfer_max_workers = 1
+    # Limit of concurrent transfers per anatomy root name
+    #   e.g. [{"root_name": "work", "max_workers": 2}]
+    root_transfer_max_workers = []
+    # Content hash algorithm of integrated files calculated during transfer
+    #   - source hash (path, mtime and size) is used if empty
+    file_hash_algorithm = ""
+
     def process(self, instance):
         # Instance should be integrated on a farm
         if instance.data.get("farm"):
@@ -151,9 +160,16 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["productType"]))
             return
 
-        file_transactions = FileTransaction(log=self.log,
-                                            # Enforce unique transfers
-                                            allow_queue_replacements=False)
+        file_transactions = FileTransaction(
+            log=self.log,
+            # Enforce unique transfers
+            allow_queue_replacements=False,
+            max_workers=self.transfer_max_workers,
+            root_max_workers=self._get_root_max_workers(
+                instance.context.data["anatomy"]
+            ),
+            hash_algorithm=self.file_hash_algorithm or None,
+        )
         try:
             self.register(instance, file_transactions, filtered_repres)
         except DuplicateDestinationError as exc:
@@ -202,6 +218,30 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
         return filtered_repres
 
+    def _get_root_max_workers(self, anatomy):
+        """Convert transfer workers per root name to root paths.
+
+        Args:
+            anatomy (Anatomy): Project anatomy.
+
+        Returns:
+            dict[str, int]: Maximum concurrent transfers by root path.
+        """
+        roots = anatomy.roots
+        output = {}
+        for item in self.root_transfer_max_workers:
+            root = roots.get(item["root_name"])
+            if root is None:
+                self.log.warning(
+                    "Root \"{}\" used in transfer workers settings"
+                    " is not available in project anatomy.".format(
+                        item["root_name"]
+                    )
+                )
+                continue
+            output[root.value] = item["max_workers"]
+        return output
+
     def register(self, instance, file_transactions, filtered_repres):
         project_name = instance.context.data["projectName"]
 
@@ -293,13 +333,15 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             "Backed up existing files: {}".format(file_transactions.backups))
         self.log.debug(
             "Transferred files: {}".format(file_transactions.transferred))
+        self.log.debug(
+            "Copy methods used: {}".format(file_transactions.copy_methods))
         self.log.debug("Retrieving Representation Site Sync information ...")
 
         # Compute the resource file infos once (files belonging to the
         # version instance instead of an individual representation) so
         # we can reuse those file infos per representation
         resource_file_infos = self.get_files_info(
-            resource_destinations, anatomy
+            resource_destinations, anatomy, file_transactions
         )
 
         # Finalize the representations now the published files are integrated
@@ -311,7 +353,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             transfers = prepared["transfers"]
             destinations = [dst for src, dst in transfers]
             repre_files = self.get_files_info(
-                destinations, anatomy
+                destinations, anatomy, file_transactions
             )
             # Add the version resource file infos to each representation
             repre_files += resource_file_infos
@@ -665,17 +707,19 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             if not is_sequence_representation:
                 files = [files]
 
-            repre_context = None
-            transfers = []
-            for src_file_name in files:
-                template_data["originalBasename"], _ = os.path.splitext(
-                    src_file_name)
-
-                dst = path_template_obj.format_strict(template_data)
-                src = os.path.join(stagingdir, src_file_name)
-                transfers.append((src, dst))
-                if repre_context is None:
-                    repre_context = dst.used_values
+            original_basenames = [
+                os.path.splitext(src_file_name)[0]
+                for src_file_name in files
+            ]
+            dst_filepaths = path_template_obj.format_sequence_strict(
+                template_data, "originalBasename", original_basenames
+            )
+            template_data["originalBasename"] = original_basenames[-1]
+            repre_context = dst_filepaths[0].used_values
+            transfers = [
+                (os.path.join(stagingdir, src_file_name), dst)
+                for src_file_name, dst in zip(files, dst_filepaths)
+            ]
 
             if not is_udim and first_index_padded is not None:
                 repre_context["frame"] = first_index_padded
@@ -722,22 +766,16 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
             # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
-            for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
-                )
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
-                    )
-                    repre_context = template_filled.used_values
+            #   - template is formatted only once for all indexes
+            index_key = "udim" if is_udim else "frame"
+            dst_filepaths = path_template_obj.format_sequence_strict(
+                template_data, index_key, destination_indexes
+            )
+            template_data[index_key] = destination_indexes[-1]
+            self.log.debug(
+                "Template filled: {}".format(str(dst_filepaths[0]))
+            )
+            repre_context = dst_filepaths[0].used_values
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
@@ -954,12 +992,15 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(path))
         return path
 
-    def get_files_info(self, filepaths, anatomy):
+    def get_files_info(self, filepaths, anatomy, file_transactions=None):
         """Prepare 'files' info portion for representations.
 
         Arguments:
             filepaths (Iterable[str]): List of transferred file paths.
             anatomy (Anatomy): Project anatomy.
+            file_transactions (Optional[FileTransaction]): Transaction
+                which transferred the files. Used to get size and content
+                hash calculated during transfer.
 
         Returns:
             list[dict[str, Any]]: Representation 'files' information.
@@ -967,28 +1008,46 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         """
         file_infos = []
         for filepath in filepaths:
-            file_info = self.prepare_file_info(filepath, anatomy)
+            transfer_info = None
+            if file_transactions is not None:
+                transfer_info = file_transactions.get_transferred_file_info(
+                    filepath
+                )
+            file_info = self.prepare_file_info(
+                filepath, anatomy, transfer_info
+            )
             file_infos.append(file_info)
         return file_infos
 
-    def prepare_file_info(self, path, anatomy):
+    def prepare_file_info(self, path, anatomy, transfer_info=None):
         """ Prepare information for one file (asset or resource)
 
         Arguments:
             path (str): Destination url of published file.
             anatomy (Anatomy): Project anatomy part from instance.
+            transfer_info (Optional[dict[str, Any]]): Size and content hash
+                of file calculated during transfer.
 
         Returns:
             dict[str, Any]: Representation file info dictionary.
 
         """
+        if transfer_info is not None:
+            size = transfer_info["size"]
+            file_hash = transfer_info["hash"]
+            hash_type = transfer_info["hash_type"]
+        else:
+            size = os.path.getsize(path)
+            file_hash = source_hash(path)
+            hash_type = "op3"
+
         return {
             "id": create_entity_id(),
             "name": os.path.basename(path),
             "path": self.get_rootless_path(anatomy, path),
-            "size": os.path.getsize(path),
-            "hash": source_hash(path),
-            "hash_type": "op3",
+            "size": size,
+            "hash": file_hash,
+            "hash_type": hash_type,
         }
 
     def _validate_path_in_project_roots(self, anatomy, file_path):
@@ -1,6 +1,5 @@
 import os
 import copy
-import errno
 import shutil
 
 import clique
@@ -12,7 +11,8 @@ from ayon_api.operations import (
 )
 from ayon_api.utils import create_entity_id
 
-from ayon_core.lib import create_hard_link, source_hash
+from ayon_core.lib import source_hash
+from ayon_core.lib.file_transaction import FileTransaction
 from ayon_core.pipeline.publish import (
     get_publish_template_name,
     OptionalPyblishPluginMixin,
@@ -85,6 +85,8 @@ class IntegrateHeroVersion(
         "user",
         "output"
     ]
+    # Number of files transferred at the same time
+    transfer_max_workers = 1
     # QUESTION/TODO this process should happen on server if crashed due to
     # permissions error on files (files were used or user didn't have perms)
     # *but all other plugins must be sucessfully completed
@@ -410,11 +412,25 @@ class IntegrateHeroVersion(
             # Copy(hardlink) paths of source and destination files
             # TODO should we *only* create hardlinks?
             # TODO should we keep files for deletion until this is successful?
-            for src_path, dst_path in src_to_dst_file_paths:
-                self.copy_file(src_path, dst_path)
-
-            for src_path, dst_path in other_file_paths_mapping:
-                self.copy_file(src_path, dst_path)
+            # NOTE Rollback of transferred files is not needed, the whole
+            #   hero publish directory is removed on failure.
+            # Last transfer to the same destination is used, as files were
+            #   overwritten when copied one by one
+            file_transactions = FileTransaction(
+                log=self.log,
+                allow_queue_replacements=True,
+                max_workers=self.transfer_max_workers,
+            )
+            for src_path, dst_path in (
+                src_to_dst_file_paths + other_file_paths_mapping
+            ):
+                file_transactions.add(
+                    src_path,
+                    dst_path,
+                    mode=FileTransaction.MODE_HARDLINK_OR_COPY
+                )
+            file_transactions.process()
+            file_transactions.finalize()
 
             # Update prepared representation etity data with files
             #   and integrate it to server.
@@ -603,40 +619,6 @@ class IntegrateHeroVersion(
             ).format(path))
         return path
 
-    def copy_file(self, src_path, dst_path):
-        # TODO check drives if are the same to check if cas hardlink
-        dirname = os.path.dirname(dst_path)
-
-        try:
-            os.makedirs(dirname)
-            self.log.debug("Folder(s) created: \"{}\"".format(dirname))
-        except OSError as exc:
-            if exc.errno != errno.EEXIST:
-                self.log.error("An unexpected error occurred.", exc_info=True)
-                raise
-
-            self.log.debug("Folder already exists: \"{}\"".format(dirname))
-
-        self.log.debug("Copying file \"{}\" to \"{}\"".format(
-            src_path, dst_path
-        ))
-
-        # First try hardlink and copy if paths are cross drive
-        try:
-            create_hard_link(src_path, dst_path)
-            # Return when successful
-            return
-
-        except OSError as exc:
-            # re-raise exception if different than
-            # EXDEV - cross drive path
-            # EINVAL - wrong format, must be NTFS
-            self.log.debug("Hardlink failed with errno:'{}'".format(exc.errno))
-            if exc.errno not in [errno.EXDEV, errno.EINVAL]:
-                raise
-
-        shutil.copy(src_path, dst_path)
-
     def version_from_representations(self, project_name, repres):
         for repre in repres:
             version = ayon_api.get_version_by_id(
@@ -4,14 +4,163 @@ import logging
 import collections
 import copy
 import time
+import threading
 
 import ayon_api
 
 log = logging.getLogger(__name__)
 
 
+def _copy_settings_value(value):
+    """Create private copy of settings value.
+
+    Dictionaries are not copied directly but wrapped into
+    '_CopyOnAccessDict' which copies nested values only when they are
+    accessed.
+
+    Args:
+        value (Any): Value from cached settings.
+
+    Returns:
+        Any: Value which can be safely modified.
+    """
+    if isinstance(value, dict):
+        return _CopyOnAccessDict(value)
+    if isinstance(value, (list, set)):
+        return copy.deepcopy(value)
+    return value
+
+
+class _CopyOnAccessDict(dict):
+    """Settings dictionary sharing untouched values with settings cache.
+
+    Settings are cached per project and a deep copy of whole settings was
+    created on each request so a caller could not modify the cache.
+    Most callers need only a small part of settings so the copy is
+    created lazily. Nested value is copied the first time it is accessed,
+    which means that any modification of returned data does not affect
+    the cached settings and values which were not accessed are not
+    copied at all.
+
+    The object behaves as regular dictionary. Copy and pickle create
+    regular dictionaries.
+
+    Args:
+        source (dict[str, Any]): Cached settings values.
+    """
+
+    def __init__(self, source):
+        super().__init__(source)
+        self._copied_keys = set()
+
+    def _copy_item(self, key):
+        value = super().__getitem__(key)
+        if key not in self._copied_keys:
+            value = _copy_settings_value(value)
+            super().__setitem__(key, value)
+            self._copied_keys.add(key)
+        return value
+
+    def _copy_all(self):
+        if len(self._copied_keys) != len(self):
+            for key in tuple(super().keys()):
+                self._copy_item(key)
+
+    def __getitem__(self, key):
+        return self._copy_item(key)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._copied_keys.add(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._copied_keys.discard(key)
+
+    def __iter__(self):
+        # Custom '__iter__' makes sure that 'dict(...)' and '{**...}' do
+        #   use '__getitem__' instead of reading values directly
+        return super().__iter__()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __or__(self, other):
+        output = self.copy()
+        output.update(other)
+        return output
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        self._copy_all()
+        return copy.deepcopy(dict(super().items()), memo)
+
+    def __reduce__(self):
+        self._copy_all()
+        return dict, (dict(super().items()), )
+
+    def __reduce_ex__(self, protocol):
+        return self.__reduce__()
+
+    def get(self, key, default=None):
+        if key in self:
+            return self._copy_item(key)
+        return default
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self._copy_item(key)
+        self[key] = default
+        return default
+
+    def pop(self, key, *args):
+        if key in self:
+            value = self._copy_item(key)
+            del self[key]
+            return value
+        return super().pop(key, *args)
+
+    def popitem(self):
+        self._copy_all()
+        key, value = super().popitem()
+        self._copied_keys.discard(key)
+        return key, value
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        super().clear()
+        self._copied_keys.clear()
+
+    def copy(self):
+        self._copy_all()
+        return dict(super().items())
+
+    def items(self):
+        self._copy_all()
+        return super().items()
+
+    def values(self):
+        self._copy_all()
+        return super().values()
+
+
 class CacheItem:
-    lifetime = 10
+    """Cached settings value.
+
+    Cached value is never returned directly. Value returned by
+    'get_value' can be modified without affecting the cache, nested
+    values are copied on first access (see '_CopyOnAccessDict').
+
+    Lifetime of cache can be changed using environment variable
+    'AYON_SETTINGS_CACHE_LIFETIME' (in seconds).
+    """
+    lifetime = float(os.getenv("AYON_SETTINGS_CACHE_LIFETIME") or 10)
 
     def __init__(self, value, outdate_time=None):
         self._value = value
@@ -24,7 +173,7 @@ class CacheItem:
         return cls({}, 0)
 
     def get_value(self):
-        return copy.deepcopy(self._value)
+        return _copy_settings_value(self._value)
 
     def update_value(self, value):
         self._value = value
@@ -40,8 +189,11 @@ class _AyonSettingsCache:
     variant = None
     addon_versions = CacheItem.create_outdated()
     studio_settings = CacheItem.create_outdated()
-    cache_by_project_name = collections.defaultdict(
-        CacheItem.create_outdated)
+    # Maximum number of projects with cached settings
+    max_cached_projects = 10
+    cache_by_project_name = collections.OrderedDict()
+    # Settings can be requested from multiple threads
+    cache_lock = threading.Lock()
 
     @classmethod
     def _use_bundles(cls):
@@ -75,9 +227,24 @@ class _AyonSettingsCache:
     def _get_bundle_name(cls):
         return os.environ["AYON_BUNDLE_NAME"]
 
+    @classmethod
+    def _get_project_cache_item(cls, project_name):
+        cache_by_project_name = _AyonSettingsCache.cache_by_project_name
+        with _AyonSettingsCache.cache_lock:
+            cache_item = cache_by_project_name.get(project_name)
+            if cache_item is None:
+                cache_item = CacheItem.create_outdated()
+                cache_by_project_name[project_name] = cache_item
+                # Remove least recently used project settings
+                while len(cache_by_project_name) > cls.max_cached_projects:
+                    cache_by_project_name.popitem(last=False)
+            else:
+                cache_by_project_name.move_to_end(project_name)
+        return cache_item
+
     @classmethod
     def get_value_by_project(cls, project_name):
-        cache_item = _AyonSettingsCache.cache_by_project_name[project_name]
+        cache_item = cls._get_project_cache_item(project_name)
         if cache_item.is_outdated:
             if cls._use_bundles():
                 value = ayon_api.get_addons_settings(
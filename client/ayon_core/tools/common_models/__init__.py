@@ -15,6 +15,15 @@ from .hierarchy import (
 from .thumbnails import ThumbnailsModel
 from .selection import HierarchyExpectedSelection
 from .users import UsersModel
+from .fetch import (
+    PRIORITY_HIGH,
+    PRIORITY_NORMAL,
+    PRIORITY_LOW,
+    FetchCancelledError,
+    FetchFuture,
+    BackgroundFetcher,
+    get_background_fetcher,
+)
 
 
 __all__ = (
@@ -35,4 +44,12 @@ __all__ = (
     "HierarchyExpectedSelection",
 
     "UsersModel",
+
+    "PRIORITY_HIGH",
+    "PRIORITY_NORMAL",
+    "PRIORITY_LOW",
+    "FetchCancelledError",
+    "FetchFuture",
+    "BackgroundFetcher",
+    "get_background_fetcher",
 )
@@ -0,0 +1,416 @@
+"""Shared background fetching of data for tool models.
+
+Tools should not call server on main (UI) thread. Fetcher runs requests in
+a bounded pool of threads shared by all tools in the process.
+
+- identical requests, which are queued or running, are deduplicated by key
+    and share the same future
+- requests are processed by priority, requests of visible items should use
+    'PRIORITY_HIGH'
+- requests can be assigned to a group and queued requests of a group can be
+    cancelled e.g. when selection changes
+
+Callbacks of futures are called in thread of the fetcher. UI should emit
+a Qt signal from the callback to process the result in main thread.
+
+Example:
+    ```python
+    fetcher = get_background_fetcher()
+    fetcher.cancel_group(self._fetch_group)
+    future = fetcher.submit(
+        ("products", project_name, tuple(folder_ids)),
+        controller.get_product_items,
+        project_name,
+        folder_ids,
+        group=self._fetch_group,
+        priority=PRIORITY_HIGH,
+    )
+    future.add_done_callback(self._products_fetched.emit)
+    ```
+"""
+import os
+import heapq
+import logging
+import itertools
+import threading
+
+FETCH_WORKERS_ENV_KEY = "AYON_TOOLS_FETCH_WORKERS"
+DEFAULT_FETCH_WORKERS = 4
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 50
+PRIORITY_LOW = 100
+
+_BACKGROUND_FETCHER = None
+_BACKGROUND_FETCHER_LOCK = threading.Lock()
+
+
+class FetchCancelledError(Exception):
+    """Result of cancelled request was requested."""
+    pass
+
+
+class FetchFuture:
+    """Result of request processed by 'BackgroundFetcher'.
+
+    Args:
+        key (Hashable): Key of request.
+    """
+
+    _pending = "pending"
+    _running = "running"
+    _finished = "finished"
+    _cancelled = "cancelled"
+
+    def __init__(self, key):
+        self._key = key
+        self._state = self._pending
+        self._result = None
+        self._exception = None
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self._done_event = threading.Event()
+
+    @property
+    def key(self):
+        return self._key
+
+    def done(self):
+        """Request finished or was cancelled.
+
+        Returns:
+            bool: Future is done.
+        """
+
+        return self._state in (self._finished, self._cancelled)
+
+    def cancelled(self):
+        """Request was cancelled before it started.
+
+        Returns:
+            bool: Request was cancelled.
+        """
+
+        return self._state == self._cancelled
+
+    def wait(self, timeout=None):
+        """Wait until request is done.
+
+        Args:
+            timeout (Optional[float]): Timeout in seconds.
+
+        Returns:
+            bool: Request is done.
+        """
+
+        return self._done_event.wait(timeout)
+
+    def result(self, timeout=None):
+        """Result of request, waits until the request is done.
+
+        Args:
+            timeout (Optional[float]): Timeout in seconds.
+
+        Returns:
+            Any: Result of request function.
+
+        Raises:
+            FetchCancelledError: Request was cancelled.
+            TimeoutError: Request is not done in timeout.
+            Exception: Exception raised by request function.
+        """
+
+        if not self.wait(timeout):
+            raise TimeoutError(
+                "Request '{}' did not finish in time.".format(self._key)
+            )
+        if self._state == self._cancelled:
+            raise FetchCancelledError(
+                "Request '{}' was cancelled.".format(self._key)
+            )
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self):
+        """Exception raised by request function.
+
+        Returns:
+            Union[Exception, None]: Exception or 'None'.
+        """
+
+        return self._exception
+
+    def add_done_callback(self, callback):
+        """Add callback called when request is done.
+
+        Callback is called with the future as argument in thread where
+        request was processed, or immediately if the future is done.
+
+        Args:
+            callback (Callable[[FetchFuture], None]): Callback.
+        """
+
+        with self._lock:
+            if not self.done():
+                self._callbacks.append(callback)
+                return
+        self._call_callback(callback)
+
+    def _set_running(self):
+        with self._lock:
+            if self._state != self._pending:
+                return False
+            self._state = self._running
+        return True
+
+    def _set_cancelled(self):
+        """Mark pending future as cancelled.
+
+        Callbacks are not called, '_finish' must be called afterwards.
+
+        Returns:
+            bool: Future was cancelled.
+        """
+
+        with self._lock:
+            if self._state != self._pending:
+                return False
+            self._state = self._cancelled
+        return True
+
+    def _set_result(self, result, exception=None):
+        with self._lock:
+            self._result = result
+            self._exception = exception
+            self._state = self._finished
+        self._finish()
+
+    def _finish(self):
+        self._done_event.set()
+        with self._lock:
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            self._call_callback(callback)
+
+    def _call_callback(self, callback):
+        try:
+            callback(self)
+        except Exception:
+            logging.getLogger("BackgroundFetcher").warning(
+                "Callback of request '{}' failed.".format(self._key),
+                exc_info=True
+            )
+
+
+class _FetchRequest:
+    def __init__(self, key, func, args, kwargs, priority):
+        self.key = key
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.future = FetchFuture(key)
+        # Groups which are waiting for the request, request without group
+        #   can't be cancelled using group
+        self.groups = set()
+        self.cancellable = True
+
+
+class BackgroundFetcher:
+    """Bounded pool of threads processing requests by priority.
+
+    Args:
+        max_workers (Optional[int]): Maximum number of threads. Value of
+            'AYON_TOOLS_FETCH_WORKERS' environment variable is used
+            if not passed.
+    """
+
+    def __init__(self, max_workers=None):
+        if max_workers is None:
+            max_workers = DEFAULT_FETCH_WORKERS
+            value = os.getenv(FETCH_WORKERS_ENV_KEY)
+            if value:
+                try:
+                    max_workers = int(value)
+                except ValueError:
+                    pass
+        self._max_workers = max(1, max_workers)
+        self._queue = []
+        self._counter = itertools.count()
+        self._requests_by_key = {}
+        self._requests_by_group = {}
+        self._condition = threading.Condition()
+        self._workers = []
+        # Workers which are not processing a request, workers which were
+        #   notified but did not take a request yet are also counted
+        self._idle_workers = 0
+        self._log = None
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = logging.getLogger(self.__class__.__name__)
+        return self._log
+
+    def submit(
+        self, key, func, *args, priority=PRIORITY_NORMAL, group=None, **kwargs
+    ):
+        """Submit request to be processed in background.
+
+        Request with the same key, which is queued or running, is reused.
+
+        Args:
+            key (Union[Hashable, None]): Key of request used to deduplicate
+                identical requests. Request is not deduplicated if is 'None'.
+            func (Callable): Function called in background.
+            *args: Positional arguments for the function.
+            priority (Optional[int]): Priority of request, lower value
+                is processed sooner.
+            group (Optional[str]): Group of request which can be used
+                to cancel the request.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            FetchFuture: Future with result of request.
+        """
+
+        with self._condition:
+            request = None
+            if key is not None:
+                request = self._requests_by_key.get(key)
+
+            if request is None:
+                request = _FetchRequest(key, func, args, kwargs, priority)
+                if key is not None:
+                    self._requests_by_key[key] = request
+                self._push(request)
+
+            elif priority < request.priority:
+                # Queue again with higher priority, previous entry
+                #   in queue is skipped
+                request.priority = priority
+                if not request.future.done():
+                    self._push(request)
+
+            if group is None:
+                request.cancellable = False
+            else:
+                request.groups.add(group)
+                self._requests_by_group.setdefault(group, set()).add(
+                    request
+                )
+            self._ensure_worker()
+            self._condition.notify()
+        return request.future
+
+    def cancel_group(self, group):
+        """Cancel queued requests of a group.
+
+        Requests which are already running are finished. Requests which
+        are also used by other groups are not cancelled.
+
+        Args:
+            group (str): Group of requests.
+        """
+
+        cancelled = []
+        with self._condition:
+            requests = self._requests_by_group.pop(group, None) or set()
+            for request in requests:
+                request.groups.discard(group)
+                if request.groups or not request.cancellable:
+                    continue
+                if request.future._set_cancelled():
+                    cancelled.append(request)
+                    self._remove_request(request)
+
+        # Callbacks are called outside of lock
+        for request in cancelled:
+            request.future._finish()
+
+    def _push(self, request):
+        heapq.heappush(
+            self._queue,
+            (request.priority, next(self._counter), request)
+        )
+
+    def _remove_request(self, request):
+        if (
+            request.key is not None
+            and self._requests_by_key.get(request.key) is request
+        ):
+            self._requests_by_key.pop(request.key)
+
+        for group in request.groups:
+            group_requests = self._requests_by_group.get(group)
+            if group_requests is None:
+                continue
+            group_requests.discard(request)
+            if not group_requests:
+                self._requests_by_group.pop(group)
+        request.groups.clear()
+
+    def _ensure_worker(self):
+        # Queue may contain entries of requests queued again with higher
+        #   priority, so more workers than needed may be started
+        while (
+            len(self._queue) > self._idle_workers
+            and len(self._workers) < self._max_workers
+        ):
+            thread = threading.Thread(
+                target=self._worker_loop,
+                name="BackgroundFetcher-{}".format(len(self._workers) + 1),
+                daemon=True,
+            )
+            self._workers.append(thread)
+            self._idle_workers += 1
+            thread.start()
+
+    def _get_next_request(self):
+        with self._condition:
+            while True:
+                while self._queue:
+                    priority, _, request = heapq.heappop(self._queue)
+                    # Skip entries of requests which were queued again
+                    #   with higher priority or which are already processed
+                    if priority != request.priority:
+                        continue
+                    if request.future._set_running():
+                        self._idle_workers -= 1
+                        return request
+                self._condition.wait()
+
+    def _worker_loop(self):
+        while True:
+            request = self._get_next_request()
+            result = exception = None
+            try:
+                result = request.func(*request.args, **request.kwargs)
+            except Exception as exc:
+                exception = exc
+                self.log.warning(
+                    "Request '{}' failed.".format(request.key),
+                    exc_info=True
+                )
+
+            with self._condition:
+                self._remove_request(request)
+                self._idle_workers += 1
+            request.future._set_result(result, exception)
+
+
+def get_background_fetcher():
+    """Background fetcher shared by tools in the process.
+
+    Returns:
+        BackgroundFetcher: Shared fetcher.
+    """
+
+    global _BACKGROUND_FETCHER
+
+    if _BACKGROUND_FETCHER is None:
+        with _BACKGROUND_FETCHER_LOCK:
+            if _BACKGROUND_FETCHER is None:
+                _BACKGROUND_FETCHER = BackgroundFetcher()
+    return _BACKGROUND_FETCHER
@@ -1,5 +1,6 @@
 import collections
 import contextlib
+import threading
 from abc import ABCMeta, abstractmethod
 
 import ayon_api
@@ -8,6 +9,8 @@ import six
 from ayon_core.style import get_default_entity_icon_color
 from ayon_core.lib import NestedCacheItem
 
+from .hierarchy_snapshot import HierarchySnapshot
+
 HIERARCHY_MODEL_SENDER = "hierarchy.model"
 
 
@@ -220,8 +223,20 @@ class HierarchyModel(object):
 
     Hierarchy items are folders and tasks. Folders can have as parent another
     folder or project. Tasks can have as parent only folder.
+
+    Folders are stored to persistent local snapshot which is updated
+    incrementally, so full hierarchy is not queried on each refresh.
+
+    Tasks are queried in batches. When tasks of a folder are requested,
+    tasks of its siblings and children are fetched in the same query,
+    because they are visible in UI and are likely requested next. Tasks of
+    whole project are fetched if 'prefetch_project_tasks' is enabled.
     """
     lifetime = 60  # A minute
+    use_hierarchy_snapshot = True
+    # Maximum number of folders of which tasks are fetched in one query
+    task_prefetch_limit = 500
+    prefetch_project_tasks = False
 
     def __init__(self, controller):
         self._folders_items = NestedCacheItem(
@@ -233,14 +248,23 @@ class HierarchyModel(object):
             levels=2, default_factory=dict, lifetime=self.lifetime)
         self._tasks_by_id = NestedCacheItem(
             levels=2, default_factory=dict, lifetime=self.lifetime)
+        # Children folder ids by parent id, updated with folder items
+        self._folder_ids_by_parent_id = {}
+
+        self._hierarchy_snapshot = HierarchySnapshot()
 
         self._folders_refreshing = set()
         self._tasks_refreshing = set()
+        # Events of folders of which tasks are being queried
+        #   by '(project_name, folder_id)'
+        self._tasks_query_events = {}
+        self._tasks_lock = threading.Lock()
         self._controller = controller
 
     def reset(self):
         self._folders_items.reset()
         self._folders_by_id.reset()
+        self._folder_ids_by_parent_id = {}
 
         self._task_items.reset()
         self._tasks_by_id.reset()
@@ -408,6 +432,21 @@ class HierarchyModel(object):
             self._refresh_tasks_cache(project_name, folder_id, sender)
         return task_cache.get_data()
 
+    def prefetch_task_items(self, project_name, folder_ids):
+        """Fetch task items of multiple folders using one query.
+
+        Task items of folders which are already cached are not fetched
+        again. Can be used to fetch tasks of all visible folders.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+        """
+
+        if not project_name or not folder_ids:
+            return
+        self._fetch_tasks(project_name, folder_ids)
+
     def get_folder_entities(self, project_name, folder_ids):
         """Get folder entities by ids.
 
@@ -522,9 +561,25 @@ class HierarchyModel(object):
 
         with self._folder_refresh_event_manager(project_name, sender):
             folder_items = self._query_folders(project_name)
+            folder_ids_by_parent_id = collections.defaultdict(list)
+            for folder_item in folder_items.values():
+                folder_ids_by_parent_id[folder_item.parent_id].append(
+                    folder_item.entity_id
+                )
+            self._folder_ids_by_parent_id[project_name] = (
+                folder_ids_by_parent_id
+            )
             self._folders_items[project_name].update_data(folder_items)
 
     def _query_folders(self, project_name):
+        if self.use_hierarchy_snapshot:
+            return {
+                row[0]: FolderItem(*row, None)
+                for row in self._hierarchy_snapshot.get_folder_rows(
+                    project_name
+                )
+            }
+
         hierarchy = ayon_api.get_folders_hierarchy(project_name)
 
         folder_items = {}
@@ -556,19 +611,130 @@ class HierarchyModel(object):
             project_cache[task_id].update_data(task)
 
     def _refresh_tasks_cache(self, project_name, folder_id, sender=None):
-        if folder_id in self._tasks_refreshing:
-            return
-
+        folder_ids = self._get_prefetch_folder_ids(project_name, folder_id)
         with self._task_refresh_event_manager(
             project_name, folder_id, sender
         ):
-            task_items = self._query_tasks(project_name, folder_id)
-            self._task_items[project_name][folder_id] = task_items
+            self._fetch_tasks(project_name, folder_ids)
 
-    def _query_tasks(self, project_name, folder_id):
-        tasks = list(ayon_api.get_tasks(
-            project_name,
-            folder_ids=[folder_id],
-            fields={"id", "name", "label", "folderId", "type"}
-        ))
-        return _get_task_items_from_tasks(tasks)
+    def _get_prefetch_folder_ids(self, project_name, folder_id):
+        """Folder ids of which tasks are fetched with tasks of folder.
+
+        Args:
+            project_name (str): Project name.
+            folder_id (str): Folder id of which tasks were requested.
+
+        Returns:
+            list[str]: Folder ids, requested folder id is first.
+        """
+
+        folders_cache = self._folders_items[project_name]
+        if not folders_cache.is_valid:
+            return [folder_id]
+
+        folder_items = folders_cache.get_data()
+        if self.prefetch_project_tasks:
+            folder_ids = [folder_id]
+            folder_ids.extend(
+                item_id
+                for item_id in folder_items
+                if item_id != folder_id
+            )
+            return folder_ids
+
+        folder_item = folder_items.get(folder_id)
+        if folder_item is None:
+            return [folder_id]
+
+        folder_ids_by_parent_id = self._folder_ids_by_parent_id.get(
+            project_name, {}
+        )
+        folder_ids = [folder_id]
+        for parent_id in (folder_item.parent_id, folder_id):
+            for item_id in folder_ids_by_parent_id.get(parent_id, []):
+                if len(folder_ids) >= self.task_prefetch_limit:
+                    return folder_ids
+                if item_id != folder_id:
+                    folder_ids.append(item_id)
+        return folder_ids
+
+    def _fetch_tasks(self, project_name, folder_ids):
+        """Fetch tasks of folders which are not cached.
+
+        Folders of which tasks are already being fetched by other thread are
+        not queried again, but the thread waits for the result.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+        """
+
+        project_cache = self._task_items[project_name]
+        query_folder_ids = []
+        wait_events = []
+        with self._tasks_lock:
+            for folder_id in folder_ids:
+                key = (project_name, folder_id)
+                event = self._tasks_query_events.get(key)
+                if event is not None:
+                    wait_events.append(event)
+                    continue
+
+                if project_cache[folder_id].is_valid:
+                    continue
+                self._tasks_query_events[key] = threading.Event()
+                query_folder_ids.append(folder_id)
+
+        try:
+            if query_folder_ids:
+                task_items_by_folder_id = self._query_tasks(
+                    project_name, query_folder_ids
+                )
+                for folder_id in query_folder_ids:
+                    project_cache[folder_id] = (
+                        task_items_by_folder_id.get(folder_id) or []
+                    )
+        finally:
+            with self._tasks_lock:
+                for folder_id in query_folder_ids:
+                    event = self._tasks_query_events.pop(
+                        (project_name, folder_id)
+                    )
+                    event.set()
+
+        for event in wait_events:
+            event.wait()
+
+    def _query_tasks(self, project_name, folder_ids):
+        """Query task items of folders.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (list[str]): Folder ids.
+
+        Returns:
+            dict[str, list[TaskItem]]: Task items by folder id.
+        """
+
+        fields = {"id", "name", "label", "folderId", "type"}
+        folder_ids = list(folder_ids)
+        folders_cache = self._folders_items[project_name]
+        # Don't send all folder ids in filter when all tasks are queried
+        if (
+            folders_cache.is_valid
+            and len(folder_ids) >= len(folders_cache.get_data())
+        ):
+            tasks = ayon_api.get_tasks(project_name, fields=fields)
+        else:
+            tasks = ayon_api.get_tasks(
+                project_name, folder_ids=folder_ids, fields=fields
+            )
+
+        tasks_by_folder_id = collections.defaultdict(list)
+        for task in tasks:
+            tasks_by_folder_id[task["folderId"]].append(task)
+
+        return {
+            folder_id: _get_task_items_from_tasks(folder_tasks)
+            for folder_id, folder_tasks in tasks_by_folder_id.items()
+        }
@@ -0,0 +1,438 @@
+"""Persistent local snapshot of project folders hierarchy.
+
+Querying full folders hierarchy of big projects takes a lot of time, which
+slows down opening of tools. Snapshot of hierarchy is stored per server and
+project to SQLite database in appdirs. Memory mapping is used for reading
+of the database.
+
+Snapshot stores watermark, which is time of last processed change. Snapshot
+is updated incrementally using server events of folder entities newer than
+watermark. Full hierarchy is queried only if snapshot does not exist,
+is too old, or there are too many changes. Snapshot is not used if user
+can't read events.
+"""
+import os
+import time
+import collections
+import sqlite3
+import hashlib
+import logging
+import datetime
+import contextlib
+
+import ayon_api
+
+from ayon_core.lib.local_settings import get_ayon_appdirs
+
+SNAPSHOT_VERSION = 1
+FOLDER_EVENT_TOPICS = {"entity.folder.*"}
+FOLDER_FIELDS = {"id", "parentId", "name", "path", "folderType", "label"}
+# Watermark is moved back to not miss events because of time differences
+#   between server and client
+WATERMARK_MARGIN = datetime.timedelta(minutes=5)
+# Size of memory map used to read the database (in bytes)
+MMAP_SIZE = 256 * 1024 * 1024
+
+
+def _get_utc_now():
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def _get_iso_time(value):
+    return value.isoformat()
+
+
+def _parse_iso_time(value):
+    """Parse iso time string from server to datetime in UTC.
+
+    Args:
+        value (str): Time in iso format.
+
+    Returns:
+        Union[datetime.datetime, None]: Parsed time or 'None' if value
+            can't be parsed.
+    """
+
+    if not value:
+        return None
+    # 'fromisoformat' does not support 'Z' suffix in older Python versions
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        output = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if output.tzinfo is None:
+        output = output.replace(tzinfo=datetime.timezone.utc)
+    return output
+
+
+def _get_folder_row(folder):
+    return (
+        folder["id"],
+        folder["parentId"],
+        folder["name"],
+        folder["path"],
+        folder["folderType"],
+        folder["label"],
+    )
+
+
+def _fill_folder_paths(rows_by_id):
+    """Update paths of folder rows based on their names and parents.
+
+    Paths of descendants are not part of server events when a folder is
+    renamed or moved, so paths are recalculated from the hierarchy.
+
+    Args:
+        rows_by_id (dict[str, tuple]): Folder rows by folder id.
+    """
+
+    paths_by_id = {}
+    for folder_id in rows_by_id:
+        if folder_id in paths_by_id:
+            continue
+        # Walk to the closest folder with known path
+        chain = []
+        current_id = folder_id
+        parent_path = ""
+        while current_id is not None:
+            path = paths_by_id.get(current_id)
+            if path is not None:
+                parent_path = path
+                break
+            row = rows_by_id.get(current_id)
+            # Parent is missing or hierarchy has cycle
+            if row is None or current_id in chain:
+                break
+            chain.append(current_id)
+            current_id = row[1]
+
+        for chain_id in reversed(chain):
+            parent_path = "{}/{}".format(
+                parent_path, rows_by_id[chain_id][2]
+            )
+            paths_by_id[chain_id] = parent_path
+
+    for folder_id, path in paths_by_id.items():
+        row = rows_by_id[folder_id]
+        if row[3] != path:
+            rows_by_id[folder_id] = row[:3] + (path,) + row[4:]
+
+
+class HierarchySnapshot:
+    """Persistent snapshot of folders hierarchy of projects.
+
+    Args:
+        max_age (Optional[float]): Maximum age of snapshot in seconds since
+            last full query. Older snapshots are fully re-queried, because
+            events on server may be already cleaned up.
+        max_changes (Optional[int]): Maximum number of change events
+            applied incrementally. Full query is used for more changes.
+    """
+
+    # 3 days
+    default_max_age = 3 * 24 * 60 * 60
+    default_max_changes = 5000
+
+    def __init__(self, max_age=None, max_changes=None):
+        if max_age is None:
+            max_age = self.default_max_age
+        if max_changes is None:
+            max_changes = self.default_max_changes
+        self._max_age = max_age
+        self._max_changes = max_changes
+        self._snapshots_dir = None
+        # Set to 'False' when user can't read events of server
+        self._events_available = True
+        self._log = None
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = logging.getLogger(self.__class__.__name__)
+        return self._log
+
+    def get_snapshots_dir(self):
+        """Directory where snapshots of current server are stored.
+
+        Returns:
+            str: Path to directory.
+        """
+
+        if self._snapshots_dir is None:
+            server_url = ayon_api.get_base_url() or ""
+            server_hash = hashlib.md5(
+                server_url.encode("utf-8")
+            ).hexdigest()
+            self._snapshots_dir = get_ayon_appdirs(
+                "hierarchy_snapshots", server_hash
+            )
+        return self._snapshots_dir
+
+    def get_snapshot_path(self, project_name):
+        """Path to snapshot database of project.
+
+        Args:
+            project_name (str): Project name.
+
+        Returns:
+            str: Path to SQLite database.
+        """
+
+        return os.path.join(
+            self.get_snapshots_dir(), "{}.sqlite".format(project_name)
+        )
+
+    def get_folder_rows(self, project_name):
+        """Get folder rows of project, updated from server.
+
+        Rows are loaded from snapshot and updated with server changes. Full
+        hierarchy is queried if snapshot can't be used.
+
+        Args:
+            project_name (str): Project name.
+
+        Returns:
+            list[tuple]: Folder rows with id, parent id, name, path,
+                folder type and label.
+        """
+
+        # Snapshot can't be updated without events
+        if not self._events_available:
+            return self._query_folder_rows(project_name)
+
+        try:
+            rows = self._get_updated_folder_rows(project_name)
+            if rows is not None:
+                return rows
+        except Exception:
+            self.log.warning(
+                "Failed to use hierarchy snapshot of project '{}'.".format(
+                    project_name
+                ),
+                exc_info=True
+            )
+
+        # Watermark is stored before query, so changes made during the query
+        #   are applied on next update
+        watermark = _get_iso_time(_get_utc_now() - WATERMARK_MARGIN)
+        rows = self._query_folder_rows(project_name)
+        try:
+            self._save_snapshot(project_name, rows, watermark)
+        except Exception:
+            self.log.warning(
+                "Failed to store hierarchy snapshot of project '{}'.".format(
+                    project_name
+                ),
+                exc_info=True
+            )
+        return rows
+
+    def remove_snapshot(self, project_name):
+        """Remove snapshot of project.
+
+        Args:
+            project_name (str): Project name.
+        """
+
+        path = self.get_snapshot_path(project_name)
+        if os.path.exists(path):
+            os.remove(path)
+
+    @contextlib.contextmanager
+    def _connect(self, project_name):
+        path = self.get_snapshot_path(project_name)
+        dirpath = os.path.dirname(path)
+        os.makedirs(dirpath, exist_ok=True)
+        # Other tools may write to the same snapshot
+        connection = sqlite3.connect(path, timeout=10)
+        try:
+            connection.execute("PRAGMA mmap_size = {}".format(MMAP_SIZE))
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta"
+                " (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS folders ("
+                "id TEXT PRIMARY KEY,"
+                " parent_id TEXT,"
+                " name TEXT,"
+                " path TEXT,"
+                " folder_type TEXT,"
+                " label TEXT)"
+            )
+            yield connection
+        finally:
+            connection.close()
+
+    def _get_meta(self, connection):
+        return dict(connection.execute("SELECT key, value FROM meta"))
+
+    def _get_updated_folder_rows(self, project_name):
+        if not os.path.exists(self.get_snapshot_path(project_name)):
+            return None
+
+        with self._connect(project_name) as connection:
+            meta = self._get_meta(connection)
+            if meta.get("version") != str(SNAPSHOT_VERSION):
+                return None
+
+            watermark = meta.get("watermark")
+            full_query_time = float(meta.get("full_query_time") or 0)
+            if (
+                not watermark
+                or time.time() - full_query_time > self._max_age
+            ):
+                return None
+
+            rows_by_id = {
+                row[0]: row
+                for row in connection.execute(
+                    "SELECT id, parent_id, name, path, folder_type, label"
+                    " FROM folders"
+                )
+            }
+
+        try:
+            result = self._query_changes(project_name, watermark)
+        except (
+            ayon_api.exceptions.GraphQlQueryFailed,
+            ayon_api.exceptions.HTTPRequestError,
+        ):
+            self._events_available = False
+            self.log.info(
+                "Events can't be queried, hierarchy snapshots are disabled.",
+                exc_info=True
+            )
+            return None
+        if result is None:
+            return None
+
+        changed_ids, new_watermark = result
+        if not changed_ids:
+            return list(rows_by_id.values())
+
+        orig_rows_by_id = dict(rows_by_id)
+        found_ids = set()
+        for folder in ayon_api.get_folders(
+            project_name,
+            folder_ids=changed_ids,
+            active=None,
+            fields=FOLDER_FIELDS,
+        ):
+            row = _get_folder_row(folder)
+            found_ids.add(row[0])
+            rows_by_id[row[0]] = row
+
+        # Folders which were not found were removed
+        removed_ids = changed_ids - found_ids
+        for folder_id in removed_ids:
+            rows_by_id.pop(folder_id, None)
+
+        _fill_folder_paths(rows_by_id)
+        changed_rows = [
+            row
+            for folder_id, row in rows_by_id.items()
+            if orig_rows_by_id.get(folder_id) != row
+        ]
+
+        with self._connect(project_name) as connection:
+            with connection:
+                connection.executemany(
+                    "DELETE FROM folders WHERE id = ?",
+                    [(folder_id, ) for folder_id in removed_ids]
+                )
+                connection.executemany(
+                    "INSERT OR REPLACE INTO folders VALUES (?, ?, ?, ?, ?, ?)",
+                    changed_rows
+                )
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('watermark', ?)",
+                    (new_watermark, )
+                )
+        return list(rows_by_id.values())
+
+    def _query_changes(self, project_name, watermark):
+        """Query ids of folders changed since watermark.
+
+        Args:
+            project_name (str): Project name.
+            watermark (str): Time of last processed change.
+
+        Returns:
+            Union[tuple[set[str], str], None]: Changed folder ids and new
+                watermark, or 'None' if there are too many changes.
+        """
+
+        changed_ids = set()
+        new_watermark = watermark
+        new_watermark_time = _parse_iso_time(watermark)
+        events_count = 0
+        for event in ayon_api.get_events(
+            topics=FOLDER_EVENT_TOPICS,
+            project_names={project_name},
+            newer_than=watermark,
+            fields={"topic", "summary", "updatedAt"},
+        ):
+            events_count += 1
+            if events_count > self._max_changes:
+                return None
+
+            summary = event.get("summary") or {}
+            folder_id = summary.get("entityId")
+            if folder_id:
+                changed_ids.add(folder_id)
+
+            # Compare times, format of server time may be different
+            #   from format of watermark
+            updated_at = event.get("updatedAt")
+            updated_at_time = _parse_iso_time(updated_at)
+            if updated_at_time is None:
+                continue
+            if (
+                new_watermark_time is None
+                or updated_at_time > new_watermark_time
+            ):
+                new_watermark = updated_at
+                new_watermark_time = updated_at_time
+        return changed_ids, new_watermark
+
+    def _query_folder_rows(self, project_name):
+        hierarchy = ayon_api.get_folders_hierarchy(project_name)
+
+        rows = []
+        hierarchy_queue = collections.deque(hierarchy["hierarchy"])
+        while hierarchy_queue:
+            item = hierarchy_queue.popleft()
+            name = item["name"]
+            path_parts = list(item["parents"])
+            path_parts.append(name)
+            rows.append((
+                item["id"],
+                item["parentId"],
+                name,
+                "/" + "/".join(path_parts),
+                item["folderType"],
+                item["label"],
+            ))
+            hierarchy_queue.extend(item["children"] or [])
+        return rows
+
+    def _save_snapshot(self, project_name, rows, watermark):
+        with self._connect(project_name) as connection:
+            with connection:
+                connection.execute("DELETE FROM folders")
+                connection.execute("DELETE FROM meta")
+                connection.executemany(
+                    "INSERT INTO folders VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                connection.executemany(
+                    "INSERT INTO meta VALUES (?, ?)",
+                    (
+                        ("version", str(SNAPSHOT_VERSION)),
+                        ("watermark", watermark),
+                        ("full_query_time", str(time.time())),
+                    )
+                )
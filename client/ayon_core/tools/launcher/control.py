@@ -66,6 +66,9 @@ class BaseLauncherController(
         return self._hierarchy_model.get_task_items(
             project_name, folder_id, sender)
 
+    def prefetch_task_items(self, project_name, folder_ids):
+        self._hierarchy_model.prefetch_task_items(project_name, folder_ids)
+
     # Project settings for applications actions
     def get_project_settings(self, project_name):
         if project_name in self._project_settings:
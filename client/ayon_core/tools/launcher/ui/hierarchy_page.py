@@ -49,7 +49,9 @@ class HierarchyPage(QtWidgets.QWidget):
         folders_filter_text = PlaceholderLineEdit(folders_wrapper)
         folders_filter_text.setPlaceholderText("Filter folders...")
 
-        folders_widget = FoldersWidget(controller, folders_wrapper)
+        folders_widget = FoldersWidget(
+            controller, folders_wrapper, prefetch_tasks=True
+        )
 
         folders_wrapper_layout = QtWidgets.QVBoxLayout(folders_wrapper)
         folders_wrapper_layout.setContentsMargins(0, 0, 0, 0)
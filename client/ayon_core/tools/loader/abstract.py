@@ -466,6 +466,18 @@ class FrontendLoaderController(_BaseLoaderController):
 
         pass
 
+    @abstractmethod
+    def emit_background_events(self):
+        """Emit events which were triggered from background threads.
+
+        Events can't be processed in other thread than main thread because
+        callbacks are changing UI. They're emitted on next event emitted
+        from main thread, or when this method is called. Should be called
+        in main thread when data were fetched in background.
+        """
+
+        pass
+
     # Expected selection helpers
     @abstractmethod
     def expected_project_selected(self, project_name):
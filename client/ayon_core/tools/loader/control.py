@@ -1,5 +1,7 @@
 import logging
 import uuid
+import threading
+import collections
 
 import ayon_api
 
@@ -100,6 +102,10 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
         self._host = host
 
         self._event_system = self._create_event_system()
+        # Events emitted from background threads are emitted in main thread
+        self._main_thread = threading.current_thread()
+        self._background_events = collections.deque()
+        self._background_events_lock = threading.Lock()
 
         self._project_anatomy_cache = NestedCacheItem(
             levels=1, lifetime=60)
@@ -130,11 +136,22 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
 
         if data is None:
             data = {}
-        self._event_system.emit(topic, data, source)
+        self._emit_event_in_main_thread(topic, data, source)
 
     def register_event_callback(self, topic, callback):
         self._event_system.add_callback(topic, callback)
 
+    def emit_background_events(self):
+        if threading.current_thread() is not self._main_thread:
+            return
+
+        while True:
+            with self._background_events_lock:
+                if not self._background_events:
+                    break
+                topic, data, source = self._background_events.popleft()
+            self._event_system.emit(topic, data, source)
+
     def reset(self):
         self._emit_event("controller.reset.started")
 
@@ -412,4 +429,14 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
         return QueuedEventSystem()
 
     def _emit_event(self, topic, data=None):
-        self._event_system.emit(topic, data or {}, "controller")
+        self._emit_event_in_main_thread(topic, data or {}, "controller")
+
+    def _emit_event_in_main_thread(self, topic, data, source):
+        # Event system is not thread safe and callbacks are changing UI
+        if threading.current_thread() is not self._main_thread:
+            with self._background_events_lock:
+                self._background_events.append((topic, data, source))
+            return
+
+        self.emit_background_events()
+        self._event_system.emit(topic, data, source)
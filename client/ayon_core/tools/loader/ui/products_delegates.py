@@ -213,18 +213,16 @@ class SiteSyncDelegate(QtWidgets.QStyledItemDelegate):
         active_icon = index.data(ACTIVE_SITE_ICON_ROLE)
         remote_icon = index.data(REMOTE_SITE_ICON_ROLE)
 
-        availability_active = "{}/{}".format(
-            index.data(SYNC_ACTIVE_SITE_AVAILABILITY),
-            index.data(REPRESENTATIONS_COUNT_ROLE)
-        )
-        availability_remote = "{}/{}".format(
-            index.data(SYNC_REMOTE_SITE_AVAILABILITY),
-            index.data(REPRESENTATIONS_COUNT_ROLE)
-        )
-
-        if availability_active is None or availability_remote is None:
+        # Availability is fetched in background
+        repre_count = index.data(REPRESENTATIONS_COUNT_ROLE)
+        active_count = index.data(SYNC_ACTIVE_SITE_AVAILABILITY)
+        remote_count = index.data(SYNC_REMOTE_SITE_AVAILABILITY)
+        if repre_count is None or active_count is None or remote_count is None:
             return
 
+        availability_active = "{}/{}".format(active_count, repre_count)
+        availability_remote = "{}/{}".format(remote_count, repre_count)
+
         items_to_draw = [
             (value, icon)
             for value, icon in (
@@ -1,3 +1,4 @@
+import uuid
 import collections
 
 import qtawesome
@@ -5,6 +6,10 @@ from qtpy import QtGui, QtCore
 
 from ayon_core.style import get_default_entity_icon_color
 from ayon_core.tools.utils import get_qt_icon
+from ayon_core.tools.common_models import (
+    PRIORITY_HIGH,
+    get_background_fetcher,
+)
 
 PRODUCTS_MODEL_SENDER_NAME = "qt_products_model"
 
@@ -38,11 +43,30 @@ REMOTE_SITE_ICON_ROLE = QtCore.Qt.UserRole + 27
 REPRESENTATIONS_COUNT_ROLE = QtCore.Qt.UserRole + 28
 SYNC_ACTIVE_SITE_AVAILABILITY = QtCore.Qt.UserRole + 29
 SYNC_REMOTE_SITE_AVAILABILITY = QtCore.Qt.UserRole + 30
+# Key of products which are not yet added under group or merged item
+_FETCH_KEY_ROLE = QtCore.Qt.UserRole + 31
+_ROOT_FETCH_KEY = "root"
 
 
 class ProductsModel(QtGui.QStandardItemModel):
+    """Model of products of selected folders.
+
+    Group and merged items are created on refresh, but product items are
+    added when view requests them using 'fetchMore'. Root product items
+    are added in batches when rows are scrolled into view, product items
+    of group or merged item are added when the item is expanded.
+    Representation counts and site sync availability are fetched in
+    background only for added product items.
+    """
+
     refreshed = QtCore.Signal()
     version_changed = QtCore.Signal()
+    # Emitted from background thread with future of refresh data
+    _refresh_data_fetched = QtCore.Signal(object)
+    # Emitted from background thread with future of versions data
+    _versions_data_fetched = QtCore.Signal(object)
+    # Number of root product items added on 'fetchMore'
+    fetch_batch_size = 100
     column_labels = [
         "Product name",
         "Product type",
@@ -103,6 +127,22 @@ class ProductsModel(QtGui.QStandardItemModel):
         sitesync_avail_col: VERSION_AVAILABLE_ROLE,
 
     }
+    # Values used to sort product items which were not added yet by column
+    # - attribute of product item or of its last version item
+    _sort_value_attributes = {
+        product_name_col: ("product", "product_name"),
+        product_type_col: ("product", "product_type"),
+        folders_label_col: ("product", "folder_label"),
+        version_col: ("version", "version"),
+        status_col: ("version", "status"),
+        published_time_col: ("version", "published_time"),
+        author_col: ("version", "author"),
+        frame_range_col: ("version", "frame_range"),
+        duration_col: ("version", "duration"),
+        handles_col: ("version", "handles"),
+        step_col: ("version", "step"),
+        in_scene_col: ("product", "product_in_scene"),
+    }
 
     def __init__(self, controller):
         super(ProductsModel, self).__init__()
@@ -127,11 +167,20 @@ class ProductsModel(QtGui.QStandardItemModel):
         self._last_folder_ids = []
         self._last_project_statuses = {}
 
-    def get_product_item_indexes(self):
-        return [
-            item.index()
-            for item in self._items_by_id.values()
-        ]
+        # Product items waiting for 'fetchMore' by fetch key
+        self._pending_product_items = {}
+        self._pending_parent_items = {}
+        self._fetch_all = False
+        self._fetch_sort_column = self.product_name_col
+        self._fetch_sort_order = QtCore.Qt.AscendingOrder
+        self._active_site_icon = None
+        self._remote_site_icon = None
+
+        self._fetch_group = "loader.products.{}".format(uuid.uuid4().hex)
+        self._refresh_future = None
+        self._versions_data_futures = {}
+        self._refresh_data_fetched.connect(self._on_refresh_data_fetched)
+        self._versions_data_fetched.connect(self._on_versions_data_fetched)
 
     def get_product_item_by_id(self, product_id):
         """
@@ -152,6 +201,61 @@ class ProductsModel(QtGui.QStandardItemModel):
         # Ignore change if groups are not available
         self.refresh(self._last_project_name, self._last_folder_ids)
 
+    def hasChildren(self, parent=None):
+        if parent is None:
+            parent = QtCore.QModelIndex()
+        # Group and merged items have children before they are fetched
+        if self._pending_product_items.get(self._get_fetch_key(parent)):
+            return True
+        return super(ProductsModel, self).hasChildren(parent)
+
+    def canFetchMore(self, parent):
+        if self._pending_product_items.get(self._get_fetch_key(parent)):
+            return True
+        return super(ProductsModel, self).canFetchMore(parent)
+
+    def fetchMore(self, parent):
+        fetch_key = self._get_fetch_key(parent)
+        if not self._pending_product_items.get(fetch_key):
+            super(ProductsModel, self).fetchMore(parent)
+            return
+
+        # All children of expanded item are added at once
+        count = None
+        if fetch_key == _ROOT_FETCH_KEY:
+            count = self.fetch_batch_size
+        self._add_pending_product_items(fetch_key, count)
+
+    def set_fetch_all(self, fetch_all):
+        """Add all product items at once instead of on demand.
+
+        Should be enabled when items are filtered by name, because filter
+        can't match items which were not added yet.
+
+        Args:
+            fetch_all (bool): Add all product items.
+        """
+
+        self._fetch_all = fetch_all
+        if fetch_all:
+            self._add_all_pending_product_items()
+
+    def set_fetch_sort(self, column, order):
+        """Set sorting of view, used for order of added product items.
+
+        Product items are added in order of sorted view, so items on top
+        of the view are added first. All items are added if values of the
+        column are not available before an item is added.
+
+        Args:
+            column (int): Sort column.
+            order (QtCore.Qt.SortOrder): Sort order.
+        """
+
+        self._fetch_sort_column = column
+        self._fetch_sort_order = order
+        self._sort_pending_product_items()
+
     def flags(self, index):
         # Make the version column editable
         if index.column() == self.version_col and index.data(PRODUCT_ID_ROLE):
@@ -268,8 +372,169 @@ class ProductsModel(QtGui.QStandardItemModel):
         self._group_items_by_name = {}
         self._merged_items_by_id = {}
         self._product_items_by_id = {}
+        self._pending_product_items = {}
+        self._pending_parent_items = {}
+        self._versions_data_futures = {}
         self._reset_merge_color = True
 
+    def _add_all_pending_product_items(self):
+        for fetch_key in tuple(self._pending_product_items):
+            self._add_pending_product_items(fetch_key)
+
+    def _sort_pending_product_items(self):
+        """Sort pending product items to match sorting of view."""
+
+        sort_attribute = self._sort_value_attributes.get(
+            self._fetch_sort_column
+        )
+        if sort_attribute is None:
+            self._add_all_pending_product_items()
+            return
+
+        item_type, attr_name = sort_attribute
+
+        def _get_sort_key(product_item):
+            item = product_item
+            if item_type == "version":
+                item = max(product_item.version_items.values())
+            value = getattr(item, attr_name)
+            # Items without value are first in ascending order
+            return value is not None, value
+
+        reverse = self._fetch_sort_order == QtCore.Qt.DescendingOrder
+        for pending_items in self._pending_product_items.values():
+            pending_items.sort(key=_get_sort_key, reverse=reverse)
+
+    def _add_pending_product_items(self, fetch_key, count=None):
+        """Add pending product items to model.
+
+        Args:
+            fetch_key (str): Fetch key of parent item.
+            count (Optional[int]): Maximum number of added items, all
+                items are added if is 'None'.
+        """
+
+        pending_items = self._pending_product_items.get(fetch_key)
+        if not pending_items:
+            return
+
+        if count is None:
+            count = len(pending_items)
+        product_items = pending_items[:count]
+        del pending_items[:count]
+
+        new_items = [
+            self._get_product_model_item(
+                product_item,
+                self._active_site_icon,
+                self._remote_site_icon,
+                {},
+                {},
+            )
+            for product_item in product_items
+        ]
+        self._pending_parent_items[fetch_key].appendRows(new_items)
+        self._request_versions_data(product_items)
+
+    def _get_fetch_key(self, parent):
+        """Key of pending product items of parent index.
+
+        Args:
+            parent (QtCore.QModelIndex): Parent index.
+
+        Returns:
+            Union[str, None]: Fetch key, 'None' if parent can't have
+                pending product items.
+        """
+
+        if not parent.isValid():
+            return _ROOT_FETCH_KEY
+        return self.index(parent.row(), 0, parent.parent()).data(
+            _FETCH_KEY_ROLE
+        )
+
+    def _request_versions_data(self, product_items):
+        """Fetch data of last versions of product items in background.
+
+        Args:
+            product_items (list[ProductItem]): Product items added to model.
+        """
+
+        product_ids_by_version_id = {}
+        for product_item in product_items:
+            versions = list(product_item.version_items.values())
+            versions.sort()
+            product_ids_by_version_id[versions[-1].version_id] = (
+                product_item.product_id
+            )
+
+        future = get_background_fetcher().submit(
+            None,
+            self._fetch_versions_data,
+            self._last_project_name,
+            set(product_ids_by_version_id),
+            group=self._fetch_group,
+            priority=PRIORITY_HIGH,
+        )
+        self._versions_data_futures[future] = product_ids_by_version_id
+        future.add_done_callback(self._versions_data_fetched.emit)
+
+    def _fetch_versions_data(self, project_name, version_ids):
+        """Fetch data of versions, called in background thread.
+
+        Args:
+            project_name (str): Project name.
+            version_ids (set[str]): Version ids.
+
+        Returns:
+            tuple[dict[str, int], dict[str, tuple[int, int]]]: Mapping of
+                representation count and sync availability by version id.
+        """
+
+        return (
+            self._controller.get_versions_representation_count(
+                project_name, version_ids
+            ),
+            self._controller.get_version_sync_availability(
+                project_name, version_ids
+            ),
+        )
+
+    def _on_versions_data_fetched(self, future):
+        # Emit events triggered during fetching
+        self._controller.emit_background_events()
+        # Ignore results of previous refreshes
+        product_ids_by_version_id = self._versions_data_futures.pop(
+            future, None
+        )
+        if (
+            product_ids_by_version_id is None
+            or future.cancelled()
+            or future.exception() is not None
+        ):
+            return
+
+        repre_count_by_version_id, sync_availability_by_version_id = (
+            future.result()
+        )
+        for version_id, product_id in product_ids_by_version_id.items():
+            model_item = self._items_by_id.get(product_id)
+            # Version could be changed meanwhile
+            if (
+                model_item is None
+                or model_item.data(VERSION_ID_ROLE) != version_id
+            ):
+                continue
+            active, remote = sync_availability_by_version_id.get(
+                version_id, (None, None)
+            )
+            model_item.setData(
+                repre_count_by_version_id.get(version_id),
+                REPRESENTATIONS_COUNT_ROLE
+            )
+            model_item.setData(active, SYNC_ACTIVE_SITE_AVAILABILITY)
+            model_item.setData(remote, SYNC_REMOTE_SITE_AVAILABILITY)
+
     def _get_group_icon(self):
         if self._group_icon is None:
             self._group_icon = qtawesome.icon(
@@ -355,8 +620,11 @@ class ProductsModel(QtGui.QStandardItemModel):
                     project_name, [version_id]
                 )
             )
-        repre_count = repre_count_by_version_id[version_id]
-        active, remote = sync_availability_by_version_id[version_id]
+        # Values are 'None' until they are fetched in background
+        repre_count = repre_count_by_version_id.get(version_id)
+        active, remote = sync_availability_by_version_id.get(
+            version_id, (None, None)
+        )
 
         model_item.setData(repre_count, REPRESENTATIONS_COUNT_ROLE)
         model_item.setData(active, SYNC_ACTIVE_SITE_AVAILABILITY)
@@ -388,8 +656,8 @@ class ProductsModel(QtGui.QStandardItemModel):
             model_item.setData(product_type_icon, PRODUCT_TYPE_ICON_ROLE)
             model_item.setData(product_item.folder_id, FOLDER_ID_ROLE)
 
-            self._product_items_by_id[product_id] = product_item
             self._items_by_id[product_id] = model_item
+        self._product_items_by_id[product_item.product_id] = product_item
 
         model_item.setData(product_item.folder_label, FOLDER_LABEL_ROLE)
         in_scene = 1 if product_item.product_in_scene else 0
@@ -410,52 +678,97 @@ class ProductsModel(QtGui.QStandardItemModel):
         return self._last_project_name
 
     def refresh(self, project_name, folder_ids):
+        """Refresh products of folders.
+
+        Data are fetched in background and model is filled when they are
+        received. Previous refresh, which did not start yet, is cancelled.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+        """
+
         self._clear()
 
         self._last_project_name = project_name
         self._last_folder_ids = folder_ids
-        status_items = self._controller.get_project_status_items(project_name)
+
+        fetcher = get_background_fetcher()
+        fetcher.cancel_group(self._fetch_group)
+        future = fetcher.submit(
+            (self._fetch_group, project_name, tuple(sorted(folder_ids))),
+            self._fetch_refresh_data,
+            project_name,
+            folder_ids,
+            group=self._fetch_group,
+            priority=PRIORITY_HIGH,
+        )
+        self._refresh_future = future
+        future.add_done_callback(self._refresh_data_fetched.emit)
+
+    def _fetch_refresh_data(self, project_name, folder_ids):
+        """Fetch data for refresh, called in background thread.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+
+        Returns:
+            dict[str, Any]: Data used to fill the model.
+        """
+
+        return {
+            "status_items": self._controller.get_project_status_items(
+                project_name
+            ),
+            "active_site_icon_def": (
+                self._controller.get_active_site_icon_def(project_name)
+            ),
+            "remote_site_icon_def": (
+                self._controller.get_remote_site_icon_def(project_name)
+            ),
+            "product_items": self._controller.get_product_items(
+                project_name,
+                folder_ids,
+                sender=PRODUCTS_MODEL_SENDER_NAME
+            ),
+        }
+
+    def _on_refresh_data_fetched(self, future):
+        # Emit events triggered during fetching
+        self._controller.emit_background_events()
+        # Ignore results of previous refreshes
+        if future is not self._refresh_future:
+            return
+        self._refresh_future = None
+        if future.cancelled():
+            return
+
+        if future.exception() is not None:
+            self.refreshed.emit()
+            return
+        self._fill_items(future.result())
+
+    def _fill_items(self, refresh_data):
         self._last_project_statuses = {
             status_item.name: status_item
-            for status_item in status_items
+            for status_item in refresh_data["status_items"]
         }
 
-        active_site_icon_def = self._controller.get_active_site_icon_def(
-            project_name
+        self._active_site_icon = get_qt_icon(
+            refresh_data["active_site_icon_def"]
         )
-        remote_site_icon_def = self._controller.get_remote_site_icon_def(
-            project_name
+        self._remote_site_icon = get_qt_icon(
+            refresh_data["remote_site_icon_def"]
         )
-        active_site_icon = get_qt_icon(active_site_icon_def)
-        remote_site_icon = get_qt_icon(remote_site_icon_def)
 
-        product_items = self._controller.get_product_items(
-            project_name,
-            folder_ids,
-            sender=PRODUCTS_MODEL_SENDER_NAME
-        )
+        product_items = refresh_data["product_items"]
         product_items_by_id = {
             product_item.product_id: product_item
             for product_item in product_items
         }
-        last_version_id_by_product_id = {}
-        for product_item in product_items:
-            versions = list(product_item.version_items.values())
-            versions.sort()
-            last_version = versions[-1]
-            last_version_id_by_product_id[product_item.product_id] = (
-                last_version.version_id
-            )
-
-        version_ids = set(last_version_id_by_product_id.values())
-        repre_count_by_version_id = self._controller.get_versions_representation_count(
-            project_name, version_ids
-        )
-        sync_availability_by_version_id = (
-            self._controller.get_version_sync_availability(
-                project_name, version_ids
-            )
-        )
+        # Product items are available even before they are added to model
+        self._product_items_by_id = dict(product_items_by_id)
 
         # Prepare product groups
         product_name_matches_by_group = collections.defaultdict(dict)
@@ -507,17 +820,19 @@ class ProductsModel(QtGui.QStandardItemModel):
             if parent_item is not None and parent_item.row() < 0:
                 new_root_items.append(parent_item)
 
-            for product_item in top_items:
-                item = self._get_product_model_item(
-                    product_item,
-                    active_site_icon,
-                    remote_site_icon,
-                    repre_count_by_version_id,
-                    sync_availability_by_version_id,
-                )
-                new_items.append(item)
+            # Product items are added on 'fetchMore'
+            fetch_key = _ROOT_FETCH_KEY
+            pending_parent_item = root_item
+            if parent_item is not None:
+                fetch_key = "group:{}".format(group_name)
+                parent_item.setData(fetch_key, _FETCH_KEY_ROLE)
+                pending_parent_item = parent_item
+            self._pending_parent_items[fetch_key] = pending_parent_item
+            self._pending_product_items.setdefault(fetch_key, []).extend(
+                top_items
+            )
 
-            for path_info in merged_product_items.values():
+            for path, path_info in merged_product_items.items():
                 product_name, product_items = path_info
                 (merged_color_hex, merged_color_qt) = self._get_next_color()
                 merged_color = qtawesome.icon(
@@ -527,23 +842,19 @@ class ProductsModel(QtGui.QStandardItemModel):
                 merged_item.setData(merged_color, QtCore.Qt.DecorationRole)
                 new_items.append(merged_item)
 
-                merged_product_types = set()
-                new_merged_items = []
-                for product_item in product_items:
-                    item = self._get_product_model_item(
-                        product_item,
-                        active_site_icon,
-                        remote_site_icon,
-                        repre_count_by_version_id,
-                        sync_availability_by_version_id,
-                    )
-                    new_merged_items.append(item)
-                    merged_product_types.add(product_item.product_type)
-
+                merged_fetch_key = "merged:{}".format(path)
+                merged_item.setData(merged_fetch_key, _FETCH_KEY_ROLE)
+                self._pending_parent_items[merged_fetch_key] = merged_item
+                self._pending_product_items.setdefault(
+                    merged_fetch_key, []
+                ).extend(product_items)
                 merged_item.setData(
-                    "|".join(merged_product_types), PRODUCT_TYPE_ROLE)
-                if new_merged_items:
-                    merged_item.appendRows(new_merged_items)
+                    "|".join({
+                        product_item.product_type
+                        for product_item in product_items
+                    }),
+                    PRODUCT_TYPE_ROLE
+                )
 
             if not new_items:
                 continue
@@ -556,6 +867,14 @@ class ProductsModel(QtGui.QStandardItemModel):
         if new_root_items:
             root_item.appendRows(new_root_items)
 
+        if self._fetch_all:
+            self._add_all_pending_product_items()
+        else:
+            self._sort_pending_product_items()
+            # Add first batch of root product items, view requests more
+            #   when needed
+            self.fetchMore(QtCore.QModelIndex())
+
         self.refreshed.emit()
     # ---------------------------------
     #   This implementation does not call '_clear' at the start
@@ -156,6 +156,12 @@ class ProductsWidget(QtWidgets.QWidget):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(products_view, 1)
 
+        products_header = products_view.header()
+        products_model.set_fetch_sort(
+            products_header.sortIndicatorSection(),
+            products_header.sortIndicatorOrder(),
+        )
+        products_header.sortIndicatorChanged.connect(self._on_sort_changed)
         products_proxy_model.rowsInserted.connect(self._on_rows_inserted)
         products_proxy_model.rowsMoved.connect(self._on_rows_moved)
         products_model.refreshed.connect(self._on_refresh)
@@ -190,6 +196,8 @@ class ProductsWidget(QtWidgets.QWidget):
 
         self._selected_project_name = None
         self._selected_folder_ids = set()
+        self._name_filter = ""
+        self._product_type_filters = {}
 
         self._selected_merged_products = []
         self._selected_versions_info = []
@@ -213,6 +221,8 @@ class ProductsWidget(QtWidgets.QWidget):
             name (str): The string filter.
         """
 
+        self._name_filter = name
+        self._update_fetch_all()
         self._products_proxy_model.setFilterFixedString(name)
 
     def set_product_type_filter(self, product_type_filters):
@@ -223,10 +233,22 @@ class ProductsWidget(QtWidgets.QWidget):
                 types.
         """
 
+        self._product_type_filters = product_type_filters
+        self._update_fetch_all()
         self._products_proxy_model.set_product_type_filters(
             product_type_filters
         )
 
+    def _update_fetch_all(self):
+        # Filters can match only items which were added to model
+        fetch_all = bool(self._name_filter) or not all(
+            self._product_type_filters.values()
+        )
+        self._products_model.set_fetch_all(fetch_all)
+
+    def _on_sort_changed(self, column, order):
+        self._products_model.set_fetch_sort(column, order)
+
     def set_enable_grouping(self, enable_grouping):
         self._products_model.set_enable_grouping(enable_grouping)
 
@@ -294,6 +316,7 @@ class ProductsWidget(QtWidgets.QWidget):
         indexes_queue.extend(selection_model.selectedIndexes())
         while indexes_queue:
             index = indexes_queue.popleft()
+            self._fetch_children(model, index)
             for row in range(model.rowCount(index)):
                 child_index = model.index(row, 0, index)
                 indexes_queue.append(child_index)
@@ -325,6 +348,20 @@ class ProductsWidget(QtWidgets.QWidget):
             representation_ids=action_item.representation_ids,
         )
 
+    def _fetch_children(self, model, index):
+        """Make sure product items under group or merged item are added.
+
+        Args:
+            model (QtCore.QAbstractItemModel): Model of products view.
+            index (QtCore.QModelIndex): Index of group or merged item.
+        """
+
+        if (
+            model.data(index, GROUP_TYPE_ROLE) is not None
+            and model.canFetchMore(index)
+        ):
+            model.fetchMore(index)
+
     def _on_selection_change(self):
         selected_merged_products = []
         selection_model = self._products_view.selectionModel()
@@ -364,6 +401,9 @@ class ProductsWidget(QtWidgets.QWidget):
                 })
                 continue
 
+            # Children of collapsed group and merged items may not be
+            #   added to model yet
+            self._fetch_children(model, index)
             if group_type == 0:
                 for row in range(model.rowCount(index)):
                     child_index = model.index(row, 0, index)
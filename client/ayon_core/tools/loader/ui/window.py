@@ -1,3 +1,5 @@
+import uuid
+
 from qtpy import QtWidgets, QtCore, QtGui
 
 from ayon_core.resources import get_ayon_icon_filepath
@@ -11,6 +13,7 @@ from ayon_core.tools.utils import (
 )
 from ayon_core.tools.utils.lib import center_window
 from ayon_core.tools.utils import ProjectsCombobox
+from ayon_core.tools.common_models import get_background_fetcher
 from ayon_core.tools.loader.control import LoaderController
 
 from .folders_widget import LoaderFoldersWidget
@@ -116,6 +119,9 @@ class RefreshHandler:
 
 
 class LoaderWindow(QtWidgets.QWidget):
+    # Emitted from background thread with future of thumbnail paths
+    _thumbnails_fetched = QtCore.Signal(object)
+
     def __init__(self, controller=None, parent=None):
         super(LoaderWindow, self).__init__(parent)
 
@@ -317,6 +323,12 @@ class LoaderWindow(QtWidgets.QWidget):
         self._selected_folder_ids = set()
         self._selected_version_ids = set()
 
+        self._thumbnails_fetch_group = "loader.thumbnails.{}".format(
+            uuid.uuid4().hex
+        )
+        self._thumbnails_future = None
+        self._thumbnails_fetched.connect(self._on_thumbnails_fetched)
+
         self._products_widget.set_enable_grouping(
             self._product_group_checkbox.isChecked()
         )
@@ -470,36 +482,95 @@ class LoaderWindow(QtWidgets.QWidget):
 
     def _update_thumbnails(self):
         project_name = self._selected_project_name
+        version_ids = tuple(sorted(self._selected_version_ids))
+        folder_ids = tuple(sorted(self._selected_folder_ids))
+        if version_ids:
+            folder_ids = ()
+
+        # Thumbnails of previous selection are not needed anymore
+        fetcher = get_background_fetcher()
+        fetcher.cancel_group(self._thumbnails_fetch_group)
+        if not version_ids and not folder_ids:
+            self._thumbnails_future = None
+            self._thumbnails_widget.set_current_thumbnails(None)
+            return
+
+        future = fetcher.submit(
+            (
+                self._thumbnails_fetch_group,
+                project_name,
+                version_ids,
+                folder_ids
+            ),
+            self._get_thumbnail_paths,
+            project_name,
+            version_ids,
+            folder_ids,
+            group=self._thumbnails_fetch_group,
+        )
+        self._thumbnails_future = future
+        future.add_done_callback(self._thumbnails_fetched.emit)
+
+    def _get_thumbnail_paths(self, project_name, version_ids, folder_ids):
+        """Get thumbnail paths of versions or folders.
+
+        Called in background thread.
+
+        Args:
+            project_name (str): Project name.
+            version_ids (Iterable[str]): Version ids.
+            folder_ids (Iterable[str]): Folder ids, used only if version
+                ids are not passed.
+
+        Returns:
+            set[str]: Paths to thumbnails.
+        """
+
         thumbnail_ids = set()
-        if self._selected_version_ids:
+        if version_ids:
             thumbnail_id_by_entity_id = (
                 self._controller.get_version_thumbnail_ids(
                     project_name,
-                    self._selected_version_ids
+                    version_ids
                 )
             )
             thumbnail_ids = set(thumbnail_id_by_entity_id.values())
-        elif self._selected_folder_ids:
+        elif folder_ids:
             thumbnail_id_by_entity_id = (
                 self._controller.get_folder_thumbnail_ids(
                     project_name,
-                    self._selected_folder_ids
+                    folder_ids
                 )
             )
             thumbnail_ids = set(thumbnail_id_by_entity_id.values())
 
         thumbnail_ids.discard(None)
 
-        if not thumbnail_ids:
-            self._thumbnails_widget.set_current_thumbnails(None)
-            return
-
         thumbnail_paths = set()
         for thumbnail_id in thumbnail_ids:
             thumbnail_path = self._controller.get_thumbnail_path(
                 project_name, thumbnail_id)
             thumbnail_paths.add(thumbnail_path)
         thumbnail_paths.discard(None)
+        return thumbnail_paths
+
+    def _on_thumbnails_fetched(self, future):
+        # Emit events triggered during fetching
+        self._controller.emit_background_events()
+        # Ignore results of previous selection
+        if future is not self._thumbnails_future:
+            return
+        self._thumbnails_future = None
+        if future.cancelled():
+            return
+
+        thumbnail_paths = None
+        if future.exception() is None:
+            thumbnail_paths = future.result()
+
+        if not thumbnail_paths:
+            self._thumbnails_widget.set_current_thumbnails(None)
+            return
         self._thumbnails_widget.set_current_thumbnail_paths(thumbnail_paths)
 
     def _on_projects_refresh(self):
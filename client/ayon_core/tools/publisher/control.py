@@ -14,6 +14,7 @@ import arrow
 import pyblish.api
 import ayon_api
 
+from ayon_core.lib import pop_subprocess_stats
 from ayon_core.lib.events import QueuedEventSystem
 from ayon_core.lib.attribute_definitions import (
     UIDef,
@@ -37,9 +38,20 @@ from ayon_core.pipeline.create.context import (
     CreatorsOperationFailed,
     ConvertorsOperationFailed,
 )
-from ayon_core.pipeline.publish import get_publish_instance_label
+from ayon_core.pipeline.publish import (
+    get_publish_instance_label,
+    get_publish_profiler,
+    is_publish_profiling_enabled,
+    start_publish_profiling,
+    stop_publish_profiling,
+)
 from ayon_core.tools.common_models import HierarchyModel
 
+from .log_store import (
+    PublishLogStore,
+    get_result_log_items,
+)
+
 # Define constant for plugin orders offset
 PLUGIN_ORDER_OFFSET = 0.5
 
@@ -73,6 +85,9 @@ class PublishReportMaker:
         self._create_discover_result = None
         self._convert_discover_result = None
         self._publish_discover_result = None
+        self._creator_collection_times = {}
+        self._profiler = None
+        self._log_store = PublishLogStore()
 
         self._plugin_data_by_id = {}
         self._current_plugin = None
@@ -88,12 +103,19 @@ class PublishReportMaker:
             create_context.convertor_discover_result
         )
         self._publish_discover_result = create_context.publish_discover_result
+        self._creator_collection_times = dict(
+            create_context.creator_collection_times
+        )
 
         self._plugin_data_by_id = {}
         self._current_plugin = None
         self._current_plugin_data = {}
         self._all_instances_by_id = {}
         self._current_context = context
+        self._log_store.reset()
+
+        self.stop_profiling()
+        self._profiler = None
 
         for plugin in create_context.publish_plugins_mismatch_targets:
             plugin_data = self._add_plugin_data_item(plugin)
@@ -107,8 +129,33 @@ class PublishReportMaker:
         if self._current_plugin_data:
             self._current_plugin_data["passed"] = True
 
+        # Drop stats of subprocesses which were not run by publish plugins
+        pop_subprocess_stats()
+
         self._current_plugin = plugin
         self._current_plugin_data = self._add_plugin_data_item(plugin)
+        if self._profiler is not None:
+            self._profiler.start_plugin(plugin)
+
+    def start_profiling(self):
+        """Start profiling when publishing starts or continues.
+
+        Profiling is enabled using environment variable.
+        """
+
+        if self._profiler is not None:
+            start_publish_profiling(profiler=self._profiler)
+        elif is_publish_profiling_enabled():
+            self._profiler = start_publish_profiling()
+
+    def stop_profiling(self):
+        """Stop profiling when publishing is stopped, paused or finished."""
+
+        if (
+            self._profiler is not None
+            and get_publish_profiler() is self._profiler
+        ):
+            stop_publish_profiling()
 
     def _add_plugin_data_item(self, plugin):
         if plugin.id in self._plugin_data_by_id:
@@ -152,10 +199,15 @@ class PublishReportMaker:
         instance_id = None
         if instance is not None:
             instance_id = instance.id
+        subprocesses = pop_subprocess_stats()
+        if self._profiler is not None:
+            self._profiler.add_result(result, subprocesses)
+        # Logs are added to instance data when report is created
+        self._log_store.add_result(self._current_plugin.id, result)
         self._current_plugin_data["instances_data"].append({
             "id": instance_id,
-            "logs": self._extract_instance_log_items(result),
-            "process_time": result["duration"]
+            "process_time": result["duration"],
+            "subprocesses": subprocesses,
         })
 
     def add_action_result(self, action, result):
@@ -168,7 +220,7 @@ class PublishReportMaker:
 
         action_name = action.__name__
         action_label = action.label or action_name
-        log_items = self._extract_log_items(result)
+        log_items = get_result_log_items(result)
         store_item["actions_data"].append({
             "success": result["success"],
             "name": action_name,
@@ -189,6 +241,8 @@ class PublishReportMaker:
         plugins_data_by_id = copy.deepcopy(
             self._plugin_data_by_id
         )
+        for plugin_id, plugin_data in plugins_data_by_id.items():
+            self._fill_instances_log_items(plugin_id, plugin_data)
 
         # Ensure the current plug-in is marked as `passed` in the result
         # so that it shows on reports for paused publishes
@@ -215,19 +269,35 @@ class PublishReportMaker:
         if self._publish_discover_result is not None:
             reports.append(self._publish_discover_result)
 
+        profile = []
+        if self._profiler is not None:
+            profile = self._profiler.get_trace_events()
+
+        # Older log records may be spilled to temporary file
+        self._log_store.flush()
+
         crashed_file_paths = {}
+        discover_times = {}
         for report in reports:
             items = report.crashed_file_paths.items()
             for filepath, exc_info in items:
                 crashed_file_paths[filepath] = "".join(
                     traceback.format_exception(*exc_info)
                 )
+            for path, duration in report.discover_times.items():
+                discover_times[path] = (
+                    discover_times.get(path, 0.0) + duration
+                )
 
         return {
             "plugins_data": list(plugins_data_by_id.values()),
             "instances": instances_details,
             "context": self._extract_context_data(self._current_context),
             "crashed_file_paths": crashed_file_paths,
+            "discover_times": discover_times,
+            "creator_collection_times": self._creator_collection_times,
+            "profile": profile,
+            "logs_file": self._log_store.spill_filepath,
             "id": uuid.uuid4().hex,
             "created_at": now.isoformat(),
             "report_version": "1.0.1",
@@ -253,72 +323,18 @@ class PublishReportMaker:
             "instance_id": instance.data.get("instance_id"),
         }
 
-    def _extract_instance_log_items(self, result):
-        instance = result["instance"]
-        instance_id = None
-        if instance:
-            instance_id = instance.id
-
-        log_items = self._extract_log_items(result)
-        for item in log_items:
-            item["instance_id"] = instance_id
-        return log_items
-
-    def _extract_log_items(self, result):
-        output = []
-        records = result.get("records") or []
-        for record in records:
-            record_exc_info = record.exc_info
-            if record_exc_info is not None:
-                record_exc_info = "".join(
-                    traceback.format_exception(*record_exc_info)
-                )
-
-            try:
-                msg = record.getMessage()
-            except Exception:
-                msg = str(record.msg)
-
-            output.append({
-                "type": "record",
-                "msg": msg,
-                "name": record.name,
-                "lineno": record.lineno,
-                "levelno": record.levelno,
-                "levelname": record.levelname,
-                "threadName": record.threadName,
-                "filename": record.filename,
-                "pathname": record.pathname,
-                "msecs": record.msecs,
-                "exc_info": record_exc_info
-            })
-
-        exception = result.get("error")
-        if exception:
-            fname, line_no, func, exc = exception.traceback
-
-            # Conversion of exception into string may crash
-            try:
-                msg = str(exception)
-            except BaseException:
-                msg = (
-                    "Publisher Controller: ERROR"
-                    " - Failed to get exception message"
-                )
-
-            # Action result does not have 'is_validation_error'
-            is_validation_error = result.get("is_validation_error", False)
-            output.append({
-                "type": "error",
-                "is_validation_error": is_validation_error,
-                "msg": msg,
-                "filename": str(fname),
-                "lineno": str(line_no),
-                "func": str(func),
-                "traceback": exception.formatted_traceback
-            })
-
-        return output
+    def _fill_instances_log_items(self, plugin_id, plugin_data):
+        log_items_by_instance_id = self._log_store.get_log_items(plugin_id)
+        for instance_data in plugin_data["instances_data"]:
+            instance_id = instance_data["id"]
+            instance_data["logs"] = log_items_by_instance_id.get(
+                instance_id, []
+            )
+            spilled_count = self._log_store.get_spilled_count(
+                plugin_id, instance_id
+            )
+            if spilled_count:
+                instance_data["spilled_logs"] = spilled_count
 
 
 class PublishPluginsProxy:
@@ -2263,6 +2279,7 @@ class PublisherController(BasePublisherController):
 
         self.publish_is_running = True
         self.publish_has_started = True
+        self._publish_report.start_profiling()
 
         self._emit_event("publish.process.started")
 
@@ -2271,6 +2288,7 @@ class PublisherController(BasePublisherController):
     def _stop_publish(self):
         """Stop or pause publishing."""
         self.publish_is_running = False
+        self._publish_report.stop_profiling()
 
         self._emit_event("publish.process.stopped")
 
@@ -4,7 +4,11 @@ from abc import abstractmethod, abstractproperty
 from qtpy import QtCore
 
 from ayon_core.lib.events import Event
-from ayon_core.pipeline.create import CreatedInstance
+from ayon_core.pipeline.create import (
+    CreatedInstance,
+    get_known_instance_hashes,
+    deserialize_instances_on_remote,
+)
 
 from .control import (
     MainThreadItem,
@@ -115,10 +119,12 @@ class QtRemotePublishController(BasePublisherController):
         super().__init__(*args, **kwargs)
 
         self._created_instances = {}
+        self._instance_hashes = {}
         self._thumbnail_paths_by_instance_id = None
 
     def _reset_attributes(self):
         super()._reset_attributes()
+        self._instance_hashes = {}
         self._thumbnail_paths_by_instance_id = None
 
     @abstractmethod
@@ -131,15 +137,46 @@ class QtRemotePublishController(BasePublisherController):
 
         pass
 
-    def _on_create_instance_change(self):
-        serialized_instances = self._get_serialized_instances()
+    def _get_serialized_instances_payload(self, known_hashes):
+        """Receive compact instances payload from client process.
 
-        created_instances = {}
-        for serialized_data in serialized_instances:
-            item = CreatedInstance.deserialize_on_remote(serialized_data)
-            created_instances[item.id] = item
+        Client process should create the payload using
+        'serialize_instances_for_remote' with passed 'known_hashes'. Only
+        changed instances are then transferred. Default implementation
+        returns 'None' and '_get_serialized_instances' is used.
+
+        Args:
+            known_hashes (dict[str, str]): Hashes of instances by id
+                which are already available in this process.
+
+        Returns:
+            Union[dict[str, Any], None]: Instances payload.
+        """
+
+        return None
+
+    def _on_create_instance_change(self):
+        # Instances with local changes are sent again by host
+        payload = self._get_serialized_instances_payload(
+            get_known_instance_hashes(
+                self._created_instances, self._instance_hashes
+            )
+        )
+        if payload is not None:
+            created_instances, instance_hashes = (
+                deserialize_instances_on_remote(
+                    payload, self._created_instances, self._instance_hashes
+                )
+            )
+        else:
+            instance_hashes = {}
+            created_instances = {}
+            for serialized_data in self._get_serialized_instances():
+                item = CreatedInstance.deserialize_on_remote(serialized_data)
+                created_instances[item.id] = item
 
         self._created_instances = created_instances
+        self._instance_hashes = instance_hashes
         self._emit_event("instances.refresh.finished")
 
     def remote_events_handler(self, event_data):
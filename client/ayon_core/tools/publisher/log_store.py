@@ -0,0 +1,492 @@
+"""Compact storage of publish log records.
+
+Publish report keeps log records of all processed plugins. Verbose plugins
+can produce a lot of records, so records are stored in compact form and
+only last records of each plugin and instance are kept in memory (ring
+buffer). Older records are spilled into temporary JSONL file which can be
+read lazily by report viewer.
+
+Caps can be changed using environment variables
+'AYON_PUBLISH_REPORT_LOGS_PER_PLUGIN' (records kept in memory per plugin
+and instance) and 'AYON_PUBLISH_REPORT_SPILLED_LOGS' (records stored in
+spill file).
+"""
+import os
+import sys
+import json
+import copy
+import weakref
+import tempfile
+import traceback
+import collections
+
+LOGS_PER_PLUGIN_ENV_KEY = "AYON_PUBLISH_REPORT_LOGS_PER_PLUGIN"
+SPILLED_LOGS_ENV_KEY = "AYON_PUBLISH_REPORT_SPILLED_LOGS"
+DEFAULT_LOGS_PER_PLUGIN = 1000
+DEFAULT_SPILLED_LOGS = 500000
+
+
+def _get_env_int(key, default):
+    value = os.getenv(key)
+    if value:
+        try:
+            return max(0, int(value))
+        except ValueError:
+            pass
+    return default
+
+
+def _close_spill_file(stream, filepath):
+    stream.close()
+    if os.path.exists(filepath):
+        os.remove(filepath)
+
+
+def _get_record_message(record):
+    try:
+        return record.getMessage()
+    except Exception:
+        return str(record.msg)
+
+
+def _get_record_exc_info(record):
+    # Traceback is formatted right away, keeping it would keep frames
+    #   and their local variables alive
+    record_exc_info = record.exc_info
+    if record_exc_info is not None:
+        record_exc_info = "".join(
+            traceback.format_exception(*record_exc_info)
+        )
+    return record_exc_info
+
+
+def get_record_log_item(record):
+    """Convert log record to log item of publish report.
+
+    Args:
+        record (logging.LogRecord): Log record.
+
+    Returns:
+        dict[str, Any]: Log item.
+    """
+
+    return {
+        "type": "record",
+        "msg": _get_record_message(record),
+        "name": record.name,
+        "lineno": record.lineno,
+        "levelno": record.levelno,
+        "levelname": record.levelname,
+        "threadName": record.threadName,
+        "filename": record.filename,
+        "pathname": record.pathname,
+        "msecs": record.msecs,
+        "exc_info": _get_record_exc_info(record)
+    }
+
+
+def get_result_log_items(result):
+    """Convert log records and error of pyblish result to log items.
+
+    Args:
+        result (dict[str, Any]): Pyblish result.
+
+    Returns:
+        list[dict[str, Any]]: Log items.
+    """
+
+    output = [
+        get_record_log_item(record)
+        for record in result.get("records") or []
+    ]
+    error_item = get_error_log_item(result)
+    if error_item is not None:
+        output.append(error_item)
+    return output
+
+
+def get_error_log_item(result):
+    """Convert error of pyblish result to log item of publish report.
+
+    Args:
+        result (dict[str, Any]): Pyblish result.
+
+    Returns:
+        Union[dict[str, Any], None]: Log item or 'None' if result does
+            not have error.
+    """
+
+    exception = result.get("error")
+    if not exception:
+        return None
+
+    fname, line_no, func, exc = exception.traceback
+
+    # Conversion of exception into string may crash
+    try:
+        msg = str(exception)
+    except BaseException:
+        msg = (
+            "Publisher Controller: ERROR"
+            " - Failed to get exception message"
+        )
+
+    # Action result does not have 'is_validation_error'
+    is_validation_error = result.get("is_validation_error", False)
+    return {
+        "type": "error",
+        "is_validation_error": is_validation_error,
+        "msg": msg,
+        "filename": str(fname),
+        "lineno": str(line_no),
+        "func": str(func),
+        "traceback": exception.formatted_traceback
+    }
+
+
+class PublishLogStore:
+    """Compact storage of log records of publish plugins.
+
+    Records are stored as tuples with interned strings. Only last records
+    of each plugin and instance are kept in memory, older records are
+    spilled into temporary JSONL file. Error items are always kept in
+    memory.
+
+    Args:
+        max_logs_per_plugin (Optional[int]): Maximum number of records
+            kept in memory per plugin and instance.
+        max_spilled_logs (Optional[int]): Maximum number of records
+            stored in spill file. Records over the limit are dropped.
+    """
+
+    def __init__(self, max_logs_per_plugin=None, max_spilled_logs=None):
+        if max_logs_per_plugin is None:
+            max_logs_per_plugin = _get_env_int(
+                LOGS_PER_PLUGIN_ENV_KEY, DEFAULT_LOGS_PER_PLUGIN
+            )
+        if max_spilled_logs is None:
+            max_spilled_logs = _get_env_int(
+                SPILLED_LOGS_ENV_KEY, DEFAULT_SPILLED_LOGS
+            )
+        self._max_logs_per_plugin = max_logs_per_plugin
+        self._max_spilled_logs = max_spilled_logs
+
+        self._records_by_plugin_id = {}
+        self._errors_by_plugin_id = {}
+        self._level_names = {}
+        self._spilled_counts = collections.Counter()
+        self._spilled_count = 0
+        self._dropped_count = 0
+        self._spill_stream = None
+        self._spill_filepath = None
+        self._spill_finalizer = None
+
+    @property
+    def spill_filepath(self):
+        """Path to file with spilled records.
+
+        Returns:
+            Union[str, None]: Path to JSONL file or 'None' if no record
+                was spilled.
+        """
+
+        return self._spill_filepath
+
+    @property
+    def dropped_count(self):
+        """Number of records dropped because of caps.
+
+        Returns:
+            int: Number of dropped records.
+        """
+
+        return self._dropped_count
+
+    def reset(self):
+        """Clear stored records and remove spill file."""
+
+        if self._spill_finalizer is not None:
+            self._spill_finalizer()
+        self._spill_finalizer = None
+        self._spill_stream = None
+        self._spill_filepath = None
+
+        self._records_by_plugin_id = {}
+        self._errors_by_plugin_id = {}
+        self._spilled_counts = collections.Counter()
+        self._spilled_count = 0
+        self._dropped_count = 0
+
+    def add_result(self, plugin_id, result):
+        """Store log records and error of pyblish result.
+
+        Args:
+            plugin_id (str): Id of processed plugin.
+            result (dict[str, Any]): Pyblish result.
+        """
+
+        instance = result["instance"]
+        instance_id = None
+        if instance is not None:
+            instance_id = instance.id
+
+        records_by_instance_id = self._records_by_plugin_id.setdefault(
+            plugin_id, {}
+        )
+        records = records_by_instance_id.get(instance_id)
+        if records is None:
+            records = collections.deque()
+            records_by_instance_id[instance_id] = records
+
+        for record in result.get("records") or []:
+            records.append(self._compact_record(record))
+            if len(records) > self._max_logs_per_plugin:
+                self._spill(plugin_id, instance_id, records.popleft())
+
+        error_item = get_error_log_item(result)
+        if error_item is not None:
+            self._errors_by_plugin_id.setdefault(plugin_id, {})[
+                instance_id
+            ] = error_item
+
+    def get_log_items(self, plugin_id):
+        """Log items of plugin kept in memory.
+
+        Args:
+            plugin_id (str): Id of plugin.
+
+        Returns:
+            dict[Union[str, None], list[dict[str, Any]]]: Log items by
+                instance id.
+        """
+
+        output = collections.defaultdict(list)
+        records_by_instance_id = self._records_by_plugin_id.get(plugin_id)
+        for instance_id, records in (records_by_instance_id or {}).items():
+            instance_items = output[instance_id]
+            for compact_record in records:
+                log_item = self._expand_record(compact_record)
+                log_item["instance_id"] = instance_id
+                instance_items.append(log_item)
+
+        errors = self._errors_by_plugin_id.get(plugin_id) or {}
+        for instance_id, error_item in errors.items():
+            log_item = copy.deepcopy(error_item)
+            log_item["instance_id"] = instance_id
+            output[instance_id].append(log_item)
+        return output
+
+    def get_spilled_count(self, plugin_id, instance_id):
+        """Number of records of plugin and instance in spill file.
+
+        Args:
+            plugin_id (str): Id of plugin.
+            instance_id (Union[str, None]): Id of instance.
+
+        Returns:
+            int: Number of spilled records.
+        """
+
+        return self._spilled_counts[(plugin_id, instance_id)]
+
+    def flush(self):
+        """Flush spill file so it can be read."""
+
+        if self._spill_stream is not None:
+            self._spill_stream.flush()
+
+    def _compact_record(self, record):
+        levelno = record.levelno
+        levelname = self._level_names.get(levelno)
+        if levelname is None:
+            levelname = sys.intern(str(record.levelname))
+            self._level_names[levelno] = levelname
+
+        # Log item is created only when records are read or spilled
+        return (
+            _get_record_message(record),
+            sys.intern(str(record.name)),
+            record.lineno,
+            levelno,
+            sys.intern(str(record.threadName)),
+            sys.intern(str(record.filename)),
+            sys.intern(str(record.pathname)),
+            record.msecs,
+            _get_record_exc_info(record),
+        )
+
+    def _expand_record(self, compact_record):
+        (
+            msg,
+            name,
+            lineno,
+            levelno,
+            thread_name,
+            filename,
+            pathname,
+            msecs,
+            exc_info,
+        ) = compact_record
+        return {
+            "type": "record",
+            "msg": msg,
+            "name": name,
+            "lineno": lineno,
+            "levelno": levelno,
+            "levelname": self._level_names[levelno],
+            "threadName": thread_name,
+            "filename": filename,
+            "pathname": pathname,
+            "msecs": msecs,
+            "exc_info": exc_info
+        }
+
+    def _spill(self, plugin_id, instance_id, compact_record):
+        if self._spilled_count >= self._max_spilled_logs:
+            self._dropped_count += 1
+            return
+
+        if self._spill_stream is None:
+            fd, filepath = tempfile.mkstemp(
+                prefix="ayon_publish_logs_", suffix=".jsonl"
+            )
+            stream = open(fd, "w", encoding="utf-8")
+            self._spill_stream = stream
+            self._spill_filepath = filepath
+            # Make sure the file is removed when store is garbage collected
+            #   or on process exit
+            self._spill_finalizer = weakref.finalize(
+                self, _close_spill_file, stream, filepath
+            )
+
+        log_item = self._expand_record(compact_record)
+        log_item["plugin_id"] = plugin_id
+        log_item["instance_id"] = instance_id
+        self._spill_stream.write(json.dumps(log_item) + "\n")
+        self._spilled_count += 1
+        self._spilled_counts[(plugin_id, instance_id)] += 1
+
+
+class SpilledLogsReader:
+    """Lazy reader of log records spilled to JSONL file.
+
+    Offsets of records are indexed on first access, records are parsed
+    only when requested.
+
+    Args:
+        filepath (str): Path to JSONL file.
+    """
+
+    def __init__(self, filepath):
+        self._filepath = filepath
+        self._offsets_by_key = None
+
+    @property
+    def filepath(self):
+        return self._filepath
+
+    def get_count(self, plugin_id, instance_id):
+        """Number of spilled records of plugin and instance.
+
+        Args:
+            plugin_id (str): Id of plugin.
+            instance_id (Union[str, None]): Id of instance.
+
+        Returns:
+            int: Number of records.
+        """
+
+        return len(self._get_offsets(plugin_id, instance_id))
+
+    def get_log_items(self, plugin_id, instance_id, limit=None):
+        """Spilled log items of plugin and instance.
+
+        Args:
+            plugin_id (str): Id of plugin.
+            instance_id (Union[str, None]): Id of instance.
+            limit (Optional[int]): Return only last records up to limit.
+
+        Returns:
+            list[dict[str, Any]]: Log items in order of logging.
+        """
+
+        offsets = self._get_offsets(plugin_id, instance_id)
+        if limit is not None:
+            offsets = offsets[-limit:] if limit > 0 else []
+        if not offsets:
+            return []
+
+        output = []
+        with open(self._filepath, "rb") as stream:
+            for offset in offsets:
+                stream.seek(offset)
+                log_item = json.loads(stream.readline())
+                log_item.pop("plugin_id", None)
+                output.append(log_item)
+        return output
+
+    def _get_offsets(self, plugin_id, instance_id):
+        if self._offsets_by_key is None:
+            self._offsets_by_key = self._index_file()
+        return self._offsets_by_key.get((plugin_id, instance_id)) or []
+
+    def _index_file(self):
+        offsets_by_key = collections.defaultdict(list)
+        if not self._filepath or not os.path.exists(self._filepath):
+            return offsets_by_key
+
+        with open(self._filepath, "rb") as stream:
+            offset = 0
+            for line in stream:
+                line_offset = offset
+                offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    log_item = json.loads(line)
+                except ValueError:
+                    # Last line can be incomplete while publishing
+                    continue
+                key = (log_item.get("plugin_id"), log_item.get("instance_id"))
+                offsets_by_key[key].append(line_offset)
+        return offsets_by_key
+
+
+def get_report_with_spilled_logs(report_data):
+    """Publish report with spilled log records included in report.
+
+    Should be used when report is exported, because spill file is
+    temporary.
+
+    Args:
+        report_data (dict[str, Any]): Publish report data.
+
+    Returns:
+        dict[str, Any]: Report data without references to spill file.
+    """
+
+    logs_filepath = report_data.get("logs_file")
+    if not logs_filepath:
+        return report_data
+
+    reader = SpilledLogsReader(logs_filepath)
+    output = dict(report_data)
+    output.pop("logs_file")
+    plugins_data = []
+    for plugin_data in report_data["plugins_data"]:
+        plugin_data = dict(plugin_data)
+        instances_data = []
+        for instance_data in plugin_data["instances_data"]:
+            instance_data = dict(instance_data)
+            if instance_data.pop("spilled_logs", None):
+                instance_data["logs"] = (
+                    reader.get_log_items(
+                        plugin_data["id"], instance_data["id"]
+                    )
+                    + instance_data["logs"]
+                )
+            instances_data.append(instance_data)
+        plugin_data["instances_data"] = instances_data
+        plugins_data.append(plugin_data)
+    output["plugins_data"] = plugins_data
+    return output
@@ -0,0 +1,222 @@
+"""Indexed publish report file.
+
+Indexed report file starts with a line identifying the format, followed by
+a header line and log chunks. Header contains report data without logs,
+log items of each plugin and instance pair are stored as a separate chunk
+and the header contains offset and size of the chunk. That way a report
+can be opened without reading the logs, and log chunks are decoded using
+memory mapped file only when they are needed.
+"""
+import os
+import json
+import mmap
+import shutil
+import tempfile
+
+INDEXED_REPORT_MAGIC = b"AYON_PUBLISH_REPORT"
+INDEXED_REPORT_VERSION = 1
+
+
+def is_indexed_report_file(filepath):
+    """Check if file is indexed publish report file.
+
+    Args:
+        filepath (str): Path to file.
+
+    Returns:
+        bool: File is indexed report file.
+    """
+
+    with open(filepath, "rb") as stream:
+        return stream.read(len(INDEXED_REPORT_MAGIC)) == INDEXED_REPORT_MAGIC
+
+
+def _write_report_file(filepath, header, write_data_func):
+    """Write report file atomically.
+
+    Args:
+        filepath (str): Path to output file.
+        header (dict[str, Any]): Report header.
+        write_data_func (Callable[[BinaryIO], None]): Function writing
+            log chunks to the stream.
+    """
+
+    dirpath = os.path.dirname(filepath)
+    if dirpath:
+        os.makedirs(dirpath, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=dirpath or None, suffix=".tmp")
+    try:
+        with open(fd, "wb") as stream:
+            stream.write(
+                b"%s %d\n" % (INDEXED_REPORT_MAGIC, INDEXED_REPORT_VERSION)
+            )
+            stream.write(json.dumps(header).encode("utf-8"))
+            stream.write(b"\n")
+            write_data_func(stream)
+        os.replace(tmp_path, filepath)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def write_indexed_report(report_data, filepath):
+    """Write publish report data to indexed report file.
+
+    Logs of report data must be already included in the report, spill file
+    of publisher is not used.
+
+    Args:
+        report_data (dict[str, Any]): Publish report data.
+        filepath (str): Path to output file.
+    """
+
+    chunks = []
+    offset = 0
+    plugins_data = []
+    for plugin_data in report_data["plugins_data"]:
+        plugin_data = dict(plugin_data)
+        instances_data = []
+        for instance_data in plugin_data["instances_data"]:
+            instance_data = dict(instance_data)
+            logs = instance_data.pop("logs", None) or []
+            instance_data["errored"] = any(
+                log_item["type"] == "error"
+                for log_item in logs
+            )
+            instance_data["logs_chunk"] = None
+            if logs:
+                chunk = json.dumps(logs).encode("utf-8")
+                instance_data["logs_chunk"] = [offset, len(chunk)]
+                offset += len(chunk)
+                chunks.append(chunk)
+            instances_data.append(instance_data)
+        plugin_data["instances_data"] = instances_data
+        plugins_data.append(plugin_data)
+
+    header = dict(report_data)
+    header.pop("logs_file", None)
+    header["plugins_data"] = plugins_data
+
+    def _write_chunks(stream):
+        for chunk in chunks:
+            stream.write(chunk)
+
+    _write_report_file(filepath, header, _write_chunks)
+
+
+class IndexedReportFile:
+    """Access to indexed publish report file.
+
+    Only header is read when report is opened. Log chunks are read from
+    memory mapped file on demand.
+
+    Args:
+        filepath (str): Path to indexed report file.
+    """
+
+    def __init__(self, filepath):
+        self._filepath = filepath
+        self._header = None
+        self._data_offset = None
+        self._stream = None
+        self._mmap = None
+
+    @property
+    def filepath(self):
+        return self._filepath
+
+    @property
+    def header(self):
+        """Report data without logs.
+
+        Returns:
+            dict[str, Any]: Report header.
+        """
+
+        if self._header is None:
+            self._read_header()
+        return self._header
+
+    def read_logs(self, chunk):
+        """Read log items of a chunk.
+
+        Args:
+            chunk (Union[list[int], None]): Offset and size of chunk
+                from header.
+
+        Returns:
+            list[dict[str, Any]]: Log items.
+        """
+
+        if not chunk:
+            return []
+
+        if self._data_offset is None:
+            self._read_header()
+
+        if self._mmap is None:
+            self._stream = open(self._filepath, "rb")
+            self._mmap = mmap.mmap(
+                self._stream.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+        offset, size = chunk
+        start = self._data_offset + offset
+        return json.loads(self._mmap[start:start + size])
+
+    def save(self, filepath, header):
+        """Save report with new header to a file.
+
+        Log chunks are copied from this file without decoding.
+
+        Args:
+            filepath (str): Path to output file, can be path of this file.
+            header (dict[str, Any]): New report header.
+        """
+
+        if self._data_offset is None:
+            self._read_header()
+
+        # Mapped file would block replacement of the file on Windows
+        self.close()
+
+        def _copy_chunks(stream):
+            with open(self._filepath, "rb") as src_stream:
+                src_stream.seek(self._data_offset)
+                shutil.copyfileobj(src_stream, stream)
+
+        _write_report_file(filepath, header, _copy_chunks)
+
+        if (
+            os.path.normpath(os.path.abspath(filepath))
+            == os.path.normpath(os.path.abspath(self._filepath))
+        ):
+            self._header = None
+            self._data_offset = None
+
+    def close(self):
+        """Close memory mapped file."""
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def _read_header(self):
+        with open(self._filepath, "rb") as stream:
+            magic, version = stream.readline().split()
+            if magic != INDEXED_REPORT_MAGIC:
+                raise ValueError(
+                    "File is not publish report: {}".format(self._filepath)
+                )
+            if int(version) > INDEXED_REPORT_VERSION:
+                raise ValueError(
+                    "Unsupported publish report version: {}".format(
+                        version.decode("utf-8")
+                    )
+                )
+            header = json.loads(stream.readline())
+            self._data_offset = stream.tell()
+        self._header = header
@@ -1,28 +1,36 @@
+import os
 import uuid
-import collections
 import copy
 
+from ayon_core.tools.publisher.log_store import SpilledLogsReader
+
+
+def _is_instance_data_errored(instance_data):
+    # Logs of indexed report are not available, header has 'errored' flag
+    if "logs" not in instance_data:
+        return instance_data.get("errored", False)
+
+    for log_item in instance_data["logs"]:
+        if log_item["type"] == "error":
+            return True
+    return False
+
 
 class PluginItem:
     def __init__(self, plugin_data):
         self._id = uuid.uuid4()
 
+        self.report_id = plugin_data["id"]
         self.name = plugin_data["name"]
         self.label = plugin_data["label"]
         self.order = plugin_data["order"]
         self.skipped = plugin_data["skipped"]
         self.passed = plugin_data["passed"]
 
-        errored = False
-        for instance_data in plugin_data["instances_data"]:
-            for log_item in instance_data["logs"]:
-                errored = log_item["type"] == "error"
-                if errored:
-                    break
-            if errored:
-                break
-
-        self.errored = errored
+        self.errored = any(
+            _is_instance_data_errored(instance_data)
+            for instance_data in plugin_data["instances_data"]
+        )
 
     @property
     def id(self):
@@ -30,20 +38,12 @@ class PluginItem:
 
 
 class InstanceItem:
-    def __init__(self, instance_id, instance_data, logs_by_instance_id):
+    def __init__(self, instance_id, instance_data, errored_instance_ids):
         self._id = instance_id
         self.label = instance_data.get("label") or instance_data.get("name")
         self.family = instance_data.get("family")
         self.removed = not instance_data.get("exists", True)
-
-        logs = logs_by_instance_id.get(instance_id) or []
-        errored = False
-        for log_item in logs:
-            if log_item.errored:
-                errored = True
-                break
-
-        self.errored = errored
+        self.errored = instance_id in errored_instance_ids
 
     @property
     def id(self):
@@ -74,25 +74,56 @@ class LogItem:
 
 
 class PublishReport:
-    def __init__(self, report_data):
+    """Publish report items.
+
+    Log items are created on demand. Logs of report created from indexed
+    report file are read from the file only when they are requested.
+
+    Args:
+        report_data (dict[str, Any]): Report data, or header of indexed
+            report file.
+        report_file (Optional[IndexedReportFile]): Indexed report file
+            with log chunks.
+    """
+
+    def __init__(self, report_data, report_file=None):
         data = copy.deepcopy(report_data)
 
         context_data = data["context"]
         context_data["name"] = "context"
         context_data["label"] = context_data.get("label") or "Context"
 
-        logs = []
+        # Older log records can be spilled to temporary file
+        spilled_logs_reader = None
+        logs_filepath = data.get("logs_file")
+        if logs_filepath and os.path.exists(logs_filepath):
+            spilled_logs_reader = SpilledLogsReader(logs_filepath)
+
+        log_keys = []
+        log_sources_by_key = {}
+        spilled_logs_counts = {}
+        errored_instance_ids = set()
         plugins_items_by_id = {}
         for plugin_data in data["plugins_data"]:
             item = PluginItem(plugin_data)
             plugins_items_by_id[item.id] = item
             for instance_data_item in plugin_data["instances_data"]:
                 instance_id = instance_data_item["id"]
-                for log_item_data in instance_data_item["logs"]:
-                    log_item = LogItem(
-                        copy.deepcopy(log_item_data), item.id, instance_id
+                key = (item.id, instance_id)
+                log_keys.append(key)
+                if "logs" in instance_data_item:
+                    log_sources_by_key[key] = instance_data_item["logs"]
+                elif instance_data_item.get("logs_chunk"):
+                    # Offset and size of chunk in indexed report file
+                    log_sources_by_key[key] = tuple(
+                        instance_data_item["logs_chunk"]
                     )
-                    logs.append(log_item)
+                if _is_instance_data_errored(instance_data_item):
+                    errored_instance_ids.add(instance_id)
+                spilled_count = instance_data_item.get("spilled_logs")
+                if spilled_count and spilled_logs_reader is not None:
+                    spilled_logs_counts[key] = spilled_count
+
         sorted_plugins = sorted(
             plugins_items_by_id.values(),
             key=lambda item: item.order
@@ -102,19 +133,17 @@ class PublishReport:
             for plugin_item in sorted_plugins
         ]
 
-        logs_by_instance_id = collections.defaultdict(list)
-        for log_item in logs:
-            logs_by_instance_id[log_item.instance_id].append(log_item)
-
         instance_items_by_id = {}
         instance_items_by_family = {}
-        context_item = InstanceItem(None, context_data, logs_by_instance_id)
+        context_item = InstanceItem(
+            None, context_data, errored_instance_ids
+        )
         instance_items_by_id[context_item.id] = context_item
         instance_items_by_family[context_item.family] = [context_item]
 
         for instance_id, instance_data in data["instances"].items():
             item = InstanceItem(
-                instance_id, instance_data, logs_by_instance_id
+                instance_id, instance_data, errored_instance_ids
             )
             instance_items_by_id[item.id] = item
             if item.family not in instance_items_by_family:
@@ -127,6 +156,102 @@ class PublishReport:
         self.plugins_id_order = plugins_id_order
         self.plugins_items_by_id = plugins_items_by_id
 
-        self.logs = logs
+        # Keys '(plugin id, instance id)' in order of processing
+        self.log_keys = log_keys
+        self.spilled_logs_counts = spilled_logs_counts
+        self._log_sources_by_key = log_sources_by_key
+        self._logs_by_key = {}
+        self._report_file = report_file
+        self._spilled_logs_reader = spilled_logs_reader
+
+        self.crashed_plugin_paths = data["crashed_file_paths"]
+        # Timeline events in Chrome trace format (only if was profiled)
+        self.profile = data.get("profile") or []
+
+    @property
+    def logs(self):
+        """All log items of report.
+
+        Warnings:
+            All logs are decoded when report is loaded from indexed report
+                file, use 'get_logs' when possible.
+
+        Returns:
+            list[LogItem]: Log items.
+        """
+
+        output = []
+        for key in self.log_keys:
+            output.extend(self.get_logs(*key))
+        return output
+
+    def get_logs(self, plugin_id, instance_id):
+        """Log items of plugin and instance.
+
+        Args:
+            plugin_id (uuid.UUID): Id of plugin item.
+            instance_id (Union[str, None]): Id of instance.
+
+        Returns:
+            list[LogItem]: Log items.
+        """
+
+        key = (plugin_id, instance_id)
+        logs = self._logs_by_key.get(key)
+        if logs is not None:
+            return logs
+
+        source = self._log_sources_by_key.get(key)
+        if isinstance(source, list):
+            logs_data = source
+        elif source and self._report_file is not None:
+            logs_data = self._report_file.read_logs(source)
+        else:
+            logs_data = []
+
+        logs = [
+            LogItem(log_item_data, plugin_id, instance_id)
+            for log_item_data in logs_data
+        ]
+        self._logs_by_key[key] = logs
+        return logs
+
+    def get_logs_size(self):
+        """Size of logs which were not decoded yet.
+
+        Returns:
+            int: Size of log chunks in indexed report file in bytes.
+        """
+
+        size = 0
+        for key, source in self._log_sources_by_key.items():
+            if (
+                source
+                and not isinstance(source, list)
+                and key not in self._logs_by_key
+            ):
+                size += source[1]
+        return size
+
+    def get_spilled_logs(self, plugin_id, instance_id, limit=None):
+        """Log items which were spilled to temporary file during publishing.
 
-        self.crashed_plugin_paths = report_data["crashed_file_paths"]
+        Args:
+            plugin_id (uuid.UUID): Id of plugin item.
+            instance_id (Union[str, None]): Id of instance.
+            limit (Optional[int]): Load only last log items up to limit.
+
+        Returns:
+            list[LogItem]: Log items in order of logging.
+        """
+
+        key = (plugin_id, instance_id)
+        if key not in self.spilled_logs_counts:
+            return []
+        plugin_item = self.plugins_items_by_id[plugin_id]
+        return [
+            LogItem(log_item_data, plugin_id, instance_id)
+            for log_item_data in self._spilled_logs_reader.get_log_items(
+                plugin_item.report_id, instance_id, limit
+            )
+        ]
@@ -1,7 +1,9 @@
+import collections
 from math import ceil
 from qtpy import QtWidgets, QtCore, QtGui
 
 from ayon_core.tools.utils import NiceCheckbox
+from ayon_core.pipeline.publish import export_chrome_trace
 
 # from ayon_core.tools.utils import DeselectableTreeView
 from .constants import (
@@ -141,6 +143,120 @@ class PluginLoadReportWidget(QtWidgets.QWidget):
         self._model.set_report(report)
 
 
+class ProfileReportModel(QtGui.QStandardItemModel):
+    """Hierarchical timeline of profiled publishing.
+
+    Events are nested by their time, so spans created by plugins are
+    children of processed instance and instances are children of plugin.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(ProfileReportModel, self).__init__(*args, **kwargs)
+        self.setHorizontalHeaderLabels(["Name", "Duration (ms)", "Category"])
+
+    def set_report(self, report):
+        root_item = self.invisibleRootItem()
+        root_item.removeRows(0, root_item.rowCount())
+        if report is None:
+            return
+
+        events_by_thread = collections.defaultdict(list)
+        for event in report.profile:
+            if event.get("ph") == "X":
+                events_by_thread[event.get("tid")].append(event)
+
+        for events in events_by_thread.values():
+            # Parent events first when events start at the same time
+            events.sort(key=lambda event: (event["ts"], -event["dur"]))
+            # Stack of tuples (<end time>, <item>)
+            stack = []
+            for event in events:
+                start_time = event["ts"]
+                while stack and stack[-1][0] <= start_time:
+                    stack.pop()
+
+                parent_item = root_item
+                if stack:
+                    parent_item = stack[-1][1]
+
+                row = self._create_row(event)
+                parent_item.appendRow(row)
+                stack.append((start_time + event["dur"], row[0]))
+
+    def _create_row(self, event):
+        name_item = QtGui.QStandardItem(event["name"])
+        args = event.get("args")
+        if args:
+            name_item.setToolTip("\n".join(
+                "{}: {}".format(key, value)
+                for key, value in args.items()
+            ))
+        duration_item = QtGui.QStandardItem(
+            "{:.2f}".format(event["dur"] / 1000.0)
+        )
+        duration_item.setData(
+            QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter,
+            QtCore.Qt.TextAlignmentRole
+        )
+        category_item = QtGui.QStandardItem(event.get("cat") or "")
+        row = [name_item, duration_item, category_item]
+        for item in row:
+            item.setEditable(False)
+        return row
+
+
+class ProfileReportWidget(QtWidgets.QWidget):
+    def __init__(self, parent):
+        super(ProfileReportWidget, self).__init__(parent)
+
+        view = QtWidgets.QTreeView(self)
+        view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        view.setAlternatingRowColors(True)
+
+        model = ProfileReportModel()
+        view.setModel(model)
+
+        empty_label = QtWidgets.QLabel(
+            "Publishing was not profiled.", self
+        )
+        empty_label.setAlignment(QtCore.Qt.AlignCenter)
+
+        export_btn = QtWidgets.QPushButton("Export Chrome trace...", self)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(view, 1)
+        layout.addWidget(empty_label, 1)
+        layout.addWidget(export_btn, 0)
+
+        export_btn.clicked.connect(self._on_export_click)
+
+        self._view = view
+        self._model = model
+        self._empty_label = empty_label
+        self._export_btn = export_btn
+        self._report_item = None
+
+    def set_report(self, report):
+        self._report_item = report
+        self._model.set_report(report)
+        has_profile = report is not None and bool(report.profile)
+        self._view.setVisible(has_profile)
+        self._export_btn.setVisible(has_profile)
+        self._empty_label.setVisible(not has_profile)
+        if has_profile:
+            self._view.resizeColumnToContents(0)
+
+    def _on_export_click(self):
+        if self._report_item is None:
+            return
+        filepath, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Export Chrome trace", "", "JSON (*.json)"
+        )
+        if filepath:
+            export_chrome_trace(self._report_item.profile, filepath)
+
+
 class ZoomPlainText(QtWidgets.QPlainTextEdit):
     min_point_size = 1.0
     max_point_size = 200.0
@@ -218,21 +334,37 @@ class ZoomPlainText(QtWidgets.QPlainTextEdit):
 
 
 class DetailsWidget(QtWidgets.QWidget):
+    # Number of spilled log records loaded at once per plugin and instance
+    spilled_logs_page_size = 500
+    # Logs of big reports are shown only for selected plugins or instances
+    max_unfiltered_logs_size = 20 * 1024 * 1024
+
     def __init__(self, parent):
         super(DetailsWidget, self).__init__(parent)
 
+        load_older_btn = QtWidgets.QPushButton("Load older logs", self)
+        load_older_btn.setToolTip(
+            "Load older log records which were stored to file"
+        )
+        load_older_btn.setVisible(False)
+
         output_widget = ZoomPlainText(self)
         output_widget.setObjectName("PublishLogConsole")
         output_widget.setTextInteractionFlags(QtCore.Qt.TextBrowserInteraction)
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(output_widget)
+        layout.addWidget(load_older_btn, 0)
+        layout.addWidget(output_widget, 1)
 
+        load_older_btn.clicked.connect(self._on_load_older_click)
+
+        self._load_older_btn = load_older_btn
         self._output_widget = output_widget
         self._report_item = None
         self._instance_filter = set()
         self._plugin_filter = set()
+        self._spilled_logs_limit = 0
 
     def clear(self):
         self._output_widget.setPlainText("")
@@ -241,6 +373,7 @@ class DetailsWidget(QtWidgets.QWidget):
         self._report_item = report
         self._plugin_filter = set()
         self._instance_filter = set()
+        self._spilled_logs_limit = 0
         self._update_logs()
 
     def set_plugin_filter(self, plugin_filter):
@@ -251,32 +384,70 @@ class DetailsWidget(QtWidgets.QWidget):
         self._instance_filter = instance_filter
         self._update_logs()
 
+    def _on_load_older_click(self):
+        self._spilled_logs_limit += self.spilled_logs_page_size
+        self._update_logs()
+
     def _update_logs(self):
-        if not self._report_item:
+        report = self._report_item
+        if not report:
+            self._load_older_btn.setVisible(False)
             self._output_widget.setPlainText("")
             return
 
+        if (
+            not self._instance_filter
+            and not self._plugin_filter
+            and report.get_logs_size() > self.max_unfiltered_logs_size
+        ):
+            self._load_older_btn.setVisible(False)
+            self._output_widget.setPlainText(
+                "Report is too big to show all logs."
+                " Select plugin or instance to show its logs."
+            )
+            return
+
         filtered_logs = []
-        for log in self._report_item.logs:
+        has_unloaded_logs = False
+        for key in report.log_keys:
+            plugin_id, instance_id = key
             if (
                 self._instance_filter
-                and log.instance_id not in self._instance_filter
+                and instance_id not in self._instance_filter
             ):
                 continue
 
             if (
                 self._plugin_filter
-                and log.plugin_id not in self._plugin_filter
+                and plugin_id not in self._plugin_filter
             ):
                 continue
-            filtered_logs.append(log)
 
+            # Spilled logs are older than logs in report
+            spilled_count = report.spilled_logs_counts.get(key, 0)
+            if spilled_count:
+                unloaded_count = spilled_count - self._spilled_logs_limit
+                if unloaded_count > 0:
+                    has_unloaded_logs = True
+                    filtered_logs.append(unloaded_count)
+                filtered_logs.extend(report.get_spilled_logs(
+                    plugin_id, instance_id, self._spilled_logs_limit
+                ))
+            filtered_logs.extend(report.get_logs(plugin_id, instance_id))
+
+        self._load_older_btn.setVisible(has_unloaded_logs)
         self._set_logs(filtered_logs)
 
     def _set_logs(self, logs):
         lines = []
         for log in logs:
-            if log["type"] == "record":
+            # Number of older log records which are not loaded
+            if isinstance(log, int):
+                lines.append(
+                    "... {} older log records are not loaded ...".format(log)
+                )
+
+            elif log["type"] == "record":
                 message = "{}: {}".format(log["levelname"], log["msg"])
 
                 lines.append(message)
@@ -421,9 +592,11 @@ class PublishReportViewerWidget(QtWidgets.QFrame):
 
         logs_text_widget = DetailsWidget(details_tab_widget)
         plugin_load_report_widget = PluginLoadReportWidget(details_tab_widget)
+        profile_report_widget = ProfileReportWidget(details_tab_widget)
 
         details_tab_widget.addTab(logs_text_widget, "Logs")
         details_tab_widget.addTab(plugin_load_report_widget, "Crashed plugins")
+        details_tab_widget.addTab(profile_report_widget, "Profile")
 
         middle_widget = QtWidgets.QWidget(self)
         middle_layout = QtWidgets.QGridLayout(middle_widget)
@@ -462,6 +635,7 @@ class PublishReportViewerWidget(QtWidgets.QFrame):
         self._report_item = None
         self._logs_text_widget = logs_text_widget
         self._plugin_load_report_widget = plugin_load_report_widget
+        self._profile_report_widget = profile_report_widget
 
         self._removed_instances_check = removed_instances_check
         self._instances_view = instances_view
@@ -511,6 +685,7 @@ class PublishReportViewerWidget(QtWidgets.QFrame):
         self._plugins_model.set_report(report)
         self._logs_text_widget.set_report(report)
         self._plugin_load_report_widget.set_report(report)
+        self._profile_report_widget.set_report(report)
 
         self._ignore_selection_changes = False
 
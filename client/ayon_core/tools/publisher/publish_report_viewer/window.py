@@ -20,9 +20,19 @@ from ayon_core.tools.utils.delegates import PrettyTimeDelegate
 if __package__:
     from .widgets import PublishReportViewerWidget
     from .report_items import PublishReport
+    from .report_file import (
+        IndexedReportFile,
+        is_indexed_report_file,
+        write_indexed_report,
+    )
 else:
     from widgets import PublishReportViewerWidget
     from report_items import PublishReport
+    from report_file import (
+        IndexedReportFile,
+        is_indexed_report_file,
+        write_indexed_report,
+    )
 
 
 ITEM_ID_ROLE = QtCore.Qt.UserRole + 1
@@ -46,9 +56,20 @@ def get_reports_dir():
 
 
 class PublishReportItem:
-    """Report item representing one file in report directory."""
+    """Report item representing one file in report directory.
+
+    Reports are stored in indexed report format, so only header of report
+    is loaded when report directory is listed. Logs are read when report
+    is shown. Reports stored in previous versions as json are converted
+    to indexed report when they are shown.
 
-    def __init__(self, content):
+    Args:
+        content (dict[str, Any]): Report data, or header of indexed report.
+        report_file (Optional[IndexedReportFile]): Indexed report file
+            from which the content was loaded.
+    """
+
+    def __init__(self, content, report_file=None):
         changed = self._fix_content(content)
 
         report_path = os.path.join(get_reports_dir(), content["id"])
@@ -65,7 +86,41 @@ class PublishReportItem:
         self.created_at = float(created_at)
         self._loaded_label = content.get("label")
         self._changed = changed
-        self.publish_report = PublishReport(content)
+        self._report_file = report_file
+        # Path to file from which report was loaded
+        self._source_path = None
+        self._publish_report = None
+
+    @property
+    def publish_report(self):
+        """Publish report items, created on first access.
+
+        Returns:
+            PublishReport: Publish report items.
+        """
+
+        if self._publish_report is None:
+            if self._report_file is None:
+                # Convert report stored in previous versions, so next time
+                #   only header is read on listing
+                try:
+                    self.save()
+                except Exception:
+                    pass
+            self._publish_report = PublishReport(
+                self.content, self._report_file
+            )
+        return self._publish_report
+
+    @property
+    def is_indexed(self):
+        """Report is loaded from indexed report file.
+
+        Returns:
+            bool: Report has indexed report file.
+        """
+
+        return self._report_file is not None
 
     @property
     def version(self):
@@ -126,14 +181,40 @@ class PublishReportItem:
             or self._loaded_label != self.label
             or not os.path.exists(self.report_path)
             or self.file_modified != os.path.getmtime(self.report_path)
+            or self._report_file is None
+            or self._report_file.filepath != self.report_path
         ):
             save = True
 
         if not save:
             return
 
-        with open(self.report_path, "w") as stream:
-            json.dump(self.content, stream)
+        if self._report_file is None:
+            write_indexed_report(self.content, self.report_path)
+        else:
+            self._report_file.save(self.report_path, self.content)
+
+        # Remove previous file of converted report from reports directory,
+        #   file is removed only after conversion was successful
+        source_path = self._source_path
+        self._source_path = self.report_path
+        if source_path is not None:
+            source_path = os.path.normpath(source_path)
+            report_path = os.path.normpath(self.report_path)
+            if (
+                source_path != report_path
+                and os.path.dirname(source_path)
+                == os.path.dirname(report_path)
+            ):
+                os.remove(source_path)
+
+        if (
+            self._report_file is None
+            or self._report_file.filepath != self.report_path
+        ):
+            # Read logs from saved file, content keeps only header
+            self._report_file = IndexedReportFile(self.report_path)
+            self.content = self._report_file.header
 
         self._loaded_label = self.content.get("label")
         self._changed = False
@@ -154,12 +235,18 @@ class PublishReportItem:
             return None
 
         try:
-            with open(filepath, "r") as stream:
-                content = json.load(stream)
+            report_file = None
+            if is_indexed_report_file(filepath):
+                report_file = IndexedReportFile(filepath)
+                content = report_file.header
+            else:
+                with open(filepath, "r") as stream:
+                    content = json.load(stream)
 
             file_modified = os.path.getmtime(filepath)
             changed = cls._fix_content(content, file_modified=file_modified)
-            obj = cls(content)
+            obj = cls(content, report_file)
+            obj._source_path = filepath
             if changed:
                 obj.mark_as_changed()
             return obj
@@ -170,6 +257,9 @@ class PublishReportItem:
     def remove_file(self):
         """Remove report file."""
 
+        if self._report_file is not None:
+            self._report_file.close()
+
         if os.path.exists(self.report_path):
             os.remove(self.report_path)
 
@@ -271,6 +361,8 @@ class PublisherReportHandler:
             if ext == ".json":
                 continue
             filepath = os.path.join(report_dir, filename)
+            # Reports stored in previous versions are converted when
+            #   they are shown
             item = PublishReportItem.from_filepath(filepath)
             if item is not None:
                 reports.append(item)
@@ -1723,9 +1723,21 @@ class ReportsWidget(QtWidgets.QWidget):
             plugin_id = plugin_info["id"]
             for instance_info in plugin_info["instances_data"]:
                 instance_id = instance_info["id"] or CONTEXT_ID
+                instance_logs = logs_by_instance_id[instance_id]
+                # Older records were spilled to file to save memory
+                spilled_count = instance_info.get("spilled_logs")
+                if spilled_count:
+                    instance_logs.append({
+                        "type": "spilled",
+                        "msg": (
+                            "{} older log records are not shown."
+                            " Export report to see all records."
+                        ).format(spilled_count),
+                        "plugin_id": plugin_id,
+                    })
                 for log in instance_info["logs"]:
                     log["plugin_id"] = plugin_id
-                logs_by_instance_id[instance_id].extend(instance_info["logs"])
+                instance_logs.extend(instance_info["logs"])
 
         context_item = _InstanceItem.create_context_item(
             context_label, logs_by_instance_id[CONTEXT_ID])
@@ -20,6 +20,7 @@ from ayon_core.tools.utils.lib import center_window
 from .constants import ResetKeySequence
 from .publish_report_viewer import PublishReportViewerWidget
 from .control import CardMessageTypes
+from .log_store import get_report_with_spilled_logs
 from .control_qt import QtPublisherController
 from .widgets import (
     OverviewWidget,
@@ -1038,7 +1039,9 @@ class PublisherWindow(QtWidgets.QDialog):
         self._create_overlay_button.set_under_mouse(under_mouse)
 
     def _copy_report(self):
-        logs = self._controller.get_publish_report()
+        logs = get_report_with_spilled_logs(
+            self._controller.get_publish_report()
+        )
         logs_string = json.dumps(logs, indent=4)
 
         mime_data = QtCore.QMimeData()
@@ -1064,7 +1067,9 @@ class PublisherWindow(QtWidgets.QDialog):
         if not ext or not new_filepath:
             return
 
-        logs = self._controller.get_publish_report()
+        logs = get_report_with_spilled_logs(
+            self._controller.get_publish_report()
+        )
         full_path = new_filepath + ext
         dir_path = os.path.dirname(full_path)
         if not os.path.exists(dir_path):
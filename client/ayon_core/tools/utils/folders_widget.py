@@ -1,3 +1,4 @@
+import uuid
 import collections
 
 from qtpy import QtWidgets, QtGui, QtCore
@@ -283,19 +284,31 @@ class FoldersWidget(QtWidgets.QWidget):
     Selection is confirmed by calling method 'expected_folder_selected' on
     controller.
 
+    Prefetch of tasks is disabled by default. If enabled, tasks of folders
+    which become visible are fetched in background using one query, when
+    the folder item is expanded. Controller must implement method
+    'prefetch_task_items(project_name, folder_ids)'.
 
     Args:
         controller (AbstractWorkfilesFrontend): The control object.
         parent (QtWidgets.QWidget): The parent widget.
         handle_expected_selection (bool): If True, the widget will handle
             the expected selection. Defaults to False.
+        prefetch_tasks (bool): If True, tasks of visible folders are
+            prefetched. Defaults to False.
     """
 
     double_clicked = QtCore.Signal(QtGui.QMouseEvent)
     selection_changed = QtCore.Signal()
     refreshed = QtCore.Signal()
 
-    def __init__(self, controller, parent, handle_expected_selection=False):
+    def __init__(
+        self,
+        controller,
+        parent,
+        handle_expected_selection=False,
+        prefetch_tasks=False,
+    ):
         super(FoldersWidget, self).__init__(parent)
 
         folders_view = TreeView(self)
@@ -333,6 +346,8 @@ class FoldersWidget(QtWidgets.QWidget):
         selection_model.selectionChanged.connect(self._on_selection_change)
         folders_view.double_clicked.connect(self.double_clicked)
         folders_model.refreshed.connect(self._on_model_refresh)
+        if prefetch_tasks:
+            folders_view.expanded.connect(self._on_folder_expanded)
 
         self._controller = controller
         self._folders_view = folders_view
@@ -342,6 +357,9 @@ class FoldersWidget(QtWidgets.QWidget):
         self._handle_expected_selection = handle_expected_selection
         self._expected_selection = None
 
+        self._prefetch_tasks = prefetch_tasks
+        self._prefetch_threads = {}
+
     @property
     def is_refreshing(self):
         """Model is refreshing.
@@ -519,8 +537,47 @@ class FoldersWidget(QtWidgets.QWidget):
         if self._expected_selection:
             self._set_expected_selection()
         self._folders_proxy_model.sort(0)
+        if self._prefetch_tasks:
+            self._prefetch_children_tasks(QtCore.QModelIndex())
         self.refreshed.emit()
 
+    def _on_folder_expanded(self, index):
+        self._prefetch_children_tasks(index)
+
+    def _prefetch_children_tasks(self, parent_index):
+        """Prefetch tasks of child folders in background.
+
+        Args:
+            parent_index (QtCore.QModelIndex): Index of parent folder in
+                proxy model.
+        """
+
+        project_name = self._folders_model.get_project_name()
+        if not project_name:
+            return
+
+        proxy_model = self._folders_proxy_model
+        folder_ids = []
+        for row in range(proxy_model.rowCount(parent_index)):
+            index = proxy_model.index(row, 0, parent_index)
+            folder_ids.append(index.data(FOLDER_ID_ROLE))
+
+        if not folder_ids:
+            return
+
+        thread = RefreshThread(
+            uuid.uuid4().hex,
+            self._controller.prefetch_task_items,
+            project_name,
+            folder_ids
+        )
+        self._prefetch_threads[thread.id] = thread
+        thread.refresh_finished.connect(self._on_prefetch_thread)
+        thread.start()
+
+    def _on_prefetch_thread(self, thread_id):
+        self._prefetch_threads.pop(thread_id, None)
+
     def _get_selected_item_id(self):
         return self._get_selected_item_value(FOLDER_ID_ROLE)
 
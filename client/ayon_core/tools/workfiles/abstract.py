@@ -809,6 +809,20 @@ class AbstractWorkfilesFrontend(AbstractWorkfilesCommon):
 
         pass
 
+    def prefetch_task_items(self, project_name, folder_ids):
+        """Fetch task items of multiple folders in advance.
+
+        Tasks are fetched using one query and cached, so following
+        'get_task_items' calls don't have to query them. Default
+        implementation does nothing.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+        """
+
+        pass
+
     @abstractmethod
     def has_unsaved_changes(self):
         """Has host unsaved change in currently running session.
@@ -406,6 +406,9 @@ class BaseWorkfileController(
             project_name, folder_id, sender
         )
 
+    def prefetch_task_items(self, project_name, folder_ids):
+        self._hierarchy_model.prefetch_task_items(project_name, folder_ids)
+
     def get_workarea_dir_by_context(self, folder_id, task_id):
         return self._workfiles_model.get_workarea_dir_by_context(
             folder_id, task_id)
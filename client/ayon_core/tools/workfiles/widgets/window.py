@@ -182,7 +182,10 @@ class WorkfilesToolWindow(QtWidgets.QWidget):
         refresh_btn = RefreshButton(header_widget)
 
         folder_widget = FoldersWidget(
-            controller, col_widget, handle_expected_selection=True
+            controller,
+            col_widget,
+            handle_expected_selection=True,
+            prefetch_tasks=True,
         )
 
         header_layout = QtWidgets.QHBoxLayout(header_widget)
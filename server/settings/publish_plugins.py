@@ -737,12 +737,59 @@ class IntegrateHeroTemplateNameProfileModel(BaseSettingsModel):
     template_name: str = SettingsField("", title="Template name")
 
 
+class RootTransferMaxWorkersModel(BaseSettingsModel):
+    root_name: str = SettingsField("", title="Root name")
+    max_workers: int = SettingsField(1, ge=1, title="Max workers")
+
+
+_file_hash_algorithm_enum = [
+    {"value": "", "label": "Source (name, mtime and size)"},
+    {"value": "blake2b", "label": "BLAKE2b"},
+    {"value": "sha256", "label": "SHA-256"},
+    {"value": "md5", "label": "MD5"},
+    {"value": "xxh3_64", "label": "XXH3 64 (requires xxhash)"},
+]
+
+
+class IntegrateAssetModel(BaseSettingsModel):
+    _isGroup = True
+    transfer_max_workers: int = SettingsField(
+        1,
+        ge=1,
+        title="Transfer workers",
+        description="Number of files transferred at the same time."
+    )
+    root_transfer_max_workers: list[RootTransferMaxWorkersModel] = (
+        SettingsField(
+            default_factory=list,
+            title="Transfer workers per root",
+            description=(
+                "Limit number of concurrent transfers to a root."
+            )
+        )
+    )
+    file_hash_algorithm: str = SettingsField(
+        "",
+        title="File hash",
+        description=(
+            "Content hash of published files calculated during transfer."
+        ),
+        enum_resolver=lambda: _file_hash_algorithm_enum
+    )
+
+
 class IntegrateHeroVersionModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
     optional: bool = SettingsField(False, title="Optional")
     active: bool = SettingsField(True, title="Active")
     families: list[str] = SettingsField(default_factory=list, title="Families")
+    transfer_max_workers: int = SettingsField(
+        1,
+        ge=1,
+        title="Transfer workers",
+        description="Number of files transferred at the same time."
+    )
 
 
 class CleanUpModel(BaseSettingsModel):
@@ -828,6 +875,10 @@ class PublishPuginsModel(BaseSettingsModel):
         default_factory=IntegrateProductGroupModel,
         title="Integrate Product Group"
     )
+    IntegrateAsset: IntegrateAssetModel = SettingsField(
+        default_factory=IntegrateAssetModel,
+        title="Integrate Asset"
+    )
     IntegrateHeroVersion: IntegrateHeroVersionModel = SettingsField(
         default_factory=IntegrateHeroVersionModel,
         title="Integrate Hero Version"
@@ -1120,10 +1171,16 @@ DEFAULT_PUBLISH_VALUES = {
             }
         ]
     },
+    "IntegrateAsset": {
+        "transfer_max_workers": 1,
+        "root_transfer_max_workers": [],
+        "file_hash_algorithm": ""
+    },
     "IntegrateHeroVersion": {
         "enabled": True,
         "optional": True,
         "active": True,
+        "transfer_max_workers": 1,
         "families": [
             "model",
             "rig",
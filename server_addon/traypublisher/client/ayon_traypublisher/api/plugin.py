@@ -28,6 +28,8 @@ SHARED_DATA_KEY = "ayon.traypublisher.instances"
 class HiddenTrayPublishCreator(HiddenCreator):
     host_name = "traypublisher"
     settings_category = "traypublisher"
+    # Instances are read from tray publisher file, which is thread safe
+    collect_instances_in_thread = True
 
     def collect_instances(self):
         instances_by_identifier = cache_and_get_instances(
@@ -65,6 +67,8 @@ class TrayPublishCreator(Creator):
     create_allow_context_change = True
     host_name = "traypublisher"
     settings_category = "traypublisher"
+    # Instances are read from tray publisher file, which is thread safe
+    collect_instances_in_thread = True
 
     def collect_instances(self):
         instances_by_identifier = cache_and_get_instances(
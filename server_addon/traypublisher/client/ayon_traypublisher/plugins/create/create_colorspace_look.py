@@ -27,6 +27,8 @@ class CreateColorspaceLook(TrayPublishCreator):
     description = "Publishes color space look file."
     extensions = [".cc", ".cube", ".3dl", ".spi1d", ".spi3d", ".csp", ".lut"]
     enabled = False
+    # Collection accesses instances of create context
+    collect_instances_in_thread = False
 
     colorspace_items = [
         (None, "Not set")
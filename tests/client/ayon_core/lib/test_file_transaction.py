@@ -0,0 +1,130 @@
+import os
+import hashlib
+import threading
+
+import pytest
+
+from ayon_core.lib.file_transaction import FileTransaction
+
+
+def _create_sources(dirpath, count):
+    paths = []
+    for idx in range(count):
+        path = os.path.join(dirpath, "src", "file_{}.bin".format(idx))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as stream:
+            stream.write(os.urandom(1024 + idx))
+        paths.append(path)
+    return paths
+
+
+def _read(path):
+    with open(path, "rb") as stream:
+        return stream.read()
+
+
+def test_concurrent_transfers_copy_all_files(tmp_path):
+    sources = _create_sources(str(tmp_path), 20)
+    progress = []
+
+    def _progress_callback(src, dst, done, total):
+        progress.append((done, total))
+
+    transaction = FileTransaction(max_workers=4, hash_algorithm="sha1")
+    expected = {}
+    for src in sources:
+        dst = os.path.join(str(tmp_path), "dst", os.path.basename(src))
+        transaction.add(src, dst)
+        expected[dst] = src
+
+    transaction.process(progress_callback=_progress_callback)
+    transaction.finalize()
+
+    assert sorted(transaction.transferred) == sorted(expected)
+    for dst, src in expected.items():
+        content = _read(src)
+        assert _read(dst) == content
+        file_info = transaction.get_transferred_file_info(dst)
+        assert file_info["size"] == len(content)
+        assert file_info["hash"] == hashlib.sha1(content).hexdigest()
+        assert file_info["hash_type"] == "sha1"
+
+    assert sorted(done for done, _ in progress) == list(range(1, 21))
+    assert {total for _, total in progress} == {20}
+
+
+def test_concurrent_transfers_respect_root_limit(tmp_path):
+    sources = _create_sources(str(tmp_path), 12)
+    root = os.path.join(str(tmp_path), "limited")
+    transaction = FileTransaction(
+        max_workers=6, root_max_workers={root: 2}
+    )
+    for src in sources:
+        transaction.add(src, os.path.join(root, os.path.basename(src)))
+
+    lock = threading.Lock()
+    running = []
+    max_running = []
+    transfer_file = transaction._transfer_file
+
+    def _transfer_file(src, dst, opts, semaphore=None):
+        if semaphore is not None:
+            with semaphore:
+                _transfer_file(src, dst, opts)
+            return
+        with lock:
+            running.append(dst)
+            max_running.append(len(running))
+        try:
+            transfer_file(src, dst, opts)
+        finally:
+            with lock:
+                running.remove(dst)
+
+    transaction._transfer_file = _transfer_file
+    transaction.process()
+    transaction.finalize()
+
+    assert len(transaction.transferred) == len(sources)
+    assert max(max_running) <= 2
+
+
+def test_concurrent_transfers_rollback_on_failure(tmp_path):
+    sources = _create_sources(str(tmp_path), 8)
+    dst_dir = os.path.join(str(tmp_path), "dst")
+    existing_dst = os.path.join(dst_dir, os.path.basename(sources[0]))
+    os.makedirs(dst_dir)
+    with open(existing_dst, "wb") as stream:
+        stream.write(b"original")
+
+    transaction = FileTransaction(max_workers=4)
+    for src in sources:
+        transaction.add(src, os.path.join(dst_dir, os.path.basename(src)))
+    transaction.add(
+        os.path.join(str(tmp_path), "missing.bin"),
+        os.path.join(dst_dir, "missing.bin"),
+    )
+
+    with pytest.raises(OSError):
+        transaction.process()
+    transaction.rollback()
+
+    assert os.listdir(dst_dir) == [os.path.basename(existing_dst)]
+    assert _read(existing_dst) == b"original"
+
+
+def test_hardlinks_reuse_hash_of_source(tmp_path):
+    src = _create_sources(str(tmp_path), 1)[0]
+    transaction = FileTransaction(hash_algorithm="sha1")
+    destinations = [
+        os.path.join(str(tmp_path), "dst", "link_{}.bin".format(idx))
+        for idx in range(3)
+    ]
+    for dst in destinations:
+        transaction.add(src, dst, mode=FileTransaction.MODE_HARDLINK)
+    transaction.process()
+    transaction.finalize()
+
+    expected_hash = hashlib.sha1(_read(src)).hexdigest()
+    for dst in destinations:
+        assert transaction.manifest[dst]["hash"] == expected_hash
@@ -0,0 +1,66 @@
+import pytest
+
+from ayon_core.lib.path_templates import (
+    StringTemplate,
+    TemplateUnsolved,
+)
+
+
+def test_format_sequence_strict_matches_format():
+    template = StringTemplate(
+        "/{root[work]}/{folder[name]}/{product}<_{variant}>.{frame:0>4}.exr"
+    )
+    data = {
+        "root": {"work": "projects"},
+        "folder": {"name": "sh010"},
+        "product": "renderMain",
+    }
+    frames = [1, 2, 1001, 10000]
+
+    results = template.format_sequence_strict(data, "frame", frames)
+
+    assert len(results) == len(frames)
+    for frame, result in zip(frames, results):
+        expected = template.format_strict(dict(data, frame=frame))
+        assert result == expected
+        assert result.used_values == expected.used_values
+        assert result.solved
+
+
+def test_format_sequence_strict_fills_repeated_key():
+    template = StringTemplate("/{frame}/name.{frame:0>3}.{frame:0>5}")
+
+    results = template.format_sequence_strict({}, "frame", [10, 255])
+
+    assert results == ["/10/name.010.00010", "/255/name.255.00255"]
+
+
+def test_format_sequence_strict_missing_key():
+    template = StringTemplate("/{folder}/name.{frame:0>4}.exr")
+
+    with pytest.raises(TemplateUnsolved):
+        template.format_sequence_strict({}, "frame", [1, 2])
+
+
+def test_format_sequence_strict_invalid_value():
+    template = StringTemplate("/name.{frame:0>4}.exr")
+
+    results = template.format_sequence({}, "frame", [1, None])
+    assert results[0] == "/name.0001.exr"
+    assert not results[1].solved
+    assert results[1].invalid_types == {"frame": type(None)}
+
+    with pytest.raises(TemplateUnsolved):
+        template.format_sequence_strict({}, "frame", [1, None])
+
+
+def test_parsed_parts_use_template_class():
+    class CustomTemplate(StringTemplate):
+        @staticmethod
+        def find_optional_parts(parts):
+            # Optional parts are not supported
+            return list(parts)
+
+    data = {"name": "a"}
+    assert StringTemplate("x<_{name}>").format(data) == "x_a"
+    assert CustomTemplate("x<_{name}>").format(data) == "x<_a>"
@@ -0,0 +1,130 @@
+import json
+
+import pytest
+import pyblish.api
+
+from ayon_core.lib.attribute_definitions import BoolDef, NumberDef
+from ayon_core.pipeline.create import (
+    CreatedInstance,
+    serialize_instances_for_remote,
+    deserialize_instances_on_remote,
+    get_known_instance_hashes,
+)
+
+
+class ValidateExample(pyblish.api.InstancePlugin):
+    @classmethod
+    def get_attribute_defs(cls):
+        return [BoolDef("enabled", default=True)]
+
+    @classmethod
+    def convert_attribute_values(cls, attribute_values):
+        return attribute_values
+
+
+def _create_instance(idx):
+    instance = CreatedInstance(
+        "render",
+        "renderMain{}".format(idx),
+        {
+            "folderPath": "/shots/sh010",
+            "task": "comp",
+            "variant": "Main{}".format(idx),
+            "creator_attributes": {"frames": idx},
+        },
+        creator_identifier="io.example.render",
+        creator_label="Render",
+        group_label="Renders",
+        creator_attr_defs=[NumberDef("frames", default=1)],
+    )
+    instance.set_publish_plugins([ValidateExample])
+    instance.mark_as_stored()
+    return instance
+
+
+def _send(payload):
+    # Payload must survive JSON transport
+    return json.loads(json.dumps(payload))
+
+
+def test_remote_payload_round_trip():
+    instances = [_create_instance(idx) for idx in range(3)]
+
+    payload = _send(serialize_instances_for_remote(instances))
+    # Same attribute definitions are sent only once
+    assert len(payload["attr_defs"]) == 2
+
+    instances_by_id, hashes = deserialize_instances_on_remote(payload)
+    assert list(instances_by_id) == [instance.id for instance in instances]
+    for instance in instances:
+        remote_instance = instances_by_id[instance.id]
+        assert remote_instance.data_to_store() == instance.data_to_store()
+        assert remote_instance.creator_label == "Render"
+        assert remote_instance.group_label == "Renders"
+        assert remote_instance.creator_attributes["frames"] == (
+            instance.creator_attributes["frames"]
+        )
+        assert remote_instance.publish_attributes[
+            "ValidateExample"
+        ]["enabled"] is True
+        assert not remote_instance.has_changes()
+
+
+def test_remote_payload_sends_only_changed_instances():
+    instances = [_create_instance(idx) for idx in range(3)]
+    instances_by_id, hashes = deserialize_instances_on_remote(
+        _send(serialize_instances_for_remote(instances))
+    )
+
+    instances[1]["variant"] = "Changed"
+    payload = _send(serialize_instances_for_remote(
+        instances, get_known_instance_hashes(instances_by_id, hashes)
+    ))
+    assert payload["instances"][0] == instances[0].id
+    assert payload["instances"][2] == instances[2].id
+    assert isinstance(payload["instances"][1], list)
+
+    new_instances_by_id, _ = deserialize_instances_on_remote(
+        payload, instances_by_id, hashes
+    )
+    assert (
+        new_instances_by_id[instances[0].id]
+        is instances_by_id[instances[0].id]
+    )
+    assert new_instances_by_id[instances[1].id]["variant"] == "Changed"
+
+
+def test_remote_instance_with_local_changes_is_sent_again():
+    instances = [_create_instance(idx) for idx in range(2)]
+    instances_by_id, hashes = deserialize_instances_on_remote(
+        _send(serialize_instances_for_remote(instances))
+    )
+    local_instance = instances_by_id[instances[0].id]
+    local_instance["variant"] = "Local"
+
+    known_hashes = get_known_instance_hashes(instances_by_id, hashes)
+    assert set(known_hashes) == {instances[1].id}
+
+    new_instances_by_id, _ = deserialize_instances_on_remote(
+        _send(serialize_instances_for_remote(instances, known_hashes)),
+        instances_by_id,
+        hashes,
+    )
+    new_instance = new_instances_by_id[instances[0].id]
+    assert new_instance is not local_instance
+    assert new_instance["variant"] == "Main0"
+
+
+def test_remote_payload_unknown_instance():
+    instances = [_create_instance(0)]
+    instances_by_id, hashes = deserialize_instances_on_remote(
+        _send(serialize_instances_for_remote(instances))
+    )
+    payload = _send(serialize_instances_for_remote(instances, hashes))
+
+    with pytest.raises(ValueError):
+        deserialize_instances_on_remote(payload)
+
+    payload["version"] = -1
+    with pytest.raises(ValueError):
+        deserialize_instances_on_remote(payload, instances_by_id, hashes)
@@ -0,0 +1,116 @@
+import time
+import threading
+
+import pytest
+
+from ayon_core.tools.common_models.fetch import (
+    BackgroundFetcher,
+    FetchCancelledError,
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+)
+
+TIMEOUT = 5
+
+
+def test_identical_requests_share_future():
+    fetcher = BackgroundFetcher(max_workers=2)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def _fetch(value):
+        calls.append(value)
+        started.set()
+        release.wait(TIMEOUT)
+        return value * 2
+
+    future = fetcher.submit("key", _fetch, 2)
+    assert started.wait(TIMEOUT)
+    same_future = fetcher.submit("key", _fetch, 2)
+    release.set()
+
+    assert same_future is future
+    assert future.result(TIMEOUT) == 4
+    assert calls == [2]
+
+
+def test_burst_of_requests_uses_all_workers():
+    fetcher = BackgroundFetcher(max_workers=4)
+    barrier = threading.Barrier(4, timeout=TIMEOUT)
+
+    def _fetch(value):
+        # Passes only if 4 requests run at the same time
+        barrier.wait()
+        return value
+
+    # Idle worker is waiting for requests
+    fetcher.submit("warmup", len, []).result(TIMEOUT)
+    time.sleep(0.1)
+
+    futures = [fetcher.submit(idx, _fetch, idx) for idx in range(4)]
+
+    assert [future.result(TIMEOUT) for future in futures] == [0, 1, 2, 3]
+
+
+def test_requests_are_processed_by_priority():
+    fetcher = BackgroundFetcher(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def _block():
+        started.set()
+        release.wait(TIMEOUT)
+
+    fetcher.submit("block", _block)
+    assert started.wait(TIMEOUT)
+    futures = [
+        fetcher.submit("low", order.append, "low", priority=PRIORITY_LOW),
+        fetcher.submit("high", order.append, "high", priority=PRIORITY_HIGH),
+    ]
+    release.set()
+    for future in futures:
+        future.result(TIMEOUT)
+
+    assert order == ["high", "low"]
+
+
+def test_cancel_group_cancels_queued_requests():
+    fetcher = BackgroundFetcher(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+    callback_futures = []
+
+    def _block():
+        started.set()
+        release.wait(TIMEOUT)
+
+    fetcher.submit("block", _block)
+    assert started.wait(TIMEOUT)
+    cancelled = fetcher.submit("cancelled", len, [], group="selection")
+    shared = fetcher.submit("shared", len, [1], group="selection")
+    fetcher.submit("shared", len, [1], group="other")
+    cancelled.add_done_callback(callback_futures.append)
+
+    fetcher.cancel_group("selection")
+    release.set()
+
+    assert cancelled.cancelled()
+    assert callback_futures == [cancelled]
+    with pytest.raises(FetchCancelledError):
+        cancelled.result(TIMEOUT)
+    # Request used by other group is not cancelled
+    assert shared.result(TIMEOUT) == 1
+
+
+def test_exception_is_raised_from_result():
+    fetcher = BackgroundFetcher(max_workers=1)
+
+    def _fail():
+        raise ValueError("Failed")
+
+    future = fetcher.submit(None, _fail)
+    with pytest.raises(ValueError):
+        future.result(TIMEOUT)
+    assert isinstance(future.exception(), ValueError)
@@ -0,0 +1,100 @@
+import logging
+
+from ayon_core.tools.publisher.log_store import (
+    PublishLogStore,
+    SpilledLogsReader,
+)
+
+
+class _Instance:
+    def __init__(self, instance_id):
+        self.id = instance_id
+
+
+def _create_record(msg, level=logging.INFO):
+    return logging.LogRecord("test", level, __file__, 1, msg, None, None)
+
+
+def _add_records(log_store, plugin_id, instance_id, messages):
+    instance = None
+    if instance_id is not None:
+        instance = _Instance(instance_id)
+    log_store.add_result(plugin_id, {
+        "instance": instance,
+        "records": [_create_record(msg) for msg in messages],
+        "error": None,
+    })
+
+
+def test_keeps_last_records_per_plugin_and_instance():
+    log_store = PublishLogStore(max_logs_per_plugin=2)
+    _add_records(log_store, "plugin", "a", ["a0", "a1", "a2"])
+    for idx in range(4):
+        _add_records(log_store, "plugin", "b", ["b{}".format(idx)])
+    _add_records(log_store, "plugin", None, ["context"])
+
+    log_items = log_store.get_log_items("plugin")
+    messages = {
+        instance_id: [log_item["msg"] for log_item in instance_items]
+        for instance_id, instance_items in log_items.items()
+    }
+
+    # Verbose instance does not push out records of other instances
+    assert messages == {
+        "a": ["a1", "a2"],
+        "b": ["b2", "b3"],
+        None: ["context"],
+    }
+    assert log_store.get_spilled_count("plugin", "a") == 1
+    assert log_store.get_spilled_count("plugin", "b") == 2
+    assert log_store.get_spilled_count("plugin", None) == 0
+    log_store.reset()
+
+
+def test_spilled_records_are_readable():
+    log_store = PublishLogStore(max_logs_per_plugin=1)
+    _add_records(log_store, "plugin", "a", ["a0", "a1", "a2"])
+    log_store.flush()
+
+    reader = SpilledLogsReader(log_store.spill_filepath)
+    assert reader.get_count("plugin", "a") == 2
+    assert [
+        log_item["msg"]
+        for log_item in reader.get_log_items("plugin", "a")
+    ] == ["a0", "a1"]
+    assert [
+        log_item["msg"]
+        for log_item in reader.get_log_items("plugin", "a", limit=1)
+    ] == ["a1"]
+    log_store.reset()
+
+
+def test_spilled_records_over_limit_are_dropped():
+    log_store = PublishLogStore(max_logs_per_plugin=1, max_spilled_logs=2)
+    _add_records(
+        log_store, "plugin", "a", ["a{}".format(idx) for idx in range(5)]
+    )
+
+    assert log_store.get_spilled_count("plugin", "a") == 2
+    assert log_store.dropped_count == 2
+    log_store.reset()
+
+
+def test_error_is_kept_in_memory():
+    log_store = PublishLogStore(max_logs_per_plugin=1)
+    error = ValueError("Failed")
+    # Pyblish adds traceback information to errors of results
+    error.traceback = (__file__, 1, "process", "Failed")
+    error.formatted_traceback = "Traceback: Failed"
+    log_store.add_result("plugin", {
+        "instance": _Instance("a"),
+        "records": [_create_record("a0"), _create_record("a1")],
+        "error": error,
+    })
+
+    log_items = log_store.get_log_items("plugin")["a"]
+    assert [log_item["type"] for log_item in log_items] == [
+        "record", "error"
+    ]
+    assert log_items[1]["msg"] == "Failed"
+    log_store.reset()
@@ -0,0 +1,105 @@
+import os
+import json
+
+import pytest
+
+# Report viewer package imports Qt widgets
+try:
+    import qtpy  # noqa: F401
+except ImportError:
+    pytest.skip("Qt bindings are not available", allow_module_level=True)
+
+from ayon_core.tools.publisher.publish_report_viewer import (  # noqa: E402
+    report_file,
+)
+
+IndexedReportFile = report_file.IndexedReportFile
+is_indexed_report_file = report_file.is_indexed_report_file
+write_indexed_report = report_file.write_indexed_report
+
+
+def _create_report_data():
+    plugins_data = []
+    for plugin_idx in range(3):
+        instances_data = []
+        for instance_id in ("a", "b"):
+            logs = [
+                {
+                    "type": "record",
+                    "msg": "{} {} {}".format(plugin_idx, instance_id, idx),
+                }
+                for idx in range(5)
+            ]
+            if plugin_idx == 1 and instance_id == "b":
+                logs.append({"type": "error", "msg": "Failed"})
+            instances_data.append({"id": instance_id, "logs": logs})
+        instances_data.append({"id": None, "logs": []})
+        plugins_data.append({
+            "id": "plugin_{}".format(plugin_idx),
+            "instances_data": instances_data,
+        })
+    return {
+        "id": "report",
+        "label": "Report",
+        "plugins_data": plugins_data,
+    }
+
+
+def test_indexed_report_header_and_logs(tmp_path):
+    report_data = _create_report_data()
+    filepath = os.path.join(str(tmp_path), "report")
+    write_indexed_report(report_data, filepath)
+
+    assert is_indexed_report_file(filepath)
+
+    indexed_file = IndexedReportFile(filepath)
+    header = indexed_file.header
+    assert header["label"] == "Report"
+    for plugin_data, src_plugin_data in zip(
+        header["plugins_data"], report_data["plugins_data"]
+    ):
+        for instance_data, src_instance_data in zip(
+            plugin_data["instances_data"], src_plugin_data["instances_data"]
+        ):
+            # Logs are not part of header
+            assert "logs" not in instance_data
+            assert instance_data["errored"] == any(
+                log_item["type"] == "error"
+                for log_item in src_instance_data["logs"]
+            )
+            assert (
+                indexed_file.read_logs(instance_data["logs_chunk"])
+                == src_instance_data["logs"]
+            )
+    indexed_file.close()
+
+
+def test_indexed_report_save_keeps_logs(tmp_path):
+    report_data = _create_report_data()
+    filepath = os.path.join(str(tmp_path), "report")
+    write_indexed_report(report_data, filepath)
+
+    indexed_file = IndexedReportFile(filepath)
+    header = indexed_file.header
+    header["label"] = "Renamed"
+    # Logs are read before save to make sure mapped file is replaced
+    instance_data = header["plugins_data"][1]["instances_data"][1]
+    logs = indexed_file.read_logs(instance_data["logs_chunk"])
+    indexed_file.save(filepath, header)
+
+    saved_file = IndexedReportFile(filepath)
+    saved_instance_data = saved_file.header["plugins_data"][1][
+        "instances_data"
+    ][1]
+    assert saved_file.header["label"] == "Renamed"
+    assert saved_file.read_logs(saved_instance_data["logs_chunk"]) == logs
+    saved_file.close()
+    indexed_file.close()
+
+
+def test_json_report_is_not_indexed(tmp_path):
+    filepath = os.path.join(str(tmp_path), "report.json")
+    with open(filepath, "w") as stream:
+        json.dump(_create_report_data(), stream)
+
+    assert not is_indexed_report_file(filepath)
@@ -0,0 +1,10 @@
+import os
+import sys
+
+# Client code is not installed as package, make 'ayon_core' importable
+CLIENT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "client"
+)
+if CLIENT_DIR not in sys.path:
+    sys.path.insert(0, CLIENT_DIR)